@@ -17,7 +17,7 @@ Example (Simple API):
     ...     fluid_density=1000,
     ...     fluid_viscosity=0.001
     ... )
-    >>> print(f"Pressure drop: {result['pressure_drop']:.2f} Pa")
+    >>> print(f"Pressure drop: {result.pressure_drop:.2f} Pa")
 
 Example (Traditional API):
     >>> import engivault
@@ -29,49 +29,140 @@ Example (Traditional API):
     >>> result = client.hydraulics.pressure_drop(...)
 """
 
-from .client import EngiVaultClient, create_client
-
-# Import convenience functions for simplified API
-from .shortcuts import (
-    init,
-    get_client,
-    pressure_drop,
-    flow_rate,
-    pump_power,
-    npsh,
-    lmtd,
-    heat_exchanger,
-    open_channel_flow,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+# Exceptions are dependency-free and imported eagerly so they can be caught
+# without triggering any other import.
 from .exceptions import (
-    EngiVaultError,
-    AuthenticationError,
-    ValidationError,
-    RateLimitError,
     APIError,
-    NetworkError,
+    AuthenticationError,
     ConfigurationError,
+    EngiVaultError,
+    NetworkError,
+    RateLimitError,
+    SDKValidationError,
+    ValidationError,
 )
-from .models import (
-    PressureDropInput,
-    PressureDropResult,
-    FlowRateInput,
-    FlowRateResult,
-    PumpPerformanceInput,
-    PumpPerformanceResult,
-    NPSHInput,
-    NPSHResult,
-    UsageStats,
-    HeatExchangerInput,
-    HeatExchangerResult,
-    LMTDInput,
-    LMTDResult,
-    EffectivenessNTUInput,
-    EffectivenessNTUResult,
+
+if TYPE_CHECKING:
+    from .client import EngiVaultClient, create_client
+    from .async_client import AsyncEngiVaultClient
+    from .shortcuts import (
+        init,
+        get_client,
+        clear_cache,
+        pressure_drop,
+        batch_pressure_drop,
+        pressure_drop_batch,
+        pressure_drop_many,
+        pressure_drop_stream,
+        flow_rate,
+        pump_power,
+        npsh,
+        lmtd,
+        heat_exchanger,
+        open_channel_flow,
+        pool,
+    )
+    from .models import (
+        PressureDropInput,
+        PressureDropResult,
+        FlowRateInput,
+        FlowRateResult,
+        PumpPerformanceInput,
+        PumpPerformanceResult,
+        NPSHInput,
+        NPSHResult,
+        UsageStats,
+        HeatExchangerInput,
+        HeatExchangerResult,
+        LMTDInput,
+        LMTDResult,
+        EffectivenessNTUInput,
+        EffectivenessNTUResult,
+    )
+    
+    EngiVault = EngiVaultClient
+
+# Everything else is loaded on first attribute access (PEP 562), so that
+# ``import engivault`` does not pay for requests, httpx and pydantic up front.
+_LAZY: Dict[str, Tuple[str, str]] = {
+    # Main client class alias for convenience
+    "EngiVault": (".client", "EngiVaultClient"),
+    "EngiVaultClient": (".client", "EngiVaultClient"),
+    "create_client": (".client", "create_client"),
+    "AsyncEngiVaultClient": (".async_client", "AsyncEngiVaultClient"),
+    
+    # Simplified API
+    "init": (".shortcuts", "init"),
+    "get_client": (".shortcuts", "get_client"),
+    "clear_cache": (".shortcuts", "clear_cache"),
+    "pressure_drop": (".shortcuts", "pressure_drop"),
+    "batch_pressure_drop": (".shortcuts", "batch_pressure_drop"),
+    "pressure_drop_batch": (".shortcuts", "pressure_drop_batch"),
+    "pressure_drop_many": (".shortcuts", "pressure_drop_many"),
+    "pressure_drop_stream": (".shortcuts", "pressure_drop_stream"),
+    "flow_rate": (".shortcuts", "flow_rate"),
+    "pump_power": (".shortcuts", "pump_power"),
+    "npsh": (".shortcuts", "npsh"),
+    "lmtd": (".shortcuts", "lmtd"),
+    "heat_exchanger": (".shortcuts", "heat_exchanger"),
+    "open_channel_flow": (".shortcuts", "open_channel_flow"),
+    "pool": (".shortcuts", "pool"),
+}
+
+# Models re-exported at package level
+_MODELS = (
+    "PressureDropInput",
+    "PressureDropResult",
+    "FlowRateInput",
+    "FlowRateResult",
+    "PumpPerformanceInput",
+    "PumpPerformanceResult",
+    "NPSHInput",
+    "NPSHResult",
+    "UsageStats",
+    "HeatExchangerInput",
+    "HeatExchangerResult",
+    "LMTDInput",
+    "LMTDResult",
+    "EffectivenessNTUInput",
+    "EffectivenessNTUResult",
 )
+_LAZY.update((name, (".models", name)) for name in _MODELS)
+
+_SUBMODULES = frozenset({
+    "analytics",
+    "async_client",
+    "cli",
+    "client",
+    "curves",
+    "equipment_sizing",
+    "fluid_mechanics",
+    "heat_transfer",
+    "hydraulics",
+    "models",
+    "pumps",
+    "shortcuts",
+})
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY:
+        module_name, attr = _LAZY[name]
+        value = getattr(importlib.import_module(module_name, __name__), attr)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY))
 
-# Main client class alias for convenience
-EngiVault = EngiVaultClient
 
 # Version info
 __version__ = "1.0.0"
@@ -83,23 +174,31 @@ __all__ = [
     # Main client
     "EngiVault",
     "EngiVaultClient", 
+    "AsyncEngiVaultClient",
     "create_client",
     
     # Simplified API
     "init",
     "get_client",
+    "clear_cache",
     "pressure_drop",
+    "batch_pressure_drop",
+    "pressure_drop_batch",
+    "pressure_drop_many",
+    "pressure_drop_stream",
     "flow_rate",
     "pump_power",
     "npsh",
     "lmtd",
     "heat_exchanger",
     "open_channel_flow",
+    "pool",
     
     # Exceptions
     "EngiVaultError",
     "AuthenticationError",
     "ValidationError", 
+    "SDKValidationError",
     "RateLimitError",
     "APIError",
     "NetworkError",
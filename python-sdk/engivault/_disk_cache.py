@@ -0,0 +1,59 @@
+"""
+Persistent result cache.
+
+Keeps memoized calculation results in a SQLite file so repeated runs of a
+script reuse them instead of calling the API again (see
+``EngiVaultClient(persistent_cache=...)``).
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from ._json import dumps, loads
+
+# Location of the cache file when persistent_cache=True
+DEFAULT_CACHE_PATH = os.path.join("~", ".engivault", "cache.sqlite3")
+
+# Seconds a persisted result stays valid
+DEFAULT_CACHE_TTL = 86400.0
+
+
+class DiskCache:
+    """Thread-safe store of JSON results with expiry, backed by SQLite."""
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttl: float = DEFAULT_CACHE_TTL):
+        path = os.path.expanduser(path)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS results "
+            "(key BLOB PRIMARY KEY, value BLOB NOT NULL, expiry REAL NOT NULL)"
+        )
+
+    def get(self, key: bytes) -> Optional[Dict[str, Any]]:
+        """Return the unexpired result stored under ``key``, if any."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value, expiry FROM results WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or row[1] < time.time():
+            return None
+        return loads(row[0])
+
+    def set(self, key: bytes, value: Dict[str, Any]) -> None:
+        """Store ``value`` under ``key`` for ``ttl`` seconds."""
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?)",
+                (key, dumps(value), time.time() + self.ttl),
+            )
+
+    def clear(self) -> None:
+        """Delete every stored result."""
+        with self._lock:
+            self._db.execute("DELETE FROM results")
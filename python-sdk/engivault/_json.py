@@ -0,0 +1,99 @@
+"""
+JSON encoding helpers.
+
+Uses the fastest JSON library available: orjson (``pip install
+engivault[fast]``), then ujson, then the standard library. NumPy scalars
+and arrays are encoded as plain numbers and lists by all three.
+"""
+
+import json
+import sys
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+if orjson is None:
+    try:
+        import ujson
+    except ImportError:  # pragma: no cover - exercised only without ujson
+        ujson = None
+else:
+    ujson = None
+
+JSONDecodeError = json.JSONDecodeError
+
+
+def _default(obj: Any) -> Any:
+    """Encode NumPy values, which the JSON libraries do not know natively."""
+    np = sys.modules.get("numpy")
+    if np is not None:
+        if isinstance(obj, np.generic):
+            return obj.item()
+        if isinstance(obj, np.ndarray):
+            return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize ``obj`` to compact JSON bytes."""
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_SERIALIZE_NUMPY)
+
+    def dumps_pretty(obj: Any) -> str:
+        """Serialize ``obj`` to indented JSON text."""
+        return orjson.dumps(
+            obj, default=_default, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        ).decode()
+
+    def dumps_canonical(obj: Any) -> bytes:
+        """Serialize ``obj`` to compact JSON bytes with sorted keys."""
+        return orjson.dumps(
+            obj, default=_default, option=orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+
+    loads = orjson.loads
+
+elif ujson is not None:  # pragma: no cover - exercised only with ujson alone
+    # ujson raises its own ValueError subclass on malformed input
+    JSONDecodeError = getattr(ujson, "JSONDecodeError", ValueError)
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize ``obj`` to compact JSON bytes."""
+        return ujson.dumps(
+            obj, ensure_ascii=False, escape_forward_slashes=False, default=_default
+        ).encode()
+
+    def dumps_pretty(obj: Any) -> str:
+        """Serialize ``obj`` to indented JSON text."""
+        return ujson.dumps(
+            obj, indent=2, ensure_ascii=False, escape_forward_slashes=False, default=_default
+        )
+
+    def dumps_canonical(obj: Any) -> bytes:
+        """Serialize ``obj`` to compact JSON bytes with sorted keys."""
+        return ujson.dumps(
+            obj, sort_keys=True, ensure_ascii=False, escape_forward_slashes=False,
+            default=_default,
+        ).encode()
+
+    loads = ujson.loads
+
+else:
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize ``obj`` to compact JSON bytes."""
+        return json.dumps(obj, separators=(",", ":"), default=_default).encode()
+
+    def dumps_pretty(obj: Any) -> str:
+        """Serialize ``obj`` to indented JSON text."""
+        return json.dumps(obj, indent=2, default=_default)
+
+    def dumps_canonical(obj: Any) -> bytes:
+        """Serialize ``obj`` to compact JSON bytes with sorted keys."""
+        return json.dumps(obj, separators=(",", ":"), sort_keys=True, default=_default).encode()
+
+    loads = json.loads
@@ -0,0 +1,28 @@
+"""
+Shared input checks for the calculation modules.
+"""
+
+from .exceptions import SDKValidationError
+
+# Display names that plain snake_case-to-words conversion gets wrong
+_LABELS = {
+    "npsh_available": "NPSH available",
+}
+
+
+def require_positive(**values: float) -> None:
+    """
+    Raise SDKValidationError for the first value that is not positive.
+
+    Keyword names become the error message subject, e.g. ``flow_rate=-1``
+    raises "Flow rate must be positive". Non-numeric values (including
+    ``None``) are rejected the same way.
+    """
+    for name, value in values.items():
+        try:
+            positive = value > 0
+        except TypeError:
+            positive = False
+        if not positive:
+            label = _LABELS.get(name) or name.replace("_", " ").capitalize()
+            raise SDKValidationError(f"{label} must be positive")
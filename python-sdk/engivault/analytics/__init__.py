@@ -12,6 +12,13 @@ from ..exceptions import SDKValidationError
 if TYPE_CHECKING:
     from ..client import EngiVaultClient
 
+# Usage figures change slowly, so analytics responses are cached longer than
+# the client default.
+ANALYTICS_CACHE_TTL = 60.0
+
+# Accepted values for the ``days`` window of usage_stats
+_VALID_DAYS = range(1, 366)
+
 
 class AnalyticsModule:
     """Analytics and usage statistics module."""
@@ -36,7 +43,7 @@ class AnalyticsModule:
         """
         params = {}
         if days is not None:
-            if days < 1 or days > 365:
+            if days not in _VALID_DAYS:
                 raise SDKValidationError("Days must be between 1 and 365")
             params["days"] = days
         
@@ -45,6 +52,7 @@ class AnalyticsModule:
             method="GET",
             endpoint="/analytics/usage",
             params=params,
+            cache_ttl=ANALYTICS_CACHE_TTL,
         )
         
         # Parse and return result
@@ -65,6 +73,7 @@ class AnalyticsModule:
         return self.client._make_request(
             method="GET",
             endpoint="/analytics/api-keys",
+            cache_ttl=ANALYTICS_CACHE_TTL,
         )
     
     def subscription_limits(self) -> dict:
@@ -82,4 +91,5 @@ class AnalyticsModule:
         return self.client._make_request(
             method="GET",
             endpoint="/analytics/limits",
+            cache_ttl=ANALYTICS_CACHE_TTL,
         )
@@ -0,0 +1,156 @@
+"""
+EngiVault Async SDK Client
+
+Asynchronous client for issuing many EngiVault API calls concurrently.
+"""
+
+from typing import Any, Dict, Optional
+
+import httpx
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+except ImportError:  # pragma: no cover - exercised only without h2
+    HAVE_HTTP2 = False
+else:
+    HAVE_HTTP2 = True
+
+from .client import _encode_body, _join_url, _parse_response
+from .exceptions import ConfigurationError, NetworkError
+
+
+class AsyncEngiVaultClient:
+    """
+    Async EngiVault API client.
+
+    Holds a single pooled, keep-alive connection so that independent
+    requests can run concurrently with asyncio.gather.
+
+    Args:
+        api_key: Your EngiVault API key
+        jwt_token: JWT token (alternative to API key)
+        base_url: API base URL (default: production)
+        timeout: Request timeout in seconds (default: 30)
+        max_connections: Maximum number of concurrent connections (default: 64)
+        http2: Negotiate HTTP/2 so concurrent requests share one connection
+            (default: enabled when ``h2`` is installed)
+
+    Example:
+        >>> async with AsyncEngiVaultClient(api_key="your-api-key") as client:
+        ...     health = await client.health_check()
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        jwt_token: Optional[str] = None,
+        base_url: str = "https://engivault-api-production.up.railway.app",
+        timeout: int = 30,
+        max_connections: int = 64,
+        http2: Optional[bool] = None,
+    ):
+        if not api_key and not jwt_token:
+            raise ConfigurationError("Either api_key or jwt_token must be provided")
+
+        self.api_key = api_key
+        self.jwt_token = jwt_token
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        
+        # Absolute URLs by endpoint path, filled on first use
+        self._urls: Dict[str, str] = {}
+
+        headers = {
+            "Content-Type": "application/json",
+            "User-Agent": "EngiVault-Python-SDK/1.0.0",
+        }
+        if jwt_token:
+            headers["Authorization"] = f"Bearer {jwt_token}"
+        elif api_key:
+            headers["X-API-Key"] = api_key
+
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=75,
+        )
+        self.session = httpx.AsyncClient(
+            headers=headers,
+            timeout=timeout,
+            transport=httpx.AsyncHTTPTransport(
+                retries=3,
+                limits=limits,
+                http2=HAVE_HTTP2 if http2 is None else http2,
+            ),
+        )
+
+    async def __aenter__(self) -> "AsyncEngiVaultClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self.session.aclose()
+
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Make an HTTP request to the API.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path
+            data: Request body data
+            params: Query parameters
+
+        Returns:
+            Parsed JSON response
+
+        Raises:
+            NetworkError: If request fails
+            AuthenticationError: If authentication fails
+            RateLimitError: If rate limit exceeded
+            APIError: If API returns an error
+        """
+        url = self._urls.get(endpoint)
+        if url is None:
+            url = self._urls[endpoint] = _join_url(self.base_url, endpoint)
+
+        body, headers = _encode_body(data)
+        try:
+            response = await self.session.request(
+                method=method,
+                url=url,
+                content=body,
+                params=params,
+                headers=headers,
+            )
+        except httpx.HTTPError as e:
+            raise NetworkError(f"Network request failed: {str(e)}")
+
+        return _parse_response(response)
+
+    async def health_check(self) -> Dict[str, Any]:
+        """
+        Check API health status.
+
+        Returns:
+            Health status information
+        """
+        return await self._make_request("GET", "/health")
+
+    async def get_info(self) -> Dict[str, Any]:
+        """
+        Get API information.
+
+        Returns:
+            API status and version information
+        """
+        return await self._make_request("GET", "/")
@@ -1,18 +1,47 @@
 """
 EngiVault CLI - Command line interface for EngiVault calculations
 """
-import json
+import asyncio
 import sys
-from typing import Dict, Any, Optional
+from typing import Any, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 import click
-from rich.console import Console
-from rich.table import Table
-from rich import print as rprint
 
+from ._json import dumps, dumps_pretty, loads
 from .client import EngiVaultClient
 from .exceptions import EngiVaultError
 
-console = Console()
+# Default number of batch calculations kept in flight
+BATCH_CONCURRENCY = 64
+
+
+def rprint(*args: Any, **kwargs: Any) -> None:
+    """Print with rich markup; rich is only imported when output is produced."""
+    from rich import print as rich_print
+    rich_print(*args, **kwargs)
+
+
+def emit_table(ctx: click.Context, title: str, rows: List[Tuple[str, str, str]]) -> None:
+    """
+    Print (property, value, unit) rows.
+    
+    Uses a rich table on an interactive terminal; otherwise writes aligned
+    plain text so piped output never loads or runs rich's renderer.
+    """
+    if ctx.obj['format'] == 'table' and sys.stdout.isatty():
+        from rich.console import Console
+        from rich.table import Table
+        
+        table = Table(title=title)
+        table.add_column("Property", style="cyan")
+        table.add_column("Value", style="green")
+        table.add_column("Unit", style="yellow")
+        for row in rows:
+            table.add_row(*row)
+        Console().print(table)
+    else:
+        lines = [title]
+        lines.extend(f"{prop:<20} {value:>12} {unit}".rstrip() for prop, value, unit in rows)
+        click.echo("\n".join(lines))
 
 
 @click.group()
@@ -20,8 +49,8 @@ console = Console()
 @click.option('--base-url', envvar='ENGIVAULT_BASE_URL', 
               default='https://engivault-api.railway.app',
               help='EngiVault API base URL')
-@click.option('--format', 'output_format', type=click.Choice(['json', 'table']), 
-              default='table', help='Output format')
+@click.option('--format', 'output_format', type=click.Choice(['json', 'table', 'plain']), 
+              default='table', help='Output format (table falls back to plain when not a TTY)')
 @click.pass_context
 def main(ctx: click.Context, api_key: Optional[str], base_url: str, output_format: str):
     """EngiVault CLI - Engineering calculations from the command line"""
@@ -36,21 +65,17 @@ def health(ctx: click.Context):
     """Check API health status"""
     try:
         client = ctx.obj['client']
-        result = client.health()
+        result = client.health_check()
         
         if ctx.obj['format'] == 'json':
-            click.echo(json.dumps(result, indent=2))
+            click.echo(dumps_pretty(result))
         else:
-            table = Table(title="EngiVault API Health")
-            table.add_column("Property", style="cyan")
-            table.add_column("Value", style="green")
-            
-            table.add_row("Status", result['status'])
-            table.add_row("Version", result['version'])
-            table.add_row("Uptime", f"{result['uptime']:.2f}s")
-            table.add_row("Memory RSS", f"{result['memory']['rss'] / 1024 / 1024:.1f} MB")
-            
-            console.print(table)
+            emit_table(ctx, "EngiVault API Health", [
+                ("Status", str(result['status']), ""),
+                ("Version", str(result['version']), ""),
+                ("Uptime", f"{result['uptime']:.2f}", "s"),
+                ("Memory RSS", f"{result['memory']['rss'] / 1024 / 1024:.1f}", "MB"),
+            ])
             
     except EngiVaultError as e:
         rprint(f"[red]Error: {e.message}[/red]")
@@ -85,21 +110,16 @@ def open_channel_flow(ctx: click.Context, flow_rate: float, width: float,
         )
         
         if ctx.obj['format'] == 'json':
-            click.echo(json.dumps(result, indent=2))
+            click.echo(dumps_pretty(result.model_dump()))
         else:
-            table = Table(title="Open Channel Flow Results")
-            table.add_column("Property", style="cyan")
-            table.add_column("Value", style="green")
-            table.add_column("Unit", style="yellow")
-            
-            table.add_row("Normal Depth", f"{result['normal_depth']:.4f}", "m")
-            table.add_row("Critical Depth", f"{result['critical_depth']:.4f}", "m")
-            table.add_row("Velocity", f"{result['velocity']:.3f}", "m/s")
-            table.add_row("Froude Number", f"{result['froude_number']:.3f}", "-")
-            table.add_row("Flow Regime", result['flow_regime'], "-")
-            table.add_row("Hydraulic Radius", f"{result['hydraulic_radius']:.4f}", "m")
-            
-            console.print(table)
+            emit_table(ctx, "Open Channel Flow Results", [
+                ("Normal Depth", f"{result.normal_depth:.4f}", "m"),
+                ("Critical Depth", f"{result.critical_depth:.4f}", "m"),
+                ("Velocity", f"{result.velocity:.3f}", "m/s"),
+                ("Froude Number", f"{result.froude_number:.3f}", "-"),
+                ("Flow Regime", result.flow_regime, "-"),
+                ("Hydraulic Radius", f"{result.hydraulic_radius:.4f}", "m"),
+            ])
             
     except EngiVaultError as e:
         rprint(f"[red]Error: {e.message}[/red]")
@@ -134,16 +154,11 @@ def lmtd(ctx: click.Context, hot_in: float, hot_out: float,
         )
         
         if ctx.obj['format'] == 'json':
-            click.echo(json.dumps(result, indent=2))
+            click.echo(dumps_pretty({'lmtd': result}))
         else:
-            table = Table(title="LMTD Calculation Results")
-            table.add_column("Property", style="cyan")
-            table.add_column("Value", style="green")
-            table.add_column("Unit", style="yellow")
-            
-            table.add_row("LMTD", f"{result['lmtd']:.2f}", "K")
-            
-            console.print(table)
+            emit_table(ctx, "LMTD Calculation Results", [
+                ("LMTD", f"{result:.2f}", "K"),
+            ])
             
     except EngiVaultError as e:
         rprint(f"[red]Error: {e.message}[/red]")
@@ -151,52 +166,134 @@ def lmtd(ctx: click.Context, hot_in: float, hot_out: float,
 
 
 @main.command()
-@click.option('--input-file', type=click.File('r'), help='JSON input file')
+@click.option('--input-file', type=click.File('rb'), help='JSON input file')
 @click.option('--output-file', type=click.File('w'), help='Output file')
+@click.option('--concurrency', type=int, default=BATCH_CONCURRENCY, show_default=True,
+              help='Maximum calculations in flight at once')
 @click.pass_context
-def batch(ctx: click.Context, input_file, output_file):
+def batch(ctx: click.Context, input_file, output_file, concurrency: int):
     """Run batch calculations from JSON input file"""
     if not input_file:
-        rprint("[red]Error: --input-file is required for batch processing[/red]")
+        rprint("[red]Error: --input-file is required for batch processing[/red]", file=sys.stderr)
         sys.exit(1)
     
+    client = ctx.obj['client']
+    out = output_file or click.get_text_stream('stdout')
+    writer = _ResultWriter(out)
+    
+    # Results are written as they complete, framed as {"results": [...]}.
+    # The array is closed even when a calculation fails, so the output stays
+    # valid JSON holding the results completed so far; errors go to stderr.
     try:
-        data = json.load(input_file)
-        client = ctx.obj['client']
-        results = []
+        out.write('{"results": [')
+        try:
+            _run_async(_run_batch(
+                client, _iter_calculations(input_file), writer, max(concurrency, 1)
+            ))
+        finally:
+            out.write('\n]}\n' if writer.count else ']}\n')
+            out.flush()
         
-        for calculation in data.get('calculations', []):
+        if output_file:
+            rprint(f"[green]Results written to {output_file.name}[/green]")
+            
+    except EngiVaultError as e:
+        rprint(f"[red]Error: {e.message}[/red]", file=sys.stderr)
+        sys.exit(1)
+    except Exception as e:
+        rprint(f"[red]Error: {str(e)}[/red]", file=sys.stderr)
+        sys.exit(1)
+
+
+def _run_async(coro: Awaitable[Any]) -> Any:
+    """Run a coroutine to completion, on uvloop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    return uvloop.run(coro)
+
+
+def _iter_calculations(input_file) -> Iterator[Dict[str, Any]]:
+    """Yield calculations from a batch file, streaming it when ijson is available."""
+    try:
+        import ijson
+    except ImportError:
+        yield from loads(input_file.read()).get('calculations', [])
+        return
+    yield from ijson.items(input_file, 'calculations.item', use_float=True)
+
+
+class _ResultWriter:
+    """Write batch results as comma-separated JSON array items."""
+    
+    __slots__ = ('stream', 'count')
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self.count = 0
+    
+    def __call__(self, item: Dict[str, Any]) -> None:
+        self.stream.write(('\n' if self.count == 0 else ',\n') + dumps(item).decode())
+        self.count += 1
+
+
+async def _run_batch(
+    client: EngiVaultClient,
+    calculations: Iterable[Dict[str, Any]],
+    emit: Callable[[Dict[str, Any]], None],
+    concurrency: int = BATCH_CONCURRENCY,
+) -> int:
+    """
+    Run batch calculations concurrently, emitting results in completion order.
+    
+    At most ``concurrency`` calculations are in flight, so memory stays bounded
+    regardless of batch size. The first failure cancels outstanding work.
+    """
+    pending: Dict["asyncio.Future[Any]", Tuple[str, Dict[str, Any]]] = {}
+    emitted = 0
+    
+    async def drain(return_when: str) -> None:
+        nonlocal emitted
+        done, _ = await asyncio.wait(pending, return_when=return_when)
+        for task in done:
+            calc_type, params = pending.pop(task)
+            result = task.result()
+            if hasattr(result, 'model_dump'):
+                result = result.model_dump()
+            emit({
+                'type': calc_type,
+                'parameters': params,
+                'result': result
+            })
+            emitted += 1
+    
+    try:
+        for calculation in calculations:
             calc_type = calculation.get('type')
             params = calculation.get('parameters', {})
             
             if calc_type == 'open_channel_flow':
-                result = client.fluid_mechanics.open_channel_flow(**params)
+                coro = client.fluid_mechanics.aopen_channel_flow(**params)
             elif calc_type == 'lmtd':
-                result = client.heat_transfer.lmtd(**params)
+                coro = client.heat_transfer.almtd(**params)
             else:
-                rprint(f"[yellow]Warning: Unknown calculation type: {calc_type}[/yellow]")
+                rprint(f"[yellow]Warning: Unknown calculation type: {calc_type}[/yellow]",
+                       file=sys.stderr)
                 continue
-                
-            results.append({
-                'type': calc_type,
-                'parameters': params,
-                'result': result
-            })
-        
-        output_data = {'results': results}
-        
-        if output_file:
-            json.dump(output_data, output_file, indent=2)
-            rprint(f"[green]Results written to {output_file.name}[/green]")
-        else:
-            click.echo(json.dumps(output_data, indent=2))
             
-    except EngiVaultError as e:
-        rprint(f"[red]Error: {e.message}[/red]")
-        sys.exit(1)
-    except Exception as e:
-        rprint(f"[red]Error: {str(e)}[/red]")
-        sys.exit(1)
+            pending[asyncio.ensure_future(coro)] = (calc_type, params)
+            if len(pending) >= concurrency:
+                await drain(asyncio.FIRST_COMPLETED)
+        
+        while pending:
+            await drain(asyncio.FIRST_COMPLETED)
+    finally:
+        for task in pending:
+            task.cancel()
+        await client.aclose()
+    
+    return emitted
 
 
 if __name__ == '__main__':
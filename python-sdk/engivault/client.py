@@ -4,23 +4,83 @@ EngiVault SDK Client
 Main client class for interacting with the EngiVault API.
 """
 
-import json
+import asyncio
+import gzip
+import threading
 import time
-from typing import Any, Dict, Optional
-from urllib.parse import urljoin
+from contextvars import ContextVar
+from functools import cached_property
+from types import SimpleNamespace
+from typing import (
+    TYPE_CHECKING, Any, Awaitable, Coroutine, Dict, Generator, Iterable, List, Optional, Tuple,
+    TypeVar, Union,
+)
 
 import requests
 from pydantic import ValidationError
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 
+from ._disk_cache import DEFAULT_CACHE_PATH, DiskCache
+from ._json import JSONDecodeError, dumps, dumps_canonical, loads
 from .exceptions import (
     APIError,
     AuthenticationError,
     ConfigurationError,
+    EngiVaultError,
     NetworkError,
     RateLimitError,
     ValidationError as SDKValidationError,
 )
 from .models import APIResponse
+from . import __version__
+
+if TYPE_CHECKING:
+    from .analytics import AnalyticsModule
+    from .async_client import AsyncEngiVaultClient
+    from .equipment_sizing import EquipmentSizing
+    from .fluid_mechanics import FluidMechanicsModule
+    from .heat_transfer import HeatTransferModule
+    from .hydraulics import HydraulicsModule
+    from .pumps import PumpsModule
+
+
+_T = TypeVar("_T")
+
+# Default time-to-live for cached GET responses, in seconds
+DEFAULT_GET_CACHE_TTL = 5.0
+
+# API information does not change while a client is alive, so it is cached
+# until clear_cache() is called
+INFO_CACHE_TTL = float("inf")
+
+# Maximum number of distinct GET responses kept per client
+GET_CACHE_MAXSIZE = 128
+
+# Maximum number of distinct memoized calculation results kept per client
+# (see _make_request_cached)
+RESULT_CACHE_MAXSIZE = 1024
+
+# Connection pool sizing for the sync session: number of per-host pools kept,
+# and keep-alive connections held per host (enough for threaded fan-out)
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 64
+
+# Request bodies of at least this many bytes are sent gzip-compressed;
+# single calculations stay well below it, columnar batches far above
+COMPRESS_MIN_BYTES = 1024
+
+# Default number of concurrent requests issued by batch calls
+BATCH_CONCURRENCY = 64
+
+# Endpoint that runs several calculations in one request, and the most
+# calculations it accepts at once (see send_batch)
+BATCH_ENDPOINT = "/api/v1/batch"
+MAX_BATCH_REQUESTS = 50
+
+# Set while send_batch drives calls: async requests are queued, not sent
+_batching: ContextVar[bool] = ContextVar("engivault_batching", default=False)
 
 
 class EngiVaultClient:
@@ -31,6 +91,12 @@ class EngiVaultClient:
         api_key: Your EngiVault API key
         base_url: Base URL for the API (default: production)
         timeout: Request timeout in seconds (default: 30)
+        persistent_cache: Also keep memoized results (``cache=True`` calls)
+            in a SQLite file for a day, so they are reused across runs.
+            ``True`` uses ``~/.engivault/cache.sqlite3``; a string is taken
+            as the file path.
+        warmup: Open a pooled connection in the background with a health
+            check, so the first calculation skips the TCP/TLS handshake
         
     Example:
         >>> client = EngiVaultClient("your-api-key")
@@ -49,6 +115,8 @@ class EngiVaultClient:
         jwt_token: Optional[str] = None,
         base_url: str = "https://engivault-api-production.up.railway.app",
         timeout: int = 30,
+        persistent_cache: Union[bool, str] = False,
+        warmup: bool = False,
     ):
         if not api_key and not jwt_token:
             raise ConfigurationError("Either api_key or jwt_token must be provided")
@@ -58,31 +126,87 @@ class EngiVaultClient:
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         
-        # Initialize session
+        # Initialize session with a pooled, keep-alive transport. Calculation
+        # endpoints are pure functions of their inputs, so POST is safe to retry.
         self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset(["GET", "POST"]),
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        
+        # Prepared POST templates by URL: (request, environment settings,
+        # session settings they were built from; see _send_post)
+        self._prepared: Dict[str, Tuple[requests.PreparedRequest, Dict[str, Any], Tuple[Any, ...]]] = {}
         self._setup_auth()
         
-        # Initialize modules
+        # Absolute URLs by endpoint path, filled on first use
+        self._urls: Dict[str, str] = {}
+        
+        # GET response cache: key -> (etag, data, expiry). Also read by the
+        # warm-up and worker threads, so guarded by a lock.
+        self._get_cache: Dict[Tuple[Any, ...], Tuple[Optional[str], Dict[str, Any], float]] = {}
+        self._get_cache_lock = threading.Lock()
+        
+        # Memoized calculation results: (endpoint, canonical body) -> encoded data.
+        # Shared across threads, so guarded by a lock.
+        self._result_cache: Dict[Tuple[str, bytes], bytes] = {}
+        self._result_cache_lock = threading.Lock()
+        
+        # Results shared with other processes and runs, keyed by SDK version
+        # and API URL as well so upgrades and other servers miss
+        self._disk_cache: Optional[DiskCache] = None
+        if persistent_cache:
+            self._disk_cache = DiskCache(
+                DEFAULT_CACHE_PATH if persistent_cache is True else persistent_cache
+            )
+        
+        # Async transport is created on first use (see _amake_request)
+        self._async_client: Optional["AsyncEngiVaultClient"] = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        if warmup:
+            self.warm_up()
+    
+    # Calculation modules are imported and built on first access
+    
+    @cached_property
+    def hydraulics(self) -> "HydraulicsModule":
         from .hydraulics import HydraulicsModule
+        return HydraulicsModule(self)
+    
+    @cached_property
+    def pumps(self) -> "PumpsModule":
         from .pumps import PumpsModule
+        return PumpsModule(self)
+    
+    @cached_property
+    def analytics(self) -> "AnalyticsModule":
         from .analytics import AnalyticsModule
+        return AnalyticsModule(self)
+    
+    @cached_property
+    def heat_transfer(self) -> "HeatTransferModule":
         from .heat_transfer import HeatTransferModule
+        return HeatTransferModule(self)
+    
+    @cached_property
+    def fluid_mechanics(self) -> "FluidMechanicsModule":
         from .fluid_mechanics import FluidMechanicsModule
-        from .equipment_sizing import PumpSizing, HeatExchangerSizing, VesselSizing, PipingSizing
-        
-        self.hydraulics = HydraulicsModule(self)
-        self.pumps = PumpsModule(self)
-        self.analytics = AnalyticsModule(self)
-        self.heat_transfer = HeatTransferModule(self)
-        self.fluid_mechanics = FluidMechanicsModule(self)
-        
-        # Equipment sizing modules
-        self.equipment_sizing = type('EquipmentSizing', (), {
-            'pump_sizing': PumpSizing(self),
-            'heat_exchanger_sizing': HeatExchangerSizing(self),
-            'vessel_sizing': VesselSizing(self),
-            'piping_sizing': PipingSizing(self)
-        })()
+        return FluidMechanicsModule(self)
+    
+    @cached_property
+    def equipment_sizing(self) -> "EquipmentSizing":
+        from .equipment_sizing import EquipmentSizing
+        return EquipmentSizing(self)
     
     def _setup_auth(self) -> None:
         """Set up authentication headers."""
@@ -97,7 +221,11 @@ class EngiVaultClient:
         
         self.session.headers.update({
             "Content-Type": "application/json",
-            "User-Agent": "EngiVault-Python-SDK/1.0.0"
+            "User-Agent": "EngiVault-Python-SDK/1.0.0",
+            "Connection": "keep-alive",
+            # Every codec urllib3 can decode here: gzip/deflate, plus br and
+            # zstd when brotli and zstandard are installed
+            "Accept-Encoding": ACCEPT_ENCODING,
         })
     
     def _make_request(
@@ -106,15 +234,21 @@ class EngiVaultClient:
         endpoint: str,
         data: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
+        cache_ttl: float = DEFAULT_GET_CACHE_TTL,
     ) -> Dict[str, Any]:
         """
         Make an HTTP request to the API.
         
+        GET responses are cached for ``cache_ttl`` seconds. Once an entry
+        expires it is revalidated with ``If-None-Match`` when the server
+        supplied an ETag, so an unchanged resource costs no response body.
+        
         Args:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint path
             data: Request body data
             params: Query parameters
+            cache_ttl: Seconds to cache GET responses (0 disables caching)
             
         Returns:
             Parsed JSON response
@@ -125,67 +259,617 @@ class EngiVaultClient:
             RateLimitError: If rate limit exceeded
             APIError: If API returns an error
         """
-        url = urljoin(self.base_url, endpoint)
+        url = self._urls.get(endpoint)
+        if url is None:
+            url = self._urls[endpoint] = _join_url(self.base_url, endpoint)
+        
+        cache_key = None
+        cached = None
+        headers = None
+        if method == "GET" and cache_ttl > 0:
+            cache_key = (endpoint, tuple(sorted(params.items())) if params else ())
+            with self._get_cache_lock:
+                cached = self._get_cache.get(cache_key)
+            if cached is not None:
+                etag, cached_data, expiry = cached
+                if time.monotonic() < expiry:
+                    return cached_data
+                if etag:
+                    headers = {"If-None-Match": etag}
+        
+        response = self._send(method, url, data, params, headers)
+        
+        if cached is not None and response.status_code == 304:
+            result = cached[1]
+        else:
+            result = _parse_response(response)
+        
+        if cache_key is not None:
+            etag = response.headers.get("ETag")
+            entry = (etag if isinstance(etag, str) else None, result, time.monotonic() + cache_ttl)
+            with self._get_cache_lock:
+                self._get_cache.pop(cache_key, None)
+                if len(self._get_cache) >= GET_CACHE_MAXSIZE:
+                    del self._get_cache[next(iter(self._get_cache))]
+                self._get_cache[cache_key] = entry
         
+        return result
+    
+    def _make_request_validated(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> APIResponse:
+        """
+        Make an uncached HTTP request and validate the full response envelope.
+        
+        :meth:`_make_request` only checks the envelope fields it reads. Use
+        this variant when the whole envelope should be checked against
+        :class:`~engivault.models.APIResponse`.
+        
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path
+            data: Request body data
+            params: Query parameters
+            
+        Returns:
+            Validated API response envelope
+        """
+        url = self._urls.get(endpoint)
+        if url is None:
+            url = self._urls[endpoint] = _join_url(self.base_url, endpoint)
+        return _validate_response(self._send(method, url, data, params))
+    
+    def _send(
+        self,
+        method: str,
+        url: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> requests.Response:
+        """Send a request, mapping transport failures to NetworkError."""
         try:
-            response = self.session.request(
+            if method == "POST" and params is None:
+                return self._send_post(url, data)
+            body, encoding = _encode_body(data)
+            if encoding is not None:
+                headers = {**(headers or {}), **encoding}
+            return self.session.request(
                 method=method,
                 url=url,
-                json=data,
+                data=body,
                 params=params,
+                headers=headers,
                 timeout=self.timeout,
             )
         except requests.exceptions.RequestException as e:
             raise NetworkError(f"Network request failed: {str(e)}")
+    
+    def _send_post(
+        self,
+        url: str,
+        data: Optional[Dict[str, Any]],
+    ) -> requests.Response:
+        """
+        Send a POST from a per-URL prepared template.
+        
+        Header merging, URL normalization and environment lookups (proxies,
+        CA bundle) are done once per endpoint and reused while the session's
+        headers, auth, params, proxies, verify, cert and trust_env are
+        unchanged; changing any of them rebuilds the template on the next
+        call. Each call copies the template, attaches the session's current
+        cookies and the encoded body. Proxy and CA bundle environment
+        variables are read when the template is built.
+        """
+        session = self.session
+        state = (
+            tuple(session.headers.items()), session.auth, tuple(session.params.items()),
+            tuple(session.proxies.items()), session.verify, session.cert, session.trust_env,
+        )
+        template = self._prepared.get(url)
+        if template is None or template[2] != state:
+            prepared = session.prepare_request(requests.Request("POST", url))
+            if "Cookie" not in session.headers:
+                # Cookies can change with every response, so they are
+                # attached per call instead
+                prepared.headers.pop("Cookie", None)
+            settings = session.merge_environment_settings(url, {}, None, None, None)
+            template = self._prepared[url] = (prepared, settings, state)
+        
+        prepared, settings, _ = template
+        request = prepared.copy()
+        if session.cookies:
+            request.prepare_cookies(session.cookies)
+        body, encoding = _encode_body(data)
+        request.prepare_body(body, None)
+        if encoding is not None:
+            request.headers.update(encoding)
+        return self.session.send(request, timeout=self.timeout, **settings)
+    
+    def _make_request_cached(
+        self,
+        endpoint: str,
+        data: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """
+        POST ``data`` to ``endpoint``, memoizing the result by request body.
+        
+        Only for calculation endpoints, whose results depend on nothing but
+        the request body. Bodies are keyed by their sorted-key JSON encoding,
+        so argument order does not matter. The least recently used of more
+        than ``RESULT_CACHE_MAXSIZE`` results is dropped; :meth:`clear_cache`
+        drops them all. Misses are looked up in the persistent cache, when
+        enabled, before a request is sent. Results are kept encoded and
+        decoded afresh on every hit, so callers may modify what they get.
+        
+        Args:
+            endpoint: API endpoint path
+            data: Request body data
+            
+        Returns:
+            Parsed JSON response
+        """
+        key = (endpoint, dumps_canonical(data))
+        with self._result_cache_lock:
+            encoded = self._result_cache.pop(key, None)
+            if encoded is not None:
+                self._result_cache[key] = encoded
+        if encoded is not None:
+            return loads(encoded)
+        
+        result = None
+        if self._disk_cache is not None:
+            disk_key = b" ".join((
+                __version__.encode(), (self.base_url + endpoint).encode(), key[1]
+            ))
+            result = self._disk_cache.get(disk_key)
+        if result is None:
+            result = self._make_request("POST", endpoint, data=data)
+            if self._disk_cache is not None:
+                self._disk_cache.set(disk_key, result)
+        
+        encoded = dumps(result)
+        with self._result_cache_lock:
+            self._result_cache[key] = encoded
+            if len(self._result_cache) > RESULT_CACHE_MAXSIZE:
+                del self._result_cache[next(iter(self._result_cache))]
+        return result
+    
+    def clear_cache(self) -> None:
+        """Discard all cached GET responses and memoized results, including persisted ones."""
+        with self._get_cache_lock:
+            self._get_cache.clear()
+        with self._result_cache_lock:
+            self._result_cache.clear()
+        if self._disk_cache is not None:
+            self._disk_cache.clear()
+    
+    async def _amake_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Make an HTTP request to the API without blocking the event loop.
+        
+        Requests share one pooled async connection per event loop, so
+        independent calculations can be issued concurrently with
+        asyncio.gather.
+        
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path
+            data: Request body data
+            params: Query parameters
+            
+        Returns:
+            Parsed JSON response
+        """
+        if _batching.get():
+            if method != "POST":
+                raise ConfigurationError("Only calculation (POST) calls can be batched")
+            return await _QueuedRequest(endpoint, data or {})
+        
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            from .async_client import AsyncEngiVaultClient
+            
+            self._async_client = AsyncEngiVaultClient(
+                api_key=self.api_key,
+                jwt_token=self.jwt_token,
+                base_url=self.base_url,
+                timeout=self.timeout,
+            )
+            self._async_loop = loop
+        
+        return await self._async_client._make_request(
+            method, endpoint, data=data, params=params
+        )
+    
+    async def abatch(
+        self,
+        endpoint: str,
+        rows: Any,
+        concurrency: int = BATCH_CONCURRENCY,
+    ) -> List[Dict[str, Any]]:
+        """
+        POST one request per row to ``endpoint`` concurrently.
+        
+        Args:
+            endpoint: API endpoint path
+            rows: Request bodies as a list of dicts, a pandas DataFrame, or a
+                NumPy structured array (field names become request keys)
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            Response data for each row, in input order
+        """
+        records = _rows_to_records(rows)
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def post(record: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._amake_request("POST", endpoint, data=record)
+        
+        return list(await asyncio.gather(*(post(record) for record in records)))
+    
+    def batch(
+        self,
+        endpoint: str,
+        rows: Any,
+        concurrency: int = BATCH_CONCURRENCY,
+    ) -> List[Dict[str, Any]]:
+        """
+        Blocking version of :meth:`abatch`.
+        
+        Runs its own event loop, so it cannot be called from async code;
+        use ``await client.abatch(...)`` there instead.
+        
+        Example:
+            >>> rows = [
+            ...     {"flowRate": q, "pipeDiameter": 0.1, "pipeLength": 100,
+            ...      "fluidDensity": 1000, "fluidViscosity": 0.001}
+            ...     for q in (0.01, 0.02, 0.03)
+            ... ]
+            >>> results = client.batch("/api/v1/hydraulics/pressure-drop", rows)
+        """
+        return self._run_blocking(self.abatch(endpoint, rows, concurrency))
+    
+    def gather(self, *calls: Awaitable[Any], return_exceptions: bool = False) -> List[Any]:
+        """
+        Run async calculations concurrently and wait for all of them.
+        
+        Lets blocking code issue several independent ``a``-prefixed calls at
+        once, so they cost about one round trip instead of one each. Runs its
+        own event loop, so it cannot be called from async code; use
+        ``asyncio.gather`` there instead.
+        
+        Args:
+            *calls: Un-awaited coroutines, e.g. ``client.fluid_mechanics.aboundary_layer(...)``
+            return_exceptions: Return a failed call's exception in its place
+                instead of raising it, so one failure does not hide the
+                other results
+            
+        Returns:
+            Results of each call, in argument order
+            
+        Example:
+            >>> channel, layer = client.gather(
+            ...     client.fluid_mechanics.aopen_channel_flow(5.0, 3.0, 0.001, 0.03),
+            ...     client.fluid_mechanics.aboundary_layer(10, 0.5, fluid_props),
+            ... )
+        """
+        _require_no_running_loop(calls, "await asyncio.gather(...)")
+        
+        async def gather_all() -> List[Any]:
+            return list(await asyncio.gather(*calls, return_exceptions=return_exceptions))
         
-        # Handle HTTP status codes
-        if response.status_code == 401:
-            raise AuthenticationError("Invalid API key or JWT token")
-        elif response.status_code == 429:
-            raise RateLimitError("Rate limit exceeded")
-        elif response.status_code >= 400:
+        return self._run_blocking(gather_all())
+    
+    def send_batch(
+        self,
+        *calls: Coroutine[Any, Any, Any],
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """
+        Run several calculations in a single request to the batch endpoint.
+        
+        Takes the same un-awaited ``a``-prefixed calls as :meth:`gather`, but
+        instead of sending one request each, their bodies are collected and
+        posted together, so N calculations cost one round trip and one
+        request. Results are parsed exactly as if each call had been awaited.
+        Up to ``MAX_BATCH_REQUESTS`` calls go in each request.
+        
+        Args:
+            *calls: Un-awaited coroutines, e.g. ``client.fluid_mechanics.anormal_shock(2.0)``
+            return_exceptions: Return a failed call's exception in its place
+                instead of raising it
+            
+        Returns:
+            Results of each call, in argument order
+            
+        Example:
+            >>> channel, shock = client.send_batch(
+            ...     client.fluid_mechanics.aopen_channel_flow(5.0, 3.0, 0.001, 0.03),
+            ...     client.fluid_mechanics.anormal_shock(2.0),
+            ... )
+        """
+        results: List[Any] = [None] * len(calls)
+        queued: List[Tuple[int, _QueuedRequest]] = []
+        
+        def step(index: int, value: Any = None, error: Optional[BaseException] = None) -> None:
+            # Run a call until it queues its next request or finishes
+            call = calls[index]
             try:
-                error_data = response.json()
-                error_message = error_data.get("error", f"HTTP {response.status_code}")
-            except json.JSONDecodeError:
-                error_message = f"HTTP {response.status_code}: {response.text}"
-            raise APIError(error_message, response.status_code)
+                request = call.throw(error) if error is not None else call.send(value)
+            except StopIteration as stop:
+                results[index] = stop.value
+                return
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                results[index] = e
+                return
+            if not isinstance(request, _QueuedRequest):
+                call.close()
+                raise ConfigurationError("Only calculation calls can be batched")
+            queued.append((index, request))
         
-        # Parse response
+        token = _batching.set(True)
         try:
-            response_data = response.json()
-        except json.JSONDecodeError:
-            raise APIError("Invalid JSON response from API")
+            for index in range(len(calls)):
+                step(index)
+            while queued:
+                chunk = queued[:MAX_BATCH_REQUESTS]
+                del queued[:MAX_BATCH_REQUESTS]
+                try:
+                    response_data = self._make_request(
+                        "POST",
+                        BATCH_ENDPOINT,
+                        data={"requests": [
+                            {"path": request.endpoint, "body": request.data} for _, request in chunk
+                        ]},
+                    )
+                except Exception as e:
+                    # The whole request failed, so every call in it did
+                    for index, _ in chunk:
+                        step(index, error=e)
+                    continue
+                responses = response_data["responses"]
+                if len(responses) != len(chunk):
+                    # Calls the server did not answer cannot be matched up
+                    error = APIError(
+                        f"Batch returned {len(responses)} responses for {len(chunk)} requests"
+                    )
+                    for index, _ in chunk:
+                        step(index, error=error)
+                    continue
+                for (index, _), item in zip(chunk, responses):
+                    response = SimpleNamespace(
+                        status_code=item["statusCode"], content=dumps(item["body"]), text=""
+                    )
+                    try:
+                        data = _parse_response(response)
+                    except Exception as e:
+                        step(index, error=e)
+                    else:
+                        step(index, data)
+        finally:
+            _batching.reset(token)
+            for call in calls:
+                call.close()
+        return results
+    
+    def _run_blocking(self, coro: Coroutine[Any, Any, _T]) -> _T:
+        """
+        Run ``coro`` on a fresh event loop, closing the async pool afterwards.
         
-        # Validate response format
-        try:
-            api_response = APIResponse(**response_data)
-        except ValidationError as e:
-            raise APIError(f"Invalid response format: {str(e)}")
+        Raises:
+            ConfigurationError: If an event loop is already running in this
+                thread (async code, Jupyter), where ``coro``'s own method
+                must be awaited instead
+        """
+        _require_no_running_loop((coro,), f"await {coro.__qualname__}(...)")
         
-        # Check for API-level errors
-        if not api_response.success:
-            raise APIError(api_response.error or "Unknown API error")
+        async def run() -> _T:
+            try:
+                return await coro
+            finally:
+                await self.aclose()
         
-        return api_response.data or {}
+        return asyncio.run(run())
+    
+    async def aclose(self) -> None:
+        """Close the async connection pool, if one was opened."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+            self._async_loop = None
     
     def health_check(self) -> Dict[str, Any]:
         """
         Check API health status.
         
+        Repeated polls within ``DEFAULT_GET_CACHE_TTL`` seconds reuse the
+        last response.
+        
         Returns:
             Health status information
         """
-        return self._make_request("GET", "/health")
+        return self._make_request("GET", "/health", cache_ttl=DEFAULT_GET_CACHE_TTL)
+    
+    def warm_up(self) -> None:
+        """
+        Open a pooled connection in the background with a health check.
+        
+        Returns immediately. The first calculation then reuses the open
+        connection instead of paying for the TCP/TLS handshake; a failed
+        check is ignored and surfaces on that call instead.
+        """
+        threading.Thread(target=self._warm_up, daemon=True).start()
+    
+    def _warm_up(self) -> None:
+        try:
+            self.health_check()
+        except EngiVaultError:
+            pass
     
     def get_info(self) -> Dict[str, Any]:
         """
         Get API information.
         
+        The response is fetched once per client and reused until
+        :meth:`clear_cache` is called.
+        
         Returns:
             API status and version information
         """
-        return self._make_request("GET", "/")
+        return self._make_request("GET", "/", cache_ttl=INFO_CACHE_TTL)
+
+
+class _QueuedRequest:
+    """Request body held back by send_batch; awaiting it hands it to the batch."""
+    
+    __slots__ = ("endpoint", "data")
+    
+    def __init__(self, endpoint: str, data: Dict[str, Any]):
+        self.endpoint = endpoint
+        self.data = data
+    
+    def __await__(self) -> Generator["_QueuedRequest", Dict[str, Any], Dict[str, Any]]:
+        return (yield self)
+
+
+def _join_url(base_url: str, endpoint: str) -> str:
+    """Append an endpoint path to a base URL that has no trailing slash."""
+    return base_url + endpoint if endpoint.startswith("/") else f"{base_url}/{endpoint}"
+
+
+def _rows_to_records(rows: Any) -> List[Dict[str, Any]]:
+    """Convert batch rows (dicts, DataFrame or structured array) to dicts."""
+    if hasattr(rows, "to_dict"):
+        return rows.to_dict(orient="records")
+    names = getattr(getattr(rows, "dtype", None), "names", None)
+    if names:
+        return [dict(zip(names, row)) for row in rows.tolist()]
+    return list(rows)
+
+
+def _check_status(response: Any) -> None:
+    """Raise the SDK exception matching an HTTP error status, if any."""
+    if response.status_code == 401:
+        raise AuthenticationError("Invalid API key or JWT token")
+    elif response.status_code == 429:
+        raise RateLimitError("Rate limit exceeded")
+    elif response.status_code >= 400:
+        try:
+            error_data = loads(response.content)
+            error_message = error_data.get("error", f"HTTP {response.status_code}")
+        except JSONDecodeError:
+            error_message = f"HTTP {response.status_code}: {response.text}"
+        raise APIError(error_message, response.status_code)
+
+
+def _require_no_running_loop(calls: Iterable[Awaitable[Any]], instead: str) -> None:
+    """
+    Raise ConfigurationError if an event loop is running in this thread.
+    
+    Coroutines among ``calls`` are closed first, so they do not warn that
+    they were never awaited.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    for call in calls:
+        if asyncio.iscoroutine(call):
+            call.close()
+    raise ConfigurationError(
+        "Blocking batch calls cannot run inside a running event loop "
+        f"(async code or Jupyter); use {instead} instead"
+    )
+
+
+def _encode_body(
+    data: Optional[Dict[str, Any]],
+) -> Tuple[Optional[bytes], Optional[Dict[str, str]]]:
+    """
+    Encode a JSON request body, with the headers it needs beyond the defaults.
+    
+    Bodies of ``COMPRESS_MIN_BYTES`` or more are gzipped at the fastest
+    level, which still shrinks columnar batches about tenfold.
+    """
+    if data is None:
+        return None, None
+    body = dumps(data)
+    if len(body) < COMPRESS_MIN_BYTES:
+        return body, None
+    return gzip.compress(body, compresslevel=1), {"Content-Encoding": "gzip"}
+
+
+def _parse_response(response: Any) -> Dict[str, Any]:
+    """
+    Check an HTTP response and unwrap the API data payload.
+    
+    Works with both requests and httpx responses. Only the envelope fields
+    the SDK reads (``success``, ``error``, ``data``) are checked; see
+    :func:`_validate_response` for full validation.
+    
+    The body is parsed straight from ``response.content`` bytes; going
+    through ``response.text`` or ``response.json()`` would first build a
+    decoded str copy of the whole payload.
+    
+    Raises:
+        AuthenticationError: If authentication fails
+        RateLimitError: If rate limit exceeded
+        APIError: If API returns an error
+    """
+    _check_status(response)
+    
+    try:
+        response_data = loads(response.content)
+    except JSONDecodeError:
+        raise APIError("Invalid JSON response from API")
+    if not isinstance(response_data, dict):
+        raise APIError("Invalid response format: expected a JSON object")
+    
+    # Check for API-level errors
+    if not response_data.get("success", False):
+        raise APIError(response_data.get("error") or "Unknown API error")
+    
+    return response_data.get("data") or {}
+
+
+def _validate_response(response: Any) -> APIResponse:
+    """
+    Check an HTTP response and validate the whole envelope with pydantic.
+    
+    Raises:
+        AuthenticationError: If authentication fails
+        RateLimitError: If rate limit exceeded
+        APIError: If API returns an error or a malformed envelope
+    """
+    _check_status(response)
+    
+    # Parse and validate the response envelope in one pass (no intermediate dict)
+    try:
+        api_response = APIResponse.model_validate_json(response.content)
+    except ValidationError as e:
+        if any(error["type"] == "json_invalid" for error in e.errors()):
+            raise APIError("Invalid JSON response from API")
+        raise APIError(f"Invalid response format: {str(e)}")
+    
+    # Check for API-level errors
+    if not api_response.success:
+        raise APIError(api_response.error or "Unknown API error")
+    
+    return api_response
 
 
 # Convenience function for quick client creation
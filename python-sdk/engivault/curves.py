@@ -0,0 +1,96 @@
+"""
+EngiVault Curve Data
+
+Array-backed containers for curve data such as pump head curves. Points are
+held as parallel float64 arrays rather than one Python object per point, so
+they can be passed straight to the numeric kernels and serialized in one pass.
+
+Requires NumPy (``pip install engivault[numeric]``).
+"""
+
+import sys
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Sequence, Tuple, Union
+
+import numpy as np
+
+from . import _kernels
+from .exceptions import SDKValidationError
+
+CurvePointLike = Union[Mapping[str, float], Sequence[float]]
+
+# dataclass(slots=True) is only available from Python 3.10
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
+class CurveSeries:
+    """
+    Flow/head curve stored as two contiguous float64 arrays.
+
+    Args:
+        q: Flow rates in m³/s
+        h: Heads in meters, one per flow rate
+
+    Example:
+        >>> curve = CurveSeries.from_points([
+        ...     {"q": 0.0, "h": 60.0},
+        ...     {"q": 0.1, "h": 50.0},
+        ...     {"q": 0.2, "h": 22.0},
+        ... ])
+        >>> a, b, c = curve.fit_quadratic()
+    """
+
+    q: np.ndarray
+    h: np.ndarray
+
+    def __post_init__(self) -> None:
+        self.q = _kernels.as_array(self.q)
+        self.h = _kernels.as_array(self.h)
+        if self.q.ndim != 1 or self.q.shape != self.h.shape:
+            raise SDKValidationError("q and h must be 1-D arrays of equal length")
+
+    @classmethod
+    def from_points(cls, points: Iterable[CurvePointLike]) -> "CurveSeries":
+        """
+        Build a series from ``{"q": ..., "h": ...}`` dicts or ``(q, h)`` pairs.
+        """
+        points = list(points)
+        count = len(points)
+        if count and isinstance(points[0], Mapping):
+            q = np.fromiter((p["q"] for p in points), dtype=np.float64, count=count)
+            h = np.fromiter((p["h"] for p in points), dtype=np.float64, count=count)
+        else:
+            q = np.fromiter((p[0] for p in points), dtype=np.float64, count=count)
+            h = np.fromiter((p[1] for p in points), dtype=np.float64, count=count)
+        return cls(q, h)
+
+    def __len__(self) -> int:
+        return self.q.shape[0]
+
+    def to_payload(self) -> List[Dict[str, float]]:
+        """Return the points as a list of ``{"q": ..., "h": ...}`` dicts."""
+        return [{"q": q, "h": h} for q, h in zip(self.q.tolist(), self.h.tolist())]
+
+    def fit_quadratic(self) -> Tuple[float, float, float]:
+        """
+        Least-squares fit of ``h = a + b*q + c*q²``.
+
+        Returns:
+            Coefficients (a, b, c)
+
+        Raises:
+            SDKValidationError: If there are fewer than 3 distinct flow rates,
+                or they are too close together to determine a quadratic
+        """
+        if np.unique(self.q).shape[0] < 3:
+            raise SDKValidationError("At least 3 distinct flow rates are required to fit a curve")
+        a, b, c = _kernels.fit_quadratic(self.q, self.h)
+        if np.isnan(a) and not np.isnan(self.h).any():
+            raise SDKValidationError("Flow rates are too close together to fit a curve")
+        return a, b, c
+
+    def evaluate(self, coefficients: Tuple[float, float, float]) -> np.ndarray:
+        """Evaluate ``h = a + b*q + c*q²`` at this series' flow rates."""
+        a, b, c = coefficients
+        return _kernels.eval_quadratic(a, b, c, self.q)
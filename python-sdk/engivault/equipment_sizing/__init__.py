@@ -15,12 +15,82 @@ References:
 - Chemical Process Equipment: Selection and Design by Couper et al.
 """
 
-from .pump_sizing import PumpSizing
-from .heat_exchanger_sizing import HeatExchangerSizing
-from .vessel_sizing import VesselSizing
-from .piping_sizing import PipingSizing
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .pump_sizing import PumpSizing
+    from .heat_exchanger_sizing import HeatExchangerSizing
+    from .vessel_sizing import VesselSizing
+    from .piping_sizing import PipingSizing
+
+# Sizing classes are imported on first access (PEP 562), so importing one
+# calculator does not load the others.
+_LAZY = {
+    'PumpSizing': '.pump_sizing',
+    'HeatExchangerSizing': '.heat_exchanger_sizing',
+    'VesselSizing': '.vessel_sizing',
+    'PipingSizing': '.piping_sizing',
+}
+
+
+def _load(name: str) -> Any:
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _load(name)
+
+
+class EquipmentSizing:
+    """Container for the equipment sizing calculators of a client."""
+    
+    __slots__ = (
+        'client',
+        '_pump_sizing',
+        '_heat_exchanger_sizing',
+        '_vessel_sizing',
+        '_piping_sizing',
+    )
+    
+    def __init__(self, client):
+        self.client = client
+        self._pump_sizing = None
+        self._heat_exchanger_sizing = None
+        self._vessel_sizing = None
+        self._piping_sizing = None
+    
+    @property
+    def pump_sizing(self) -> "PumpSizing":
+        if self._pump_sizing is None:
+            self._pump_sizing = _load('PumpSizing')(self.client)
+        return self._pump_sizing
+    
+    @property
+    def heat_exchanger_sizing(self) -> "HeatExchangerSizing":
+        if self._heat_exchanger_sizing is None:
+            self._heat_exchanger_sizing = _load('HeatExchangerSizing')(self.client)
+        return self._heat_exchanger_sizing
+    
+    @property
+    def vessel_sizing(self) -> "VesselSizing":
+        if self._vessel_sizing is None:
+            self._vessel_sizing = _load('VesselSizing')(self.client)
+        return self._vessel_sizing
+    
+    @property
+    def piping_sizing(self) -> "PipingSizing":
+        if self._piping_sizing is None:
+            self._piping_sizing = _load('PipingSizing')(self.client)
+        return self._piping_sizing
+
 
 __all__ = [
+    'EquipmentSizing',
     'PumpSizing',
     'HeatExchangerSizing', 
     'VesselSizing',
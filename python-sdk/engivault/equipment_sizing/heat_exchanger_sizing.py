@@ -11,9 +11,25 @@ References:
 - Kern, D.Q.: Process Heat Transfer
 """
 
-from typing import Dict, Any, Optional
-from ..client import EngiVaultClient
+import math
+from typing import Dict, Any, List, Optional
+from ..client import BATCH_CONCURRENCY, EngiVaultClient, _rows_to_records
 from ..exceptions import SDKValidationError
+from .._validation import require_positive
+
+
+def _raise_invalid_duty(
+    heat_duty: float,
+    hot_fluid_inlet: float,
+    hot_fluid_outlet: float,
+    cold_fluid_inlet: float,
+    cold_fluid_outlet: float
+) -> None:
+    """Raise SDKValidationError naming the first invalid duty input."""
+    require_positive(heat_duty=heat_duty)
+    if not hot_fluid_inlet > hot_fluid_outlet:
+        raise SDKValidationError("Hot fluid inlet temperature must be greater than outlet")
+    raise SDKValidationError("Cold fluid outlet temperature must be greater than inlet")
 
 
 class HeatExchangerSizing:
@@ -24,6 +40,13 @@ class HeatExchangerSizing:
     and compact heat exchangers with proper references to industry standards.
     """
     
+    # Design endpoints that all take the same thermal design payload
+    _DESIGN_ENDPOINTS = {
+        "shell_tube": "/api/v1/equipment/heat-exchangers/shell-tube-optimization",
+        "plate": "/api/v1/equipment/heat-exchangers/plate-sizing",
+        "air_cooled": "/api/v1/equipment/heat-exchangers/air-cooled-sizing",
+    }
+    
     def __init__(self, client: EngiVaultClient):
         self.client = client
     
@@ -41,7 +64,8 @@ class HeatExchangerSizing:
         hot_fluid_properties: Dict[str, float],
         cold_fluid_properties: Dict[str, float],
         exchanger_type: Optional[str] = None,
-        flow_arrangement: Optional[str] = None
+        flow_arrangement: Optional[str] = None,
+        cache: bool = False
     ) -> Dict[str, Any]:
         """
         Size a heat exchanger based on thermal requirements.
@@ -60,6 +84,10 @@ class HeatExchangerSizing:
             cold_fluid_properties: Cold fluid properties dict
             exchanger_type: Heat exchanger type ('shell_tube', 'plate', 'air_cooled', 'compact')
             flow_arrangement: Flow arrangement ('counterflow', 'parallel', 'crossflow')
+            cache: Reuse the result of an identical earlier call instead of
+                sending a new request (opt-in; the least recently used results
+                are dropped past ``RESULT_CACHE_MAXSIZE``, all by
+                ``client.clear_cache()``)
             
         Returns:
             Dict with heat exchanger sizing results including references
@@ -91,13 +119,11 @@ class HeatExchangerSizing:
             ...     cold_fluid_properties=cold_props
             ... )
         """
-        # Validate inputs
-        if heat_duty <= 0:
-            raise SDKValidationError("Heat duty must be positive")
-        if hot_fluid_inlet <= hot_fluid_outlet:
-            raise SDKValidationError("Hot fluid inlet temperature must be greater than outlet")
-        if cold_fluid_outlet <= cold_fluid_inlet:
-            raise SDKValidationError("Cold fluid outlet temperature must be greater than inlet")
+        # Validate inputs (one test on the common path; find the culprit only on failure)
+        if not (heat_duty > 0 and hot_fluid_inlet > hot_fluid_outlet
+                and cold_fluid_outlet > cold_fluid_inlet):
+            _raise_invalid_duty(heat_duty, hot_fluid_inlet, hot_fluid_outlet,
+                                cold_fluid_inlet, cold_fluid_outlet)
         
         # Prepare request data
         request_data = {
@@ -114,12 +140,17 @@ class HeatExchangerSizing:
             "coldFluidProperties": cold_fluid_properties
         }
         
-        if exchanger_type is not None:
-            request_data["exchangerType"] = exchanger_type
-        if flow_arrangement is not None:
-            request_data["flowArrangement"] = flow_arrangement
+        optional = (
+            ("exchangerType", exchanger_type),
+            ("flowArrangement", flow_arrangement)
+        )
+        request_data.update({key: value for key, value in optional if value is not None})
         
         # Make API request
+        if cache:
+            return self.client._make_request_cached(
+                "/api/v1/equipment/heat-exchangers/sizing", request_data
+            )
         response_data = self.client._make_request(
             method="POST",
             endpoint="/api/v1/equipment/heat-exchangers/sizing",
@@ -128,6 +159,54 @@ class HeatExchangerSizing:
         
         return response_data
     
+    async def asize_heat_exchanger_batch(
+        self,
+        specs: Any,
+        concurrency: int = BATCH_CONCURRENCY
+    ) -> List[Dict[str, Any]]:
+        """
+        Size many heat exchangers concurrently.
+        
+        Each spec is a :meth:`size_heat_exchanger` request body using the
+        API's camelCase keys. All specs are validated before any request is
+        sent, then the requests share one pooled async connection.
+        
+        Args:
+            specs: Request bodies as a list of dicts, a pandas DataFrame, or
+                a NumPy structured array
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            Heat exchanger sizing results, in input order
+        """
+        records = _rows_to_records(specs)
+        for spec in records:
+            heat_duty = spec.get("heatDuty", 0)
+            hot_fluid_inlet = spec.get("hotFluidInlet", 0)
+            hot_fluid_outlet = spec.get("hotFluidOutlet", 0)
+            cold_fluid_inlet = spec.get("coldFluidInlet", 0)
+            cold_fluid_outlet = spec.get("coldFluidOutlet", 0)
+            if not (heat_duty > 0 and hot_fluid_inlet > hot_fluid_outlet
+                    and cold_fluid_outlet > cold_fluid_inlet):
+                _raise_invalid_duty(heat_duty, hot_fluid_inlet, hot_fluid_outlet,
+                                    cold_fluid_inlet, cold_fluid_outlet)
+        
+        return await self.client.abatch(
+            "/api/v1/equipment/heat-exchangers/sizing", records, concurrency
+        )
+    
+    def size_heat_exchanger_batch(
+        self,
+        specs: Any,
+        concurrency: int = BATCH_CONCURRENCY
+    ) -> List[Dict[str, Any]]:
+        """
+        Blocking version of :meth:`asize_heat_exchanger_batch`.
+        
+        Runs its own event loop, so it cannot be called from async code.
+        """
+        return self.client._run_blocking(self.asize_heat_exchanger_batch(specs, concurrency))
+    
     def calculate_lmtd(
         self,
         hot_fluid_inlet: float,
@@ -163,7 +242,7 @@ class HeatExchangerSizing:
         if delta_t1 == delta_t2:
             return delta_t1
         
-        lmtd = (delta_t1 - delta_t2) / (delta_t1 / delta_t2).log()
+        lmtd = (delta_t1 - delta_t2) / math.log(delta_t1 / delta_t2)
         return lmtd
     
     def calculate_overall_heat_transfer_coefficient(
@@ -240,12 +319,17 @@ class HeatExchangerSizing:
             if capacity_ratio == 1:
                 effectiveness = ntu / (1 + ntu)
             else:
-                effectiveness = (1 - (capacity_ratio * (1 - ntu * (1 - capacity_ratio)).exp()) / 
-                               (1 - capacity_ratio * (1 - ntu * (1 - capacity_ratio)).exp()))
+                e = math.exp(-ntu * (1 - capacity_ratio))
+                effectiveness = (1 - e) / (1 - capacity_ratio * e)
         elif flow_arrangement == "parallel":
-            effectiveness = (1 - (1 + capacity_ratio) * (1 - ntu * (1 + capacity_ratio)).exp()) / (1 + capacity_ratio)
-        else:  # crossflow
-            effectiveness = 1 - (1 - ntu * capacity_ratio).exp()
+            effectiveness = (1 - math.exp(-ntu * (1 + capacity_ratio))) / (1 + capacity_ratio)
+        else:  # crossflow, both fluids unmixed
+            if capacity_ratio == 0:
+                effectiveness = 1 - math.exp(-ntu)
+            else:
+                effectiveness = 1 - math.exp(
+                    (ntu ** 0.22 / capacity_ratio) * (math.exp(-capacity_ratio * ntu ** 0.78) - 1)
+                )
         
         return effectiveness
     
@@ -297,28 +381,14 @@ class HeatExchangerSizing:
             ...     cold_fluid_properties=cold_props
             ... )
         """
-        request_data = {
-            "heatDuty": heat_duty,
-            "hotFluidInlet": hot_fluid_inlet,
-            "hotFluidOutlet": hot_fluid_outlet,
-            "coldFluidInlet": cold_fluid_inlet,
-            "coldFluidOutlet": cold_fluid_outlet,
-            "hotFlowRate": hot_flow_rate,
-            "coldFlowRate": cold_flow_rate,
-            "designPressure": design_pressure,
-            "designTemperature": design_temperature,
-            "hotFluidProperties": hot_fluid_properties,
-            "coldFluidProperties": cold_fluid_properties
-        }
-        
-        # Make API request
-        response_data = self.client._make_request(
-            method="POST",
-            endpoint="/api/v1/equipment/heat-exchangers/shell-tube-optimization",
-            data=request_data
+        return self._post_design(
+            "shell_tube",
+            heat_duty, hot_fluid_inlet, hot_fluid_outlet,
+            cold_fluid_inlet, cold_fluid_outlet,
+            hot_flow_rate, cold_flow_rate,
+            design_pressure, design_temperature,
+            hot_fluid_properties, cold_fluid_properties,
         )
-        
-        return response_data
     
     def calculate_plate_heat_exchanger(
         self,
@@ -368,28 +438,14 @@ class HeatExchangerSizing:
             ...     cold_fluid_properties=cold_props
             ... )
         """
-        request_data = {
-            "heatDuty": heat_duty,
-            "hotFluidInlet": hot_fluid_inlet,
-            "hotFluidOutlet": hot_fluid_outlet,
-            "coldFluidInlet": cold_fluid_inlet,
-            "coldFluidOutlet": cold_fluid_outlet,
-            "hotFlowRate": hot_flow_rate,
-            "coldFlowRate": cold_flow_rate,
-            "designPressure": design_pressure,
-            "designTemperature": design_temperature,
-            "hotFluidProperties": hot_fluid_properties,
-            "coldFluidProperties": cold_fluid_properties
-        }
-        
-        # Make API request
-        response_data = self.client._make_request(
-            method="POST",
-            endpoint="/api/v1/equipment/heat-exchangers/plate-sizing",
-            data=request_data
+        return self._post_design(
+            "plate",
+            heat_duty, hot_fluid_inlet, hot_fluid_outlet,
+            cold_fluid_inlet, cold_fluid_outlet,
+            hot_flow_rate, cold_flow_rate,
+            design_pressure, design_temperature,
+            hot_fluid_properties, cold_fluid_properties,
         )
-        
-        return response_data
     
     def calculate_air_cooled_heat_exchanger(
         self,
@@ -439,6 +495,31 @@ class HeatExchangerSizing:
             ...     cold_fluid_properties=cold_props
             ... )
         """
+        return self._post_design(
+            "air_cooled",
+            heat_duty, hot_fluid_inlet, hot_fluid_outlet,
+            cold_fluid_inlet, cold_fluid_outlet,
+            hot_flow_rate, cold_flow_rate,
+            design_pressure, design_temperature,
+            hot_fluid_properties, cold_fluid_properties,
+        )
+    
+    def _post_design(
+        self,
+        design: str,
+        heat_duty: float,
+        hot_fluid_inlet: float,
+        hot_fluid_outlet: float,
+        cold_fluid_inlet: float,
+        cold_fluid_outlet: float,
+        hot_flow_rate: float,
+        cold_flow_rate: float,
+        design_pressure: float,
+        design_temperature: float,
+        hot_fluid_properties: Dict[str, float],
+        cold_fluid_properties: Dict[str, float]
+    ) -> Dict[str, Any]:
+        """Send a thermal design payload to the endpoint for ``design``."""
         request_data = {
             "heatDuty": heat_duty,
             "hotFluidInlet": hot_fluid_inlet,
@@ -454,13 +535,11 @@ class HeatExchangerSizing:
         }
         
         # Make API request
-        response_data = self.client._make_request(
+        return self.client._make_request(
             method="POST",
-            endpoint="/api/v1/equipment/heat-exchangers/air-cooled-sizing",
+            endpoint=self._DESIGN_ENDPOINTS[design],
             data=request_data
         )
-        
-        return response_data
     
     def rate_heat_exchanger(
         self,
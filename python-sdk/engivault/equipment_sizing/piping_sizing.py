@@ -11,9 +11,82 @@ References:
 - Darby, R.: Chemical Engineering Fluid Mechanics
 """
 
-from typing import Dict, Any, Optional, List
-from ..client import EngiVaultClient
-from ..exceptions import SDKValidationError
+import math
+from bisect import bisect_left
+from numbers import Real
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Dict, Any, Optional, List, Mapping, Tuple
+from ..client import BATCH_CONCURRENCY, EngiVaultClient, _rows_to_records
+from .._validation import require_positive
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import ArrayLike
+
+# Circular-section constants: A = _PI_OVER_FOUR * D², D = sqrt(_FOUR_OVER_PI * A)
+_PI_OVER_FOUR = math.pi / 4.0
+_FOUR_OVER_PI = 4.0 / math.pi
+
+# Colebrook-White solver constant: 2/ln(10)
+_TWO_OVER_LN10 = 2.0 / math.log(10.0)
+
+# Standard pipe sizes in m (ASME B31.3, Table 6.1)
+_STANDARD_PIPE_SIZES: Tuple[float, ...] = (
+    0.025, 0.032, 0.040, 0.050, 0.065, 0.080, 0.100, 0.125,
+    0.150, 0.200, 0.250, 0.300, 0.350, 0.400, 0.450, 0.500
+)
+
+# Equivalent lengths for common fittings (Crane Technical Paper No. 410)
+_FITTING_EQUIVALENT_LENGTHS: Mapping[str, float] = MappingProxyType({
+    "90_degree_elbow": 30,
+    "45_degree_elbow": 15,
+    "tee_straight": 20,
+    "tee_side": 60,
+    "gate_valve": 8,
+    "globe_valve": 340,
+    "check_valve": 100,
+    "reducer": 10
+})
+
+
+def _is_array(*values: Any) -> bool:
+    """Return True if any value is an array-like rather than a real scalar."""
+    return any(not isinstance(value, Real) for value in values)
+
+
+def _log1p_pade(t: float) -> float:
+    """[3/3] Padé approximant of ln(1 + t), accurate for small ``t``."""
+    return t * (60 + t * (60 + 11 * t)) / (60 + t * (90 + t * (36 + 3 * t)))
+
+
+def _tkachenko_mileikovskyi(reynolds_number: float, relative_roughness: float) -> float:
+    """
+    Explicit estimate of ``1/sqrt(f)`` for turbulent flow, within about 0.4% of
+    Colebrook-White in ``f`` (Tkachenko & Mileikovskyi, 2020).
+    """
+    scaled_re = 0.4587 * reynolds_number
+    s = 0.124 * reynolds_number * relative_roughness + math.log(scaled_re)
+    return 0.8686 * math.log(scaled_re / (s - 0.31) ** (s / (s + 1)))
+
+
+def _colebrook_white(a: float, b: float, x: float, iterations: int = 3) -> float:
+    """
+    Solve ``x = -2*log10(a + b*x)`` for ``x = 1/sqrt(f)`` and return ``f``.
+    
+    ``a`` is ε/(3.7·D), ``b`` is 2.51/Re and ``x`` the starting guess. Runs
+    ``iterations`` Newton steps; only the first logarithm is evaluated, later
+    ones are carried forward as ln(s') = ln(s) + ln(s'/s) with a Padé
+    approximant for ln(s'/s) (Praks & Brkić, 2018). From a
+    :func:`_tkachenko_mileikovskyi` start one step is enough.
+    """
+    s = a + b * x
+    log_s = math.log(s)
+    for _ in range(iterations):
+        x -= (x + _TWO_OVER_LN10 * log_s) / (1 + _TWO_OVER_LN10 * b / s)
+        s_next = a + b * x
+        log_s += _log1p_pade(s_next / s - 1)
+        s = s_next
+    return 1 / (x * x)
 
 
 class PipingSizing:
@@ -24,6 +97,8 @@ class PipingSizing:
     with proper references to industry standards.
     """
     
+    __slots__ = ('client',)
+    
     def __init__(self, client: EngiVaultClient):
         self.client = client
     
@@ -39,7 +114,8 @@ class PipingSizing:
         design_pressure: Optional[float] = None,
         design_temperature: Optional[float] = None,
         pipe_length: Optional[float] = None,
-        fittings: Optional[List[Dict[str, Any]]] = None
+        fittings: Optional[List[Dict[str, Any]]] = None,
+        cache: bool = False
     ) -> Dict[str, Any]:
         """
         Size piping based on flow rate and pressure drop.
@@ -56,6 +132,10 @@ class PipingSizing:
             design_temperature: Design temperature in K (optional)
             pipe_length: Pipe length in m (optional)
             fittings: List of fittings (optional)
+            cache: Reuse the result of an identical earlier call instead of
+                sending a new request (opt-in; the least recently used results
+                are dropped past ``RESULT_CACHE_MAXSIZE``, all by
+                ``client.clear_cache()``)
             
         Returns:
             Dict with piping sizing results including references
@@ -69,13 +149,9 @@ class PipingSizing:
             ...     velocity_limit=3.0
             ... )
         """
-        # Validate inputs
-        if flow_rate <= 0:
-            raise SDKValidationError("Flow rate must be positive")
-        if fluid_density <= 0:
-            raise SDKValidationError("Fluid density must be positive")
-        if fluid_viscosity <= 0:
-            raise SDKValidationError("Fluid viscosity must be positive")
+        # Validate inputs (one test on the common path; find the culprit only on failure)
+        if not (flow_rate > 0 and fluid_density > 0 and fluid_viscosity > 0):
+            require_positive(flow_rate=flow_rate, fluid_density=fluid_density, fluid_viscosity=fluid_viscosity)
         
         # Prepare request data
         request_data = {
@@ -84,24 +160,21 @@ class PipingSizing:
             "fluidViscosity": fluid_viscosity
         }
         
-        if pressure_drop is not None:
-            request_data["pressureDrop"] = pressure_drop
-        if velocity_limit is not None:
-            request_data["velocityLimit"] = velocity_limit
-        if pipe_material is not None:
-            request_data["pipeMaterial"] = pipe_material
-        if pipe_schedule is not None:
-            request_data["pipeSchedule"] = pipe_schedule
-        if design_pressure is not None:
-            request_data["designPressure"] = design_pressure
-        if design_temperature is not None:
-            request_data["designTemperature"] = design_temperature
-        if pipe_length is not None:
-            request_data["pipeLength"] = pipe_length
-        if fittings is not None:
-            request_data["fittings"] = fittings
+        optional = (
+            ("pressureDrop", pressure_drop),
+            ("velocityLimit", velocity_limit),
+            ("pipeMaterial", pipe_material),
+            ("pipeSchedule", pipe_schedule),
+            ("designPressure", design_pressure),
+            ("designTemperature", design_temperature),
+            ("pipeLength", pipe_length),
+            ("fittings", fittings)
+        )
+        request_data.update({key: value for key, value in optional if value is not None})
         
         # Make API request
+        if cache:
+            return self.client._make_request_cached("/api/v1/equipment/piping/sizing", request_data)
         response_data = self.client._make_request(
             method="POST",
             endpoint="/api/v1/equipment/piping/sizing",
@@ -110,6 +183,58 @@ class PipingSizing:
         
         return response_data
     
+    async def asize_piping_batch(
+        self,
+        specs: Any,
+        concurrency: int = BATCH_CONCURRENCY
+    ) -> List[Dict[str, Any]]:
+        """
+        Size many pipes concurrently.
+        
+        Each spec is a :meth:`size_piping` request body using the API's
+        camelCase keys. All specs are validated before any request is sent,
+        then the requests are issued over one pooled async connection, so a
+        sweep costs roughly one round trip rather than one per spec. Use this
+        for sweeps over :meth:`get_standard_pipe_sizes` or pipe materials.
+        
+        Args:
+            specs: Request bodies as a list of dicts, a pandas DataFrame, or
+                a NumPy structured array
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            Piping sizing results, in input order
+            
+        Example:
+            >>> specs = [
+            ...     {"flowRate": 0.1, "fluidDensity": 1000, "fluidViscosity": 0.001,
+            ...      "pipeMaterial": material}
+            ...     for material in ("carbon_steel", "stainless_steel")
+            ... ]
+            >>> results = await client.equipment_sizing.piping_sizing.asize_piping_batch(specs)
+        """
+        records = _rows_to_records(specs)
+        for spec in records:
+            flow_rate = spec.get("flowRate", 0)
+            fluid_density = spec.get("fluidDensity", 0)
+            fluid_viscosity = spec.get("fluidViscosity", 0)
+            if not (flow_rate > 0 and fluid_density > 0 and fluid_viscosity > 0):
+                require_positive(flow_rate=flow_rate, fluid_density=fluid_density, fluid_viscosity=fluid_viscosity)
+        
+        return await self.client.abatch("/api/v1/equipment/piping/sizing", records, concurrency)
+    
+    def size_piping_batch(
+        self,
+        specs: Any,
+        concurrency: int = BATCH_CONCURRENCY
+    ) -> List[Dict[str, Any]]:
+        """
+        Blocking version of :meth:`asize_piping_batch`.
+        
+        Runs its own event loop, so it cannot be called from async code.
+        """
+        return self.client._run_blocking(self.asize_piping_batch(specs, concurrency))
+    
     def calculate_pipe_diameter(
         self,
         flow_rate: float,
@@ -118,6 +243,9 @@ class PipingSizing:
         """
         Calculate pipe diameter based on flow rate and velocity limit.
         
+        Array arguments are evaluated element-wise with
+        :meth:`calculate_pipe_diameter_batch`.
+        
         References:
         - ASME B31.3, Section 6.1
         - Crane Technical Paper No. 410
@@ -129,8 +257,11 @@ class PipingSizing:
         Returns:
             Pipe diameter in m
         """
+        if _is_array(flow_rate, velocity_limit):
+            return self.calculate_pipe_diameter_batch(flow_rate, velocity_limit)
+        
         # Pipe diameter calculation (ASME B31.3, Section 6.1)
-        diameter = (4 * flow_rate / (3.14159 * velocity_limit)) ** 0.5
+        diameter = math.sqrt(_FOUR_OVER_PI * flow_rate / velocity_limit)
         return diameter
     
     def calculate_reynolds_number(
@@ -143,6 +274,8 @@ class PipingSizing:
         """
         Calculate Reynolds number for pipe flow.
         
+        Works unchanged on NumPy arrays, which broadcast element-wise.
+        
         References:
         - ASME B31.3, Section 6.2
         - Perry's Chemical Engineers' Handbook, 8th Edition, Section 6
@@ -157,7 +290,7 @@ class PipingSizing:
             Reynolds number
         """
         # Velocity calculation
-        velocity = flow_rate / (3.14159 * diameter ** 2 / 4)
+        velocity = flow_rate / (_PI_OVER_FOUR * diameter * diameter)
         
         # Reynolds number calculation (ASME B31.3, Section 6.2)
         reynolds_number = (fluid_density * velocity * diameter) / fluid_viscosity
@@ -171,9 +304,17 @@ class PipingSizing:
         """
         Calculate friction factor using Colebrook-White equation.
         
+        Array arguments are evaluated element-wise with
+        :meth:`calculate_friction_factor_batch`.
+        
         References:
         - ASME B31.3, Section 6.3
         - Crane Technical Paper No. 410
+        - Praks, P., Brkić, D.: One-Log Call Iterative Solution of the
+          Colebrook Flow Friction Equation Based on Padé Polynomials,
+          Energies 11(7), 2018
+        - Tkachenko, T., Mileikovskyi, V.: Precise Explicit Approximations of
+          the Colebrook-White Equation for Engineering Systems, 2020
         
         Args:
             reynolds_number: Reynolds number
@@ -182,13 +323,52 @@ class PipingSizing:
         Returns:
             Friction factor
         """
+        if _is_array(reynolds_number, relative_roughness):
+            return self.calculate_friction_factor_batch(reynolds_number, relative_roughness)
+        
         if reynolds_number < 2300:
             # Laminar flow (ASME B31.3, Section 6.3.1)
             friction_factor = 64 / reynolds_number
         else:
-            # Turbulent flow (ASME B31.3, Section 6.3.2)
-            # Simplified Blasius equation for smooth pipes
-            friction_factor = 0.316 / (reynolds_number ** 0.25)
+            # Turbulent flow (ASME B31.3, Section 6.3.2): Colebrook-White,
+            # one Newton step from an explicit warm start
+            friction_factor = _colebrook_white(
+                relative_roughness / 3.7,
+                2.51 / reynolds_number,
+                _tkachenko_mileikovskyi(reynolds_number, relative_roughness),
+                iterations=1
+            )
+        
+        return friction_factor
+    
+    @staticmethod
+    def make_friction_factor(
+        relative_roughness: float = 0.00015
+    ) -> Callable[[float], float]:
+        """
+        Specialize :meth:`calculate_friction_factor` for one roughness.
+        
+        Roughness-dependent terms are computed once, so the returned function
+        only does the Reynolds-dependent work. Use it when sweeping many
+        Reynolds numbers for one pipe material.
+        
+        Args:
+            relative_roughness: Relative roughness (ε/D)
+            
+        Returns:
+            Function mapping a Reynolds number to the friction factor
+            
+        Example:
+            >>> friction_factor = client.equipment_sizing.piping_sizing.make_friction_factor(1e-4)
+            >>> factors = [friction_factor(re) for re in (1e4, 1e5, 1e6)]
+        """
+        a = relative_roughness / 3.7
+        
+        def friction_factor(reynolds_number: float) -> float:
+            if reynolds_number < 2300:
+                return 64 / reynolds_number
+            x0 = _tkachenko_mileikovskyi(reynolds_number, relative_roughness)
+            return _colebrook_white(a, 2.51 / reynolds_number, x0, iterations=1)
         
         return friction_factor
     
@@ -203,6 +383,8 @@ class PipingSizing:
         """
         Calculate pressure drop using Darcy-Weisbach equation.
         
+        Works unchanged on NumPy arrays, which broadcast element-wise.
+        
         References:
         - ASME B31.3, Section 6.4
         - Crane Technical Paper No. 410
@@ -221,6 +403,147 @@ class PipingSizing:
         pressure_drop = (friction_factor * pipe_length * fluid_density * velocity ** 2) / (2 * diameter)
         return pressure_drop
     
+    # Vectorized variants for parameter sweeps. These require NumPy
+    # (``pip install engivault[numeric]``); every argument may be a scalar or
+    # an array and broadcasts like a NumPy ufunc.
+    
+    def calculate_pipe_diameter_batch(
+        self,
+        flow_rate: "ArrayLike",
+        velocity_limit: "ArrayLike" = 3.0
+    ) -> "np.ndarray":
+        """
+        Vectorized :meth:`calculate_pipe_diameter`.
+        
+        Example:
+            >>> diameters = client.equipment_sizing.piping_sizing.calculate_pipe_diameter_batch(
+            ...     flow_rate=np.linspace(0.01, 0.5, 100)
+            ... )
+        """
+        import numpy as np
+        
+        flow_rate = np.asarray(flow_rate, dtype=np.float64)
+        return np.sqrt(_FOUR_OVER_PI * flow_rate / np.asarray(velocity_limit, dtype=np.float64))
+    
+    def calculate_reynolds_number_batch(
+        self,
+        flow_rate: "ArrayLike",
+        diameter: "ArrayLike",
+        fluid_density: "ArrayLike",
+        fluid_viscosity: "ArrayLike"
+    ) -> "np.ndarray":
+        """Vectorized :meth:`calculate_reynolds_number`."""
+        import numpy as np
+        
+        flow_rate = np.asarray(flow_rate, dtype=np.float64)
+        diameter = np.asarray(diameter, dtype=np.float64)
+        velocity = flow_rate / (_PI_OVER_FOUR * diameter * diameter)
+        return fluid_density * velocity * diameter / np.asarray(fluid_viscosity, dtype=np.float64)
+    
+    def calculate_friction_factor_batch(
+        self,
+        reynolds_number: "ArrayLike",
+        relative_roughness: "ArrayLike" = 0.00015
+    ) -> "np.ndarray":
+        """
+        Friction factor from the full Colebrook-White equation.
+        
+        Vectorized :meth:`calculate_friction_factor`. Laminar points
+        (Re < 2300) use ``64/Re``. Turbulent points are solved to machine
+        precision in a compiled, multi-threaded kernel when Numba is
+        installed.
+        
+        Args:
+            reynolds_number: Reynolds numbers
+            relative_roughness: Relative roughness (ε/D), scalar or per point
+            
+        Returns:
+            Darcy friction factors, shaped like the broadcast inputs
+            
+        Example:
+            >>> f = client.equipment_sizing.piping_sizing.calculate_friction_factor_batch(
+            ...     np.logspace(3, 7, 1000), relative_roughness=1e-4
+            ... )
+        """
+        import numpy as np
+        from .. import _kernels
+        
+        reynolds_number, relative_roughness = np.broadcast_arrays(
+            np.asarray(reynolds_number, dtype=np.float64),
+            np.asarray(relative_roughness, dtype=np.float64),
+        )
+        out = np.empty(reynolds_number.shape)
+        _kernels.colebrook_batch(
+            _kernels.as_array(reynolds_number.ravel()),
+            _kernels.as_array(relative_roughness.ravel()),
+            out.reshape(-1),
+        )
+        return out
+    
+    def calculate_pressure_drop_batch(
+        self,
+        friction_factor: "ArrayLike",
+        pipe_length: "ArrayLike",
+        diameter: "ArrayLike",
+        fluid_density: "ArrayLike",
+        velocity: "ArrayLike"
+    ) -> "np.ndarray":
+        """Vectorized :meth:`calculate_pressure_drop`."""
+        import numpy as np
+        
+        velocity = np.asarray(velocity, dtype=np.float64)
+        return (np.asarray(friction_factor, dtype=np.float64) * pipe_length * fluid_density
+                * velocity ** 2) / (2 * np.asarray(diameter, dtype=np.float64))
+    
+    def calculate_pipe_pressure_drop_batch(
+        self,
+        flow_rate: "ArrayLike",
+        diameter: "ArrayLike",
+        pipe_length: "ArrayLike",
+        fluid_density: "ArrayLike",
+        fluid_viscosity: "ArrayLike",
+        relative_roughness: "ArrayLike" = 0.00015
+    ) -> "np.ndarray":
+        """
+        Pressure drop straight from flow conditions for many pipes.
+        
+        Equivalent to chaining the Reynolds number, friction factor and
+        pressure drop helpers, but computed point by point in one compiled,
+        multi-threaded kernel (when Numba is installed) without intermediate
+        arrays.
+        
+        Args:
+            flow_rate: Flow rates in m³/s
+            diameter: Pipe diameters in m
+            pipe_length: Pipe lengths in m
+            fluid_density: Fluid densities in kg/m³
+            fluid_viscosity: Fluid viscosities in Pa·s
+            relative_roughness: Relative roughness (ε/D)
+            
+        Returns:
+            Pressure drops in Pa, shaped like the broadcast inputs
+            
+        Example:
+            >>> dp = client.equipment_sizing.piping_sizing.calculate_pipe_pressure_drop_batch(
+            ...     flow_rate=np.linspace(0.01, 0.2, 1000), diameter=0.15,
+            ...     pipe_length=100, fluid_density=1000, fluid_viscosity=0.001
+            ... )
+        """
+        import numpy as np
+        from .. import _kernels
+        
+        columns = np.broadcast_arrays(*(
+            np.asarray(value, dtype=np.float64)
+            for value in (flow_rate, diameter, pipe_length, fluid_density,
+                          fluid_viscosity, relative_roughness)
+        ))
+        out = np.empty(columns[0].shape)
+        _kernels.darcy_pressure_drop_batch(
+            *(_kernels.as_array(column.ravel()) for column in columns),
+            out.reshape(-1),
+        )
+        return out
+    
     def calculate_equivalent_length(
         self,
         pipe_length: float,
@@ -229,6 +552,10 @@ class PipingSizing:
         """
         Calculate equivalent length including fittings.
         
+        For networks evaluated repeatedly, convert the fittings once with
+        :meth:`fittings_to_arrays` and use
+        :meth:`calculate_equivalent_length_soa`.
+        
         References:
         - Crane Technical Paper No. 410
         - Perry's Chemical Engineers' Handbook, 8th Edition, Section 6
@@ -246,7 +573,64 @@ class PipingSizing:
         
         return equivalent_length
     
-    def get_standard_pipe_sizes(self) -> List[float]:
+    @staticmethod
+    def fittings_to_arrays(
+        fittings: List[Dict[str, Any]]
+    ) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Split a list of fitting dicts into parallel arrays.
+        
+        Convert a fittings list once and pass the arrays to
+        :meth:`calculate_equivalent_length_soa` when the same network is
+        evaluated repeatedly.
+        
+        Args:
+            fittings: List of fittings with equivalent lengths
+            
+        Returns:
+            Tuple of (equivalent lengths in m, quantities) as float64 arrays
+        """
+        import numpy as np
+        
+        count = len(fittings)
+        equivalent_lengths = np.fromiter(
+            (fitting.get("equivalentLength", 0) for fitting in fittings),
+            dtype=np.float64, count=count
+        )
+        quantities = np.fromiter(
+            (fitting.get("quantity", 1) for fitting in fittings),
+            dtype=np.float64, count=count
+        )
+        return equivalent_lengths, quantities
+    
+    @staticmethod
+    def calculate_equivalent_length_soa(
+        pipe_length: float,
+        equivalent_lengths: "ArrayLike",
+        quantities: "ArrayLike"
+    ) -> float:
+        """
+        Array form of :meth:`calculate_equivalent_length`.
+        
+        Args:
+            pipe_length: Pipe length in m
+            equivalent_lengths: Equivalent length of each fitting in m
+            quantities: Number of each fitting
+            
+        Returns:
+            Equivalent length in m
+            
+        Example:
+            >>> piping = client.equipment_sizing.piping_sizing
+            >>> lengths, counts = piping.fittings_to_arrays(fittings)
+            >>> total = piping.calculate_equivalent_length_soa(100.0, lengths, counts)
+        """
+        import numpy as np
+        
+        return pipe_length + float(np.dot(equivalent_lengths, quantities))
+    
+    @staticmethod
+    def get_standard_pipe_sizes() -> Tuple[float, ...]:
         """
         Get standard pipe sizes.
         
@@ -255,16 +639,46 @@ class PipingSizing:
         - Perry's Chemical Engineers' Handbook, 8th Edition, Section 6
         
         Returns:
-            List of standard pipe sizes in m
-        """
-        # Standard pipe sizes (ASME B31.3, Table 6.1)
-        standard_sizes = [
-            0.025, 0.032, 0.040, 0.050, 0.065, 0.080, 0.100, 0.125,
-            0.150, 0.200, 0.250, 0.300, 0.350, 0.400, 0.450, 0.500
-        ]
-        return standard_sizes
+            Tuple of standard pipe sizes in m, smallest first
+        """
+        return _STANDARD_PIPE_SIZES
+    
+    @staticmethod
+    def nearest_standard_pipe_size(diameter: float) -> float:
+        """
+        Snap a diameter to the closest standard pipe size.
+        
+        Uses a binary search over :meth:`get_standard_pipe_sizes`; ties go to
+        the smaller size. A NumPy array is snapped element-wise with
+        ``np.searchsorted``.
+        
+        Args:
+            diameter: Pipe diameter in m
+            
+        Returns:
+            Closest standard pipe size in m
+            
+        Example:
+            >>> piping = client.equipment_sizing.piping_sizing
+            >>> piping.nearest_standard_pipe_size(piping.calculate_pipe_diameter(0.05))
+            0.15
+        """
+        sizes = _STANDARD_PIPE_SIZES
+        if _is_array(diameter):
+            import numpy as np
+            
+            table = np.asarray(sizes)
+            diameter = np.asarray(diameter, dtype=np.float64)
+            upper = np.clip(np.searchsorted(table, diameter), 1, len(table) - 1)
+            above, below = table[upper], table[upper - 1]
+            return np.where(above - diameter < diameter - below, above, below)
+        
+        upper = min(max(bisect_left(sizes, diameter), 1), len(sizes) - 1)
+        above, below = sizes[upper], sizes[upper - 1]
+        return above if above - diameter < diameter - below else below
     
-    def get_fitting_equivalent_lengths(self) -> Dict[str, float]:
+    @staticmethod
+    def get_fitting_equivalent_lengths() -> Mapping[str, float]:
         """
         Get equivalent lengths for common fittings.
         
@@ -273,20 +687,9 @@ class PipingSizing:
         - Perry's Chemical Engineers' Handbook, 8th Edition, Section 6
         
         Returns:
-            Dict with fitting types and equivalent lengths
-        """
-        # Equivalent lengths for common fittings (Crane Technical Paper No. 410)
-        fitting_lengths = {
-            "90_degree_elbow": 30,
-            "45_degree_elbow": 15,
-            "tee_straight": 20,
-            "tee_side": 60,
-            "gate_valve": 8,
-            "globe_valve": 340,
-            "check_valve": 100,
-            "reducer": 10
-        }
-        return fitting_lengths
+            Read-only mapping of fitting types to equivalent lengths
+        """
+        return _FITTING_EQUIVALENT_LENGTHS
 
     def comprehensive_pipe_sizing(
         self,
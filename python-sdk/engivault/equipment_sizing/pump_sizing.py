@@ -11,9 +11,20 @@ References:
 - Chemical Process Equipment: Selection and Design by Couper et al.
 """
 
-from typing import Dict, Any, Optional
-from ..client import EngiVaultClient
-from ..exceptions import SDKValidationError
+import math
+from numbers import Real
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+from ..client import BATCH_CONCURRENCY, EngiVaultClient, _rows_to_records
+from .._validation import require_positive
+
+# Request keys that size_pump requires to be positive, by argument name
+_POSITIVE_PUMP_INPUTS = (
+    ("flowRate", "flow_rate"),
+    ("head", "head"),
+    ("fluidDensity", "fluid_density"),
+    ("fluidViscosity", "fluid_viscosity"),
+    ("npshAvailable", "npsh_available"),
+)
 
 
 class PumpSizing:
@@ -24,6 +35,8 @@ class PumpSizing:
     pumps, and specialty pumps with proper references to industry standards.
     """
     
+    __slots__ = ('client',)
+    
     def __init__(self, client: EngiVaultClient):
         self.client = client
     
@@ -69,17 +82,77 @@ class PumpSizing:
             >>> print(f"Hydraulic power: {result['hydraulicPower']:.2f} kW")
             >>> print(f"Brake power: {result['brakePower']:.2f} kW")
         """
+        request_data = self._size_pump_request(
+            flow_rate, head, fluid_density, fluid_viscosity, npsh_available,
+            efficiency_target, pump_type, operating_hours,
+            design_temperature, design_pressure,
+        )
+        
+        # Make API request
+        response_data = self.client._make_request(
+            method="POST",
+            endpoint="/api/v1/equipment/pumps/sizing",
+            data=request_data
+        )
+        
+        return response_data
+    
+    async def asize_pump(
+        self,
+        flow_rate: float,
+        head: float,
+        fluid_density: float,
+        fluid_viscosity: float,
+        npsh_available: float,
+        efficiency_target: Optional[float] = None,
+        pump_type: Optional[str] = None,
+        operating_hours: Optional[float] = None,
+        design_temperature: Optional[float] = None,
+        design_pressure: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Async version of :meth:`size_pump`.
+        
+        Example:
+            >>> sizing, curve = await asyncio.gather(
+            ...     client.equipment_sizing.pump_sizing.asize_pump(
+            ...         flow_rate=0.1, head=50, fluid_density=1000,
+            ...         fluid_viscosity=0.001, npsh_available=5.0
+            ...     ),
+            ...     client.equipment_sizing.pump_sizing.acalculate_system_curve(
+            ...         static_head=20, friction_losses=10, flow_rate=0.1
+            ...     ),
+            ... )
+        """
+        request_data = self._size_pump_request(
+            flow_rate, head, fluid_density, fluid_viscosity, npsh_available,
+            efficiency_target, pump_type, operating_hours,
+            design_temperature, design_pressure,
+        )
+        
+        return await self.client._amake_request(
+            method="POST",
+            endpoint="/api/v1/equipment/pumps/sizing",
+            data=request_data
+        )
+    
+    @staticmethod
+    def _size_pump_request(
+        flow_rate: float,
+        head: float,
+        fluid_density: float,
+        fluid_viscosity: float,
+        npsh_available: float,
+        efficiency_target: Optional[float],
+        pump_type: Optional[str],
+        operating_hours: Optional[float],
+        design_temperature: Optional[float],
+        design_pressure: Optional[float]
+    ) -> Dict[str, Any]:
+        """Validate pump sizing inputs and build the request body."""
         # Validate inputs
-        if flow_rate <= 0:
-            raise SDKValidationError("Flow rate must be positive")
-        if head <= 0:
-            raise SDKValidationError("Head must be positive")
-        if fluid_density <= 0:
-            raise SDKValidationError("Fluid density must be positive")
-        if fluid_viscosity <= 0:
-            raise SDKValidationError("Fluid viscosity must be positive")
-        if npsh_available <= 0:
-            raise SDKValidationError("NPSH available must be positive")
+        require_positive(flow_rate=flow_rate, head=head, fluid_density=fluid_density,
+                         fluid_viscosity=fluid_viscosity, npsh_available=npsh_available)
         
         # Prepare request data
         request_data = {
@@ -90,31 +163,69 @@ class PumpSizing:
             "npshAvailable": npsh_available
         }
         
-        if efficiency_target is not None:
-            request_data["efficiencyTarget"] = efficiency_target
-        if pump_type is not None:
-            request_data["pumpType"] = pump_type
-        if operating_hours is not None:
-            request_data["operatingHours"] = operating_hours
-        if design_temperature is not None:
-            request_data["designTemperature"] = design_temperature
-        if design_pressure is not None:
-            request_data["designPressure"] = design_pressure
-        
-        # Make API request
-        response_data = self.client._make_request(
-            method="POST",
-            endpoint="/api/v1/equipment/pumps/sizing",
-            data=request_data
+        optional = (
+            ("efficiencyTarget", efficiency_target),
+            ("pumpType", pump_type),
+            ("operatingHours", operating_hours),
+            ("designTemperature", design_temperature),
+            ("designPressure", design_pressure)
         )
+        request_data.update({key: value for key, value in optional if value is not None})
         
-        return response_data
+        return request_data
+    
+    async def asize_pump_batch(
+        self,
+        specs: Any,
+        concurrency: int = BATCH_CONCURRENCY
+    ) -> List[Dict[str, Any]]:
+        """
+        Size many pumps concurrently.
+        
+        Each spec is a :meth:`size_pump` request body using the API's
+        camelCase keys. All specs are validated before any request is sent,
+        then the requests share one pooled async connection.
+        
+        Args:
+            specs: Request bodies as a list of dicts, a pandas DataFrame, or
+                a NumPy structured array
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            Pump sizing results, in input order
+            
+        Example:
+            >>> specs = [
+            ...     {"flowRate": q, "head": 50, "fluidDensity": 1000,
+            ...      "fluidViscosity": 0.001, "npshAvailable": 5.0}
+            ...     for q in (0.05, 0.1, 0.15)
+            ... ]
+            >>> results = await client.equipment_sizing.pump_sizing.asize_pump_batch(specs)
+        """
+        records = _rows_to_records(specs)
+        for spec in records:
+            require_positive(**{name: spec.get(key, 0) for key, name in _POSITIVE_PUMP_INPUTS})
+        
+        return await self.client.abatch("/api/v1/equipment/pumps/sizing", records, concurrency)
+    
+    def size_pump_batch(
+        self,
+        specs: Any,
+        concurrency: int = BATCH_CONCURRENCY
+    ) -> List[Dict[str, Any]]:
+        """
+        Blocking version of :meth:`asize_pump_batch`.
+        
+        Runs its own event loop, so it cannot be called from async code.
+        """
+        return self.client._run_blocking(self.asize_pump_batch(specs, concurrency))
     
     def select_pump(
         self,
         sizing_results: Dict[str, Any],
         constraints: Optional[Dict[str, Any]] = None,
-        preferences: Optional[Dict[str, Any]] = None
+        preferences: Optional[Dict[str, Any]] = None,
+        cache: bool = False
     ) -> Dict[str, Any]:
         """
         Select appropriate pump from catalog based on sizing results.
@@ -123,6 +234,10 @@ class PumpSizing:
             sizing_results: Results from pump sizing calculation
             constraints: Selection constraints (cost, size, etc.)
             preferences: User preferences (manufacturer, model, etc.)
+            cache: Reuse the result of an identical earlier call instead of
+                sending a new request (opt-in; the least recently used results
+                are dropped past ``RESULT_CACHE_MAXSIZE``, all by
+                ``client.clear_cache()``)
             
         Returns:
             Dict with selected pump options and recommendations
@@ -140,12 +255,15 @@ class PumpSizing:
             "sizingResults": sizing_results
         }
         
-        if constraints is not None:
-            request_data["constraints"] = constraints
-        if preferences is not None:
-            request_data["preferences"] = preferences
+        optional = (
+            ("constraints", constraints),
+            ("preferences", preferences)
+        )
+        request_data.update({key: value for key, value in optional if value is not None})
         
         # Make API request
+        if cache:
+            return self.client._make_request_cached("/api/v1/equipment/selection", request_data)
         response_data = self.client._make_request(
             method="POST",
             endpoint="/api/v1/equipment/selection",
@@ -188,6 +306,10 @@ class PumpSizing:
         """
         Calculate specific speed for pump selection.
         
+        Uses the metric form ``n_q = N * sqrt(Q) / H**0.75`` (N in RPM, Q in
+        m³/s, H in m), the scale expected by :meth:`calculate_efficiency`.
+        Scalars and NumPy arrays are both accepted.
+        
         References:
         - API 610, Section 6.1.2
         - Perry's Chemical Engineers' Handbook, 8th Edition, Section 10
@@ -201,7 +323,15 @@ class PumpSizing:
             Specific speed
         """
         # Specific speed calculation (API 610, Section 6.1.2)
-        specific_speed = (flow_rate ** 0.5 * (head * 9.81) ** 0.75) / (head * 9.81) ** 0.75
+        if isinstance(flow_rate, Real) and isinstance(head, Real):
+            sqrt = math.sqrt
+        else:
+            import numpy as np
+            sqrt = np.sqrt
+        
+        # H**0.75 as sqrt(H) * sqrt(sqrt(H)): square roots are cheaper than pow
+        root_head = sqrt(head)
+        specific_speed = rotational_speed * sqrt(flow_rate) / (root_head * sqrt(root_head))
         return specific_speed
     
     def calculate_efficiency(
@@ -218,22 +348,25 @@ class PumpSizing:
         - Hydraulic Institute Standards (HI 14.6)
         
         Args:
-            specific_speed: Specific speed
+            specific_speed: Specific speed (scalar or NumPy array)
             flow_rate: Flow rate in m³/s
             head: Pump head in meters
             
         Returns:
             Estimated efficiency (0-1)
         """
-        # Efficiency estimation based on specific speed (Perry's Handbook, Table 10-3)
-        if specific_speed < 50:
-            efficiency = 0.6 + (specific_speed / 50) * 0.2  # 60-80% for low specific speed
-        elif specific_speed < 150:
-            efficiency = 0.8 + ((specific_speed - 50) / 100) * 0.15  # 80-95% for medium specific speed
-        else:
-            efficiency = 0.95 - ((specific_speed - 150) / 100) * 0.1  # 95-85% for high specific speed
+        # Efficiency estimation based on specific speed (Perry's Handbook, Table 10-3):
+        # 60-80% below n_q 50, 80-95% up to 150, then falling 10% per 100.
+        # The curve is continuous and concave, so it equals the lowest of its
+        # three lines, which avoids branching and also works on arrays.
+        low = 0.6 + specific_speed * 0.004
+        medium = 0.725 + specific_speed * 0.0015
+        high = 1.1 - specific_speed * 0.001
+        if isinstance(specific_speed, Real):
+            return min(low, medium, high)
         
-        return efficiency
+        import numpy as np
+        return np.minimum(np.minimum(low, medium), high)
     
     def calculate_hydraulic_power(
         self,
@@ -244,6 +377,8 @@ class PumpSizing:
         """
         Calculate hydraulic power required.
         
+        Works unchanged on NumPy arrays, which broadcast element-wise.
+        
         References:
         - API 610, Section 6.1.1
         - Perry's Chemical Engineers' Handbook, 8th Edition, Section 10
@@ -268,6 +403,8 @@ class PumpSizing:
         """
         Calculate brake power required.
         
+        Works unchanged on NumPy arrays, which broadcast element-wise.
+        
         References:
         - API 610, Section 6.1.3
         - Perry's Chemical Engineers' Handbook, 8th Edition, Section 10
@@ -283,10 +420,43 @@ class PumpSizing:
         brake_power = hydraulic_power / efficiency
         return brake_power
     
+    def calculate_hydraulic_and_brake_power(
+        self,
+        flow_rate: float,
+        head: float,
+        fluid_density: float,
+        efficiency: float
+    ) -> Tuple[float, float]:
+        """
+        Calculate hydraulic and brake power in one pass.
+        
+        Equivalent to :meth:`calculate_hydraulic_power` followed by
+        :meth:`calculate_brake_power`, reusing the hydraulic power instead of
+        materializing it twice. Inputs may be NumPy arrays of any
+        broadcastable shape, e.g. a flow × head grid.
+        
+        Args:
+            flow_rate: Flow rate in m³/s
+            head: Pump head in meters
+            fluid_density: Fluid density in kg/m³
+            efficiency: Pump efficiency (0-1)
+            
+        Returns:
+            Tuple of (hydraulic power, brake power) in kW
+            
+        Example:
+            >>> flows, heads = np.meshgrid(np.linspace(0.01, 0.2, 50), np.linspace(10, 80, 50))
+            >>> pumps = client.equipment_sizing.pump_sizing
+            >>> hydraulic, brake = pumps.calculate_hydraulic_and_brake_power(flows, heads, 1000, 0.75)
+        """
+        hydraulic_power = self.calculate_hydraulic_power(flow_rate, head, fluid_density)
+        return hydraulic_power, self.calculate_brake_power(hydraulic_power, efficiency)
+    
     def analyze_performance_curves(
         self,
         pump_data: Dict[str, Any],
-        system_data: Dict[str, Any]
+        system_data: Dict[str, Any],
+        cache: bool = False
     ) -> Dict[str, Any]:
         """
         Analyze pump performance curves and system curves.
@@ -294,6 +464,10 @@ class PumpSizing:
         Args:
             pump_data: Pump performance data
             system_data: System curve data
+            cache: Reuse the result of an identical earlier call instead of
+                sending a new request (opt-in; the least recently used results
+                are dropped past ``RESULT_CACHE_MAXSIZE``, all by
+                ``client.clear_cache()``)
             
         Returns:
             Dict with performance analysis results
@@ -320,6 +494,10 @@ class PumpSizing:
         }
         
         # Make API request
+        if cache:
+            return self.client._make_request_cached(
+                "/api/v1/equipment/pumps/performance-analysis", request_data
+            )
         response_data = self.client._make_request(
             method="POST",
             endpoint="/api/v1/equipment/pumps/performance-analysis",
@@ -366,3 +544,89 @@ class PumpSizing:
         )
         
         return response_data
+    
+    async def aanalyze_performance_curves(
+        self,
+        pump_data: Dict[str, Any],
+        system_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Async version of :meth:`analyze_performance_curves`."""
+        return await self.client._amake_request(
+            method="POST",
+            endpoint="/api/v1/equipment/pumps/performance-analysis",
+            data={"pumpData": pump_data, "systemData": system_data}
+        )
+    
+    async def acalculate_system_curve(
+        self,
+        static_head: float,
+        friction_losses: float,
+        flow_rate: float
+    ) -> Dict[str, Any]:
+        """Async version of :meth:`calculate_system_curve`."""
+        return await self.client._amake_request(
+            method="POST",
+            endpoint="/api/v1/equipment/pumps/system-curve",
+            data={
+                "staticHead": static_head,
+                "frictionLosses": friction_losses,
+                "flowRate": flow_rate
+            }
+        )
+    
+    def fit_pump_curve(
+        self,
+        flow_rates: Sequence[float],
+        heads: Sequence[float]
+    ) -> Dict[str, Any]:
+        """
+        Fit a quadratic head curve ``H = a + b*Q + c*Q²`` to measured points.
+        
+        The fit runs locally; it requires NumPy and is JIT-compiled when Numba
+        is installed (``pip install engivault[numeric]``).
+        
+        Args:
+            flow_rates: Flow rates in m³/s
+            heads: Pump heads in meters, one per flow rate
+            
+        Returns:
+            Dict with curve coefficients 'a', 'b', 'c' and 'residualSumOfSquares'
+            
+        Example:
+            >>> curve = client.equipment_sizing.pump_sizing.fit_pump_curve(
+            ...     flow_rates=[0.0, 0.05, 0.1, 0.15],
+            ...     heads=[60, 57, 50, 38]
+            ... )
+            >>> print(f"Shutoff head: {curve['a']:.1f} m")
+        """
+        from .. import _kernels
+        from ..curves import CurveSeries
+        
+        curve = CurveSeries(flow_rates, heads)
+        a, b, c = curve.fit_quadratic()
+        return {
+            "a": a,
+            "b": b,
+            "c": c,
+            "residualSumOfSquares": _kernels.residual_sum_of_squares(curve.q, curve.h, a, b, c),
+        }
+    
+    def evaluate_pump_curve(
+        self,
+        coefficients: Tuple[float, float, float],
+        flow_rates: Sequence[float]
+    ) -> List[float]:
+        """
+        Evaluate a quadratic head curve at the given flow rates.
+        
+        Args:
+            coefficients: Curve coefficients (a, b, c), e.g. from fit_pump_curve
+            flow_rates: Flow rates in m³/s
+            
+        Returns:
+            Pump heads in meters
+        """
+        from .. import _kernels
+        
+        a, b, c = coefficients
+        return _kernels.eval_quadratic(a, b, c, _kernels.as_array(flow_rates)).tolist()
@@ -11,9 +11,52 @@ References:
 - Perry's Chemical Engineers' Handbook, 8th Edition, Section 12
 """
 
-from typing import Dict, Any, Optional
-from ..client import EngiVaultClient
-from ..exceptions import SDKValidationError
+from __future__ import annotations
+
+import math
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Any, List, Mapping, Optional, Tuple
+from ..client import EngiVaultClient, _rows_to_records
+from .._validation import require_positive
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import ArrayLike
+
+# Circular-section constants: A = _PI_OVER_FOUR * D², D = sqrt(_FOUR_OVER_PI * A)
+_PI_OVER_FOUR = math.pi / 4.0
+_FOUR_OVER_PI = 4.0 / math.pi
+
+# Material properties database (ASME Section II, Part D)
+_MATERIAL_DATA: Mapping[str, Mapping[str, float]] = MappingProxyType({
+    "carbon_steel": MappingProxyType({
+        "density": 7850,
+        "thermalConductivity": 50,
+        "specificHeat": 460,
+        "viscosity": 1.5e-5,
+        "elasticModulus": 200000,
+        "allowableStress": 137.9
+    }),
+    "stainless_steel": MappingProxyType({
+        "density": 8000,
+        "thermalConductivity": 16,
+        "specificHeat": 500,
+        "viscosity": 1.5e-5,
+        "elasticModulus": 200000,
+        "allowableStress": 137.9
+    }),
+    "aluminum": MappingProxyType({
+        "density": 2700,
+        "thermalConductivity": 205,
+        "specificHeat": 900,
+        "viscosity": 1.5e-5,
+        "elasticModulus": 70000,
+        "allowableStress": 68.9
+    })
+})
+
+# Properties returned for materials missing from _MATERIAL_DATA
+_DEFAULT_MATERIAL_PROPERTIES = _MATERIAL_DATA["carbon_steel"]
 
 
 class VesselSizing:
@@ -67,13 +110,10 @@ class VesselSizing:
             ...     material="carbon_steel"
             ... )
         """
-        # Validate inputs
-        if volume <= 0:
-            raise SDKValidationError("Volume must be positive")
-        if design_pressure <= 0:
-            raise SDKValidationError("Design pressure must be positive")
-        if design_temperature <= 0:
-            raise SDKValidationError("Design temperature must be positive")
+        # Validate inputs (one test on the common path; find the culprit only on failure)
+        if not (volume > 0 and design_pressure > 0 and design_temperature > 0):
+            require_positive(volume=volume, design_pressure=design_pressure,
+                             design_temperature=design_temperature)
         
         # Prepare request data
         request_data = {
@@ -83,18 +123,15 @@ class VesselSizing:
             "vesselType": vessel_type
         }
         
-        if material is not None:
-            request_data["material"] = material
-        if diameter is not None:
-            request_data["diameter"] = diameter
-        if length is not None:
-            request_data["length"] = length
-        if height is not None:
-            request_data["height"] = height
-        if operating_conditions is not None:
-            request_data["operatingConditions"] = operating_conditions
-        if standards is not None:
-            request_data["standards"] = standards
+        optional = (
+            ("material", material),
+            ("diameter", diameter),
+            ("length", length),
+            ("height", height),
+            ("operatingConditions", operating_conditions),
+            ("standards", standards)
+        )
+        request_data.update({key: value for key, value in optional if value is not None})
         
         # Make API request
         response_data = self.client._make_request(
@@ -105,6 +142,45 @@ class VesselSizing:
         
         return response_data
     
+    def size_vessels_bulk(self, specs: Any) -> List[Dict[str, Any]]:
+        """
+        Size many vessels in a single request.
+        
+        Each spec is a :meth:`size_vessel` request body using the API's
+        camelCase keys. All specs are validated locally, then sent together
+        in one POST, so a sweep costs one round trip instead of one per
+        vessel. The API accepts up to 1000 vessels per request.
+        
+        Args:
+            specs: Request bodies as a list of dicts, a pandas DataFrame, or
+                a NumPy structured array
+            
+        Returns:
+            Vessel sizing results, in input order
+            
+        Example:
+            >>> specs = [
+            ...     {"volume": volume, "designPressure": 1000000,
+            ...      "designTemperature": 423, "vesselType": "pressure_vessel"}
+            ...     for volume in (10, 50, 100)
+            ... ]
+            >>> results = client.equipment_sizing.vessel_sizing.size_vessels_bulk(specs)
+        """
+        records = _rows_to_records(specs)
+        for spec in records:
+            volume = spec.get("volume", 0)
+            design_pressure = spec.get("designPressure", 0)
+            design_temperature = spec.get("designTemperature", 0)
+            if not (volume > 0 and design_pressure > 0 and design_temperature > 0):
+                require_positive(volume=volume, design_pressure=design_pressure,
+                                 design_temperature=design_temperature)
+        
+        return self.client._make_request(
+            method="POST",
+            endpoint="/api/v1/equipment/vessels/sizing/bulk",
+            data={"vessels": records}
+        )
+    
     def calculate_wall_thickness(
         self,
         diameter: float,
@@ -157,13 +233,9 @@ class VesselSizing:
         Returns:
             Vessel weight in kg
         """
-        # Shell weight calculation
-        shell_weight = 3.14159 * diameter * length * wall_thickness * material_density
-        
-        # Head weight calculation (assuming 2:1 ellipsoidal heads)
-        head_weight = 2 * 3.14159 * (diameter / 2) ** 2 * wall_thickness * material_density
-        
-        total_weight = shell_weight + head_weight
+        # Shell weight π·D·L·t·ρ plus head weight 2·(π/4)·D²·t·ρ (assuming
+        # 2:1 ellipsoidal heads), sharing the π·D·t·ρ factor
+        total_weight = math.pi * diameter * wall_thickness * material_density * (length + 0.5 * diameter)
         return total_weight
     
     def calculate_optimal_dimensions(
@@ -184,8 +256,63 @@ class VesselSizing:
             Tuple of (diameter, length) in m
         """
         # Calculate optimal dimensions for minimum surface area
-        diameter = (volume / (3.14159 / 4)) ** (1/3)
-        length = volume / (3.14159 * diameter ** 2 / 4)
+        diameter = (_FOUR_OVER_PI * volume) ** (1/3)
+        length = volume / (_PI_OVER_FOUR * diameter * diameter)
+        
+        return diameter, length
+    
+    def calculate_wall_thickness_batch(
+        self,
+        diameter: "ArrayLike",
+        design_pressure: "ArrayLike",
+        allowable_stress: "ArrayLike",
+        joint_efficiency: "ArrayLike" = 1.0,
+        corrosion_allowance: "ArrayLike" = 0.003
+    ) -> "np.ndarray":
+        """
+        Vectorized :meth:`calculate_wall_thickness`.
+        
+        Example:
+            >>> thicknesses = client.equipment_sizing.vessel_sizing.calculate_wall_thickness_batch(
+            ...     diameter=np.linspace(1.0, 4.0, 100),
+            ...     design_pressure=1e6,
+            ...     allowable_stress=137.9e6
+            ... )
+        """
+        import numpy as np
+        
+        diameter = np.asarray(diameter, dtype=np.float64)
+        design_pressure = np.asarray(design_pressure, dtype=np.float64)
+        return (design_pressure * diameter) / (
+            2 * np.asarray(allowable_stress, dtype=np.float64)
+            * np.asarray(joint_efficiency, dtype=np.float64) - design_pressure
+        ) + np.asarray(corrosion_allowance, dtype=np.float64)
+    
+    def calculate_vessel_weight_batch(
+        self,
+        diameter: "ArrayLike",
+        length: "ArrayLike",
+        wall_thickness: "ArrayLike",
+        material_density: "ArrayLike"
+    ) -> "np.ndarray":
+        """Vectorized :meth:`calculate_vessel_weight`."""
+        import numpy as np
+        
+        diameter = np.asarray(diameter, dtype=np.float64)
+        return (math.pi * diameter * np.asarray(wall_thickness, dtype=np.float64)
+                * np.asarray(material_density, dtype=np.float64)
+                * (np.asarray(length, dtype=np.float64) + 0.5 * diameter))
+    
+    def calculate_optimal_dimensions_batch(
+        self,
+        volume: "ArrayLike"
+    ) -> Tuple["np.ndarray", "np.ndarray"]:
+        """Vectorized :meth:`calculate_optimal_dimensions`."""
+        import numpy as np
+        
+        volume = np.asarray(volume, dtype=np.float64)
+        diameter = np.cbrt(_FOUR_OVER_PI * volume)
+        length = volume / (_PI_OVER_FOUR * diameter * diameter)
         
         return diameter, length
     
@@ -193,7 +320,7 @@ class VesselSizing:
         self,
         material: str,
         temperature: float
-    ) -> Dict[str, float]:
+    ) -> Mapping[str, float]:
         """
         Get material properties at given temperature.
         
@@ -206,37 +333,10 @@ class VesselSizing:
             temperature: Temperature in K
             
         Returns:
-            Dict with material properties
+            Read-only mapping of material properties; carbon steel for
+            unknown materials
         """
-        # Material properties database (ASME Section II, Part D)
-        material_data = {
-            "carbon_steel": {
-                "density": 7850,
-                "thermalConductivity": 50,
-                "specificHeat": 460,
-                "viscosity": 1.5e-5,
-                "elasticModulus": 200000,
-                "allowableStress": 137.9
-            },
-            "stainless_steel": {
-                "density": 8000,
-                "thermalConductivity": 16,
-                "specificHeat": 500,
-                "viscosity": 1.5e-5,
-                "elasticModulus": 200000,
-                "allowableStress": 137.9
-            },
-            "aluminum": {
-                "density": 2700,
-                "thermalConductivity": 205,
-                "specificHeat": 900,
-                "viscosity": 1.5e-5,
-                "elasticModulus": 70000,
-                "allowableStress": 68.9
-            }
-        }
-        
-        return material_data.get(material, material_data["carbon_steel"])
+        return _MATERIAL_DATA.get(material, _DEFAULT_MATERIAL_PROPERTIES)
     
     def size_pressure_vessel(
         self,
@@ -270,18 +370,11 @@ class VesselSizing:
         Returns:
             Dict with pressure vessel sizing results
         """
-        request_data = {
-            "volume": volume,
-            "designPressure": design_pressure,
-            "designTemperature": design_temperature,
-            "material": material,
-            "vesselType": "pressure_vessel",
-            "diameter": diameter,
-            "length": length,
-            "height": height,
-            "operatingConditions": operating_conditions
-        }
-        return self.client._make_request(method="POST", endpoint="/api/v1/equipment/vessels/pressure-vessel", data=request_data)
+        return self._size_vessel_type(
+            "/api/v1/equipment/vessels/pressure-vessel", "pressure_vessel",
+            volume, design_pressure, design_temperature, material, operating_conditions,
+            diameter=diameter, length=length, height=height
+        )
 
     def size_storage_tank(
         self,
@@ -313,17 +406,11 @@ class VesselSizing:
         Returns:
             Dict with storage tank sizing results
         """
-        request_data = {
-            "volume": volume,
-            "designPressure": design_pressure,
-            "designTemperature": design_temperature,
-            "material": material,
-            "vesselType": "storage_tank",
-            "diameter": diameter,
-            "height": height,
-            "operatingConditions": operating_conditions
-        }
-        return self.client._make_request(method="POST", endpoint="/api/v1/equipment/vessels/storage-tank", data=request_data)
+        return self._size_vessel_type(
+            "/api/v1/equipment/vessels/storage-tank", "storage_tank",
+            volume, design_pressure, design_temperature, material, operating_conditions,
+            diameter=diameter, height=height
+        )
 
     def size_separator(
         self,
@@ -355,14 +442,31 @@ class VesselSizing:
         Returns:
             Dict with separator sizing results
         """
+        return self._size_vessel_type(
+            "/api/v1/equipment/vessels/separator", "separator",
+            volume, design_pressure, design_temperature, material, operating_conditions,
+            diameter=diameter, length=length
+        )
+    
+    def _size_vessel_type(
+        self,
+        endpoint: str,
+        vessel_type: str,
+        volume: float,
+        design_pressure: float,
+        design_temperature: float,
+        material: str,
+        operating_conditions: Optional[Dict[str, Any]],
+        **dimensions: Optional[float]
+    ) -> Dict[str, Any]:
+        """Post a vessel-type sizing request; dimension keyword names are API keys."""
         request_data = {
             "volume": volume,
             "designPressure": design_pressure,
             "designTemperature": design_temperature,
             "material": material,
-            "vesselType": "separator",
-            "diameter": diameter,
-            "length": length,
+            "vesselType": vessel_type,
+            **dimensions,
             "operatingConditions": operating_conditions
         }
-        return self.client._make_request(method="POST", endpoint="/api/v1/equipment/vessels/separator", data=request_data)
+        return self.client._make_request(method="POST", endpoint=endpoint, data=request_data)
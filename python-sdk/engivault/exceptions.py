@@ -7,6 +7,18 @@ Custom exception classes for the EngiVault Python SDK.
 from typing import Any, Dict, Optional
 
 
+__all__ = [
+    "EngiVaultError",
+    "AuthenticationError",
+    "ValidationError",
+    "SDKValidationError",
+    "RateLimitError",
+    "APIError",
+    "NetworkError",
+    "ConfigurationError",
+]
+
+
 class EngiVaultError(Exception):
     """Base exception class for EngiVault SDK."""
     
@@ -5,26 +5,37 @@ Advanced fluid mechanics calculations including open channel flow, compressible
 boundary layer analysis, and external flow over objects.
 """
 
+from __future__ import annotations
+
 from typing import TYPE_CHECKING, Optional, Dict, Any
 
 from ..models import (
-    OpenChannelFlowInput,
     OpenChannelFlowResult,
-    CompressibleFlowInput,
     CompressibleFlowResult,
-    BoundaryLayerInput,
     BoundaryLayerResult,
-    ExternalFlowInput,
     ExternalFlowResult,
 )
+from .._validation import require_positive
 from ..exceptions import SDKValidationError
 
 if TYPE_CHECKING:
     from ..client import EngiVaultClient
 
 
+def _require_dict(**values: Any) -> None:
+    """Raise SDKValidationError for the first value that is not a dict."""
+    for name, value in values.items():
+        if not isinstance(value, dict):
+            raise SDKValidationError(f"{name.replace('_', ' ').capitalize()} must be a dict")
+
+
 class FluidMechanicsModule:
-    """Fluid mechanics calculations module."""
+    """
+    Fluid mechanics calculations module.
+    
+    Request bodies are built directly with the API's camelCase keys; the
+    ``*Input`` models in :mod:`engivault.models` document the same schema.
+    """
     
     def __init__(self, client: "EngiVaultClient"):
         self.client = client
@@ -37,6 +48,7 @@ class FluidMechanicsModule:
         mannings_coeff: float,
         channel_shape: Optional[str] = None,
         side_slope: Optional[float] = None,
+        cache: bool = False,
     ) -> OpenChannelFlowResult:
         """
         Calculate open channel flow using Manning's equation.
@@ -48,6 +60,10 @@ class FluidMechanicsModule:
             mannings_coeff: Manning's roughness coefficient
             channel_shape: Channel shape ('rectangular', 'trapezoidal', 'circular')
             side_slope: Side slope for trapezoidal (m:1)
+            cache: Reuse the result of an identical earlier call instead of
+                sending a new request (opt-in; the least recently used results
+                are dropped past ``RESULT_CACHE_MAXSIZE``, all by
+                ``client.clear_cache()``)
             
         Returns:
             OpenChannelFlowResult with depth, velocity, Froude number, and hydraulic properties
@@ -62,28 +78,83 @@ class FluidMechanicsModule:
             >>> print(f"Normal depth: {result.normal_depth:.2f} m")
             >>> print(f"Flow regime: {result.flow_regime}")
         """
-        # Validate inputs
-        try:
-            input_data = OpenChannelFlowInput(
-                flow_rate=flow_rate,
-                channel_width=channel_width,
-                channel_slope=channel_slope,
-                mannings_s_coeff=mannings_coeff,
-                channel_shape=channel_shape or "rectangular",
-                side_slope=side_slope or 0,
-            )
-        except Exception as e:
-            raise SDKValidationError(f"Invalid input parameters: {str(e)}")
+        request_data = self._open_channel_flow_data(
+            flow_rate, channel_width, channel_slope, mannings_coeff,
+            channel_shape, side_slope,
+        )
         
         # Make API request
-        response_data = self.client._make_request(
+        if cache:
+            response_data = self.client._make_request_cached(
+                "/api/v1/fluid-mechanics/open-channel-flow", request_data
+            )
+        else:
+            response_data = self.client._make_request(
+                method="POST",
+                endpoint="/api/v1/fluid-mechanics/open-channel-flow",
+                data=request_data,
+            )
+        
+        # Parse and return result
+        return OpenChannelFlowResult.model_validate(response_data)
+    
+    async def aopen_channel_flow(
+        self,
+        flow_rate: float,
+        channel_width: float,
+        channel_slope: float,
+        mannings_coeff: float,
+        channel_shape: Optional[str] = None,
+        side_slope: Optional[float] = None,
+    ) -> OpenChannelFlowResult:
+        """
+        Async version of :meth:`open_channel_flow`.
+        
+        Example:
+            >>> result = await client.fluid_mechanics.aopen_channel_flow(
+            ...     flow_rate=5.0,
+            ...     channel_width=3.0,
+            ...     channel_slope=0.001,
+            ...     mannings_coeff=0.03
+            ... )
+        """
+        request_data = self._open_channel_flow_data(
+            flow_rate, channel_width, channel_slope, mannings_coeff,
+            channel_shape, side_slope,
+        )
+        
+        response_data = await self.client._amake_request(
             method="POST",
             endpoint="/api/v1/fluid-mechanics/open-channel-flow",
-            data=input_data.model_dump(by_alias=True),
+            data=request_data,
         )
         
-        # Parse and return result
-        return OpenChannelFlowResult(**response_data)
+        return OpenChannelFlowResult.model_validate(response_data)
+    
+    @staticmethod
+    def _open_channel_flow_data(
+        flow_rate: float,
+        channel_width: float,
+        channel_slope: float,
+        mannings_coeff: float,
+        channel_shape: Optional[str],
+        side_slope: Optional[float],
+    ) -> Dict[str, Any]:
+        """Validate open channel flow inputs and build the request body."""
+        require_positive(
+            flow_rate=flow_rate,
+            channel_width=channel_width,
+            channel_slope=channel_slope,
+            mannings_coeff=mannings_coeff,
+        )
+        return {
+            "flowRate": flow_rate,
+            "channelWidth": channel_width,
+            "channelSlope": channel_slope,
+            "manningSCoeff": mannings_coeff,
+            "channelShape": channel_shape or "rectangular",
+            "sideSlope": side_slope or 0,
+        }
     
     def compressible_flow(
         self,
@@ -123,31 +194,71 @@ class FluidMechanicsModule:
             >>> print(f"Mach number: {result.mach_number:.2f}")
             >>> print(f"Flow regime: {result.flow_regime}")
         """
-        # Validate inputs
-        if mach_number is None and velocity is None:
-            raise SDKValidationError("Either mach_number or velocity must be provided")
-        
-        try:
-            input_data = CompressibleFlowInput(
-                temperature=temperature,
-                pressure=pressure,
-                gas_properties=gas_properties,
-                mach_number=mach_number,
-                velocity=velocity,
-                flow_type=flow_type or "isentropic",
-            )
-        except Exception as e:
-            raise SDKValidationError(f"Invalid input parameters: {str(e)}")
+        request_data = self._compressible_flow_data(
+            temperature, pressure, gas_properties, mach_number, velocity, flow_type,
+        )
         
         # Make API request
         response_data = self.client._make_request(
             method="POST",
             endpoint="/api/v1/fluid-mechanics/compressible-flow",
-            data=input_data.model_dump(by_alias=True, exclude_none=True),
+            data=request_data,
         )
         
         # Parse and return result
-        return CompressibleFlowResult(**response_data)
+        return CompressibleFlowResult.model_validate(response_data)
+    
+    async def acompressible_flow(
+        self,
+        temperature: float,
+        pressure: float,
+        gas_properties: Dict[str, float],
+        mach_number: Optional[float] = None,
+        velocity: Optional[float] = None,
+        flow_type: Optional[str] = None,
+    ) -> CompressibleFlowResult:
+        """Async version of :meth:`compressible_flow`."""
+        request_data = self._compressible_flow_data(
+            temperature, pressure, gas_properties, mach_number, velocity, flow_type,
+        )
+        
+        response_data = await self.client._amake_request(
+            method="POST",
+            endpoint="/api/v1/fluid-mechanics/compressible-flow",
+            data=request_data,
+        )
+        
+        return CompressibleFlowResult.model_validate(response_data)
+    
+    @staticmethod
+    def _compressible_flow_data(
+        temperature: float,
+        pressure: float,
+        gas_properties: Dict[str, float],
+        mach_number: Optional[float],
+        velocity: Optional[float],
+        flow_type: Optional[str],
+    ) -> Dict[str, Any]:
+        """Validate compressible flow inputs and build the request body."""
+        if mach_number is None and velocity is None:
+            raise SDKValidationError("Either mach_number or velocity must be provided")
+        require_positive(temperature=temperature, pressure=pressure)
+        _require_dict(gas_properties=gas_properties)
+        
+        request_data = {
+            "temperature": temperature,
+            "pressure": pressure,
+            "gasProperties": gas_properties,
+            "flowType": flow_type or "isentropic",
+        }
+        
+        optional = (
+            ("machNumber", mach_number),
+            ("velocity", velocity),
+        )
+        request_data.update({key: value for key, value in optional if value is not None})
+        
+        return request_data
     
     def boundary_layer(
         self,
@@ -184,27 +295,66 @@ class FluidMechanicsModule:
             >>> print(f"Boundary layer thickness: {result.boundary_layer_thickness*1000:.2f} mm")
             >>> print(f"Flow regime: {result.flow_regime}")
         """
-        # Validate inputs
-        try:
-            input_data = BoundaryLayerInput(
-                velocity=velocity,
-                distance=distance,
-                fluid_properties=fluid_properties,
-                surface_roughness=surface_roughness,
-                plate_length=plate_length,
-            )
-        except Exception as e:
-            raise SDKValidationError(f"Invalid input parameters: {str(e)}")
+        request_data = self._boundary_layer_data(
+            velocity, distance, fluid_properties, surface_roughness, plate_length,
+        )
         
         # Make API request
         response_data = self.client._make_request(
             method="POST",
             endpoint="/api/v1/fluid-mechanics/boundary-layer",
-            data=input_data.model_dump(by_alias=True, exclude_none=True),
+            data=request_data,
         )
         
         # Parse and return result
-        return BoundaryLayerResult(**response_data)
+        return BoundaryLayerResult.model_validate(response_data)
+    
+    async def aboundary_layer(
+        self,
+        velocity: float,
+        distance: float,
+        fluid_properties: Dict[str, float],
+        surface_roughness: Optional[float] = None,
+        plate_length: Optional[float] = None,
+    ) -> BoundaryLayerResult:
+        """Async version of :meth:`boundary_layer`."""
+        request_data = self._boundary_layer_data(
+            velocity, distance, fluid_properties, surface_roughness, plate_length,
+        )
+        
+        response_data = await self.client._amake_request(
+            method="POST",
+            endpoint="/api/v1/fluid-mechanics/boundary-layer",
+            data=request_data,
+        )
+        
+        return BoundaryLayerResult.model_validate(response_data)
+    
+    @staticmethod
+    def _boundary_layer_data(
+        velocity: float,
+        distance: float,
+        fluid_properties: Dict[str, float],
+        surface_roughness: Optional[float],
+        plate_length: Optional[float],
+    ) -> Dict[str, Any]:
+        """Validate boundary layer inputs and build the request body."""
+        require_positive(velocity=velocity, distance=distance)
+        _require_dict(fluid_properties=fluid_properties)
+        
+        request_data = {
+            "velocity": velocity,
+            "distance": distance,
+            "fluidProperties": fluid_properties,
+        }
+        
+        optional = (
+            ("surfaceRoughness", surface_roughness),
+            ("plateLength", plate_length),
+        )
+        request_data.update({key: value for key, value in optional if value is not None})
+        
+        return request_data
     
     def external_flow(
         self,
@@ -238,27 +388,65 @@ class FluidMechanicsModule:
             >>> print(f"Drag coefficient: {result.drag_coefficient:.3f}")
             >>> print(f"Drag force: {result.drag_force:.2f} N")
         """
-        # Validate inputs
-        try:
-            input_data = ExternalFlowInput(
-                velocity=velocity,
-                characteristic_length=characteristic_length,
-                fluid_properties=fluid_properties,
-                geometry=geometry,
-                angle_of_attack=angle_of_attack,
-            )
-        except Exception as e:
-            raise SDKValidationError(f"Invalid input parameters: {str(e)}")
+        request_data = self._external_flow_data(
+            velocity, characteristic_length, fluid_properties, geometry, angle_of_attack,
+        )
         
         # Make API request
         response_data = self.client._make_request(
             method="POST",
             endpoint="/api/v1/fluid-mechanics/external-flow",
-            data=input_data.model_dump(by_alias=True, exclude_none=True),
+            data=request_data,
         )
         
         # Parse and return result
-        return ExternalFlowResult(**response_data)
+        return ExternalFlowResult.model_validate(response_data)
+    
+    async def aexternal_flow(
+        self,
+        velocity: float,
+        characteristic_length: float,
+        fluid_properties: Dict[str, float],
+        geometry: str,
+        angle_of_attack: Optional[float] = None,
+    ) -> ExternalFlowResult:
+        """Async version of :meth:`external_flow`."""
+        request_data = self._external_flow_data(
+            velocity, characteristic_length, fluid_properties, geometry, angle_of_attack,
+        )
+        
+        response_data = await self.client._amake_request(
+            method="POST",
+            endpoint="/api/v1/fluid-mechanics/external-flow",
+            data=request_data,
+        )
+        
+        return ExternalFlowResult.model_validate(response_data)
+    
+    @staticmethod
+    def _external_flow_data(
+        velocity: float,
+        characteristic_length: float,
+        fluid_properties: Dict[str, float],
+        geometry: str,
+        angle_of_attack: Optional[float],
+    ) -> Dict[str, Any]:
+        """Validate external flow inputs and build the request body."""
+        require_positive(velocity=velocity, characteristic_length=characteristic_length)
+        _require_dict(fluid_properties=fluid_properties)
+        if not isinstance(geometry, str):
+            raise SDKValidationError("Geometry must be a string")
+        
+        request_data = {
+            "velocity": velocity,
+            "characteristicLength": characteristic_length,
+            "fluidProperties": fluid_properties,
+            "geometry": geometry,
+        }
+        if angle_of_attack is not None:
+            request_data["angleOfAttack"] = angle_of_attack
+        
+        return request_data
     
     def normal_shock(
         self,
@@ -283,18 +471,35 @@ class FluidMechanicsModule:
             >>> print(f"Downstream Mach: {result['machNumber2']:.3f}")
             >>> print(f"Pressure ratio: {result['pressureRatio']:.2f}")
         """
-        if mach_number_1 <= 1.0:
-            raise SDKValidationError("Normal shock requires supersonic upstream flow (M₁ > 1)")
-        
         # Make API request
         response_data = self.client._make_request(
             method="POST",
             endpoint="/api/v1/fluid-mechanics/normal-shock",
-            data={"machNumber1": mach_number_1, "gamma": gamma},
+            data=self._normal_shock_data(mach_number_1, gamma),
         )
         
         return response_data
     
+    async def anormal_shock(
+        self,
+        mach_number_1: float,
+        gamma: float = 1.4,
+    ) -> Dict[str, float]:
+        """Async version of :meth:`normal_shock`."""
+        return await self.client._amake_request(
+            method="POST",
+            endpoint="/api/v1/fluid-mechanics/normal-shock",
+            data=self._normal_shock_data(mach_number_1, gamma),
+        )
+    
+    @staticmethod
+    def _normal_shock_data(mach_number_1: float, gamma: float) -> Dict[str, float]:
+        """Validate normal shock inputs and build the request body."""
+        if mach_number_1 <= 1.0:
+            raise SDKValidationError("Normal shock requires supersonic upstream flow (M₁ > 1)")
+        
+        return {"machNumber1": mach_number_1, "gamma": gamma}
+    
     def choked_flow(
         self,
         stagnation_temperature: float,
@@ -335,3 +540,22 @@ class FluidMechanicsModule:
         )
         
         return response_data
+    
+    async def achoked_flow(
+        self,
+        stagnation_temperature: float,
+        stagnation_pressure: float,
+        gamma: float = 1.4,
+        gas_constant: float = 287,
+    ) -> Dict[str, float]:
+        """Async version of :meth:`choked_flow`."""
+        return await self.client._amake_request(
+            method="POST",
+            endpoint="/api/v1/fluid-mechanics/choked-flow",
+            data={
+                "stagnationTemperature": stagnation_temperature,
+                "stagnationPressure": stagnation_pressure,
+                "gamma": gamma,
+                "gasConstant": gas_constant
+            },
+        )
@@ -4,24 +4,77 @@ EngiVault Heat Transfer Module
 Heat transfer calculations including heat exchangers, convection, conduction, and thermal analysis.
 """
 
-from typing import TYPE_CHECKING, Optional
+import math
+from numbers import Real
+from typing import TYPE_CHECKING, Any, Dict
 
 from ..models import (
-    HeatExchangerInput,
     HeatExchangerResult,
-    LMTDInput,
-    LMTDResult,
-    EffectivenessNTUInput,
     EffectivenessNTUResult,
 )
 from ..exceptions import SDKValidationError
+from .._validation import require_positive
 
 if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import ArrayLike
     from ..client import EngiVaultClient
 
+# Flow arrangement names to the integer codes used by the array kernels
+# (see engivault._kernels); unknown names fall back to counterflow
+_ARRANGEMENT_CODES = {"counterflow": 0, "parallel": 1, "crossflow_unmixed": 2}
+
+
+def _local_lmtd(
+    t_hot_in: float,
+    t_hot_out: float,
+    t_cold_in: float,
+    t_cold_out: float,
+    flow_arrangement: str,
+) -> float:
+    """LMTD with the same formula and near-equal tolerance as the API."""
+    if flow_arrangement == "parallel":
+        delta_t1 = t_hot_in - t_cold_in
+        delta_t2 = t_hot_out - t_cold_out
+    else:
+        delta_t1 = t_hot_in - t_cold_out
+        delta_t2 = t_hot_out - t_cold_in
+    
+    if abs(delta_t1 - delta_t2) < 0.01:
+        return (delta_t1 + delta_t2) / 2
+    return (delta_t1 - delta_t2) / math.log(delta_t1 / delta_t2)
+
+
+def _local_effectiveness(ntu: float, capacity_ratio: float, flow_arrangement: str) -> float:
+    """
+    Uncapped effectiveness with the same correlations as the API.
+
+    The crossflow correlation is also the one
+    ``HeatExchangerSizing.calculate_effectiveness`` uses.
+    """
+    arrangement = flow_arrangement.lower()
+    if arrangement == "parallel":
+        return (1 - math.exp(-ntu * (1 + capacity_ratio))) / (1 + capacity_ratio)
+    if arrangement == "crossflow_unmixed":
+        if capacity_ratio == 0:
+            # Limit of the correlation as the capacity ratio goes to zero
+            return 1 - math.exp(-ntu)
+        return 1 - math.exp(
+            (ntu ** 0.22 / capacity_ratio) * (math.exp(-capacity_ratio * ntu ** 0.78) - 1)
+        )
+    if abs(capacity_ratio - 1) < 0.001:
+        return ntu / (1 + ntu)
+    e = math.exp(-ntu * (1 - capacity_ratio))
+    return (1 - e) / (1 - capacity_ratio * e)
+
 
 class HeatTransferModule:
-    """Heat transfer calculations module."""
+    """
+    Heat transfer calculations module.
+    
+    Request bodies are built directly from the checked arguments rather
+    than through the pydantic input models.
+    """
     
     def __init__(self, client: "EngiVaultClient"):
         self.client = client
@@ -34,7 +87,8 @@ class HeatTransferModule:
         t_hot_out: float,
         t_cold_in: float,
         t_cold_out: float,
-        flow_arrangement: Optional[str] = None,
+        flow_arrangement: str = "counterflow",
+        cache: bool = False,
     ) -> HeatExchangerResult:
         """
         Calculate heat exchanger area using LMTD method.
@@ -47,6 +101,10 @@ class HeatTransferModule:
             t_cold_in: Cold fluid inlet temperature in K
             t_cold_out: Cold fluid outlet temperature in K
             flow_arrangement: Flow arrangement ('counterflow', 'parallel', 'crossflow')
+            cache: Reuse the result of an identical earlier call instead of
+                sending a new request (opt-in; the least recently used results
+                are dropped past ``RESULT_CACHE_MAXSIZE``, all by
+                ``client.clear_cache()``)
             
         Returns:
             HeatExchangerResult with area, LMTD, effectiveness, NTU, and capacity ratio
@@ -62,29 +120,38 @@ class HeatTransferModule:
             ... )
             >>> print(f"Required area: {result.area:.2f} m²")
         """
-        # Validate inputs
-        try:
-            input_data = HeatExchangerInput(
-                heat_duty=heat_duty,
-                overall_u=overall_u,
-                t_hot_in=t_hot_in,
-                t_hot_out=t_hot_out,
-                t_cold_in=t_cold_in,
-                t_cold_out=t_cold_out,
-                flow_arrangement=flow_arrangement or "counterflow",
-            )
-        except Exception as e:
-            raise SDKValidationError(f"Invalid input parameters: {str(e)}")
+        require_positive(
+            heat_duty=heat_duty,
+            overall_u=overall_u,
+            t_hot_in=t_hot_in,
+            t_hot_out=t_hot_out,
+            t_cold_in=t_cold_in,
+            t_cold_out=t_cold_out,
+        )
+        request_data = {
+            "heatDuty": heat_duty,
+            "overallU": overall_u,
+            "tHotIn": t_hot_in,
+            "tHotOut": t_hot_out,
+            "tColdIn": t_cold_in,
+            "tColdOut": t_cold_out,
+            "flowArrangement": flow_arrangement,
+        }
         
         # Make API request
-        response_data = self.client._make_request(
-            method="POST",
-            endpoint="/api/v1/heat-transfer/heat-exchanger-area",
-            data=input_data.dict(by_alias=True),
-        )
+        if cache:
+            response_data = self.client._make_request_cached(
+                "/api/v1/heat-transfer/heat-exchanger-area", request_data
+            )
+        else:
+            response_data = self.client._make_request(
+                method="POST",
+                endpoint="/api/v1/heat-transfer/heat-exchanger-area",
+                data=request_data,
+            )
         
         # Parse and return result
-        return HeatExchangerResult(**response_data)
+        return HeatExchangerResult.model_validate(response_data)
     
     def lmtd(
         self,
@@ -92,7 +159,9 @@ class HeatTransferModule:
         t_hot_out: float,
         t_cold_in: float,
         t_cold_out: float,
-        flow_arrangement: Optional[str] = None,
+        flow_arrangement: str = "counterflow",
+        local: bool = False,
+        cache: bool = False,
     ) -> float:
         """
         Calculate Log Mean Temperature Difference (LMTD).
@@ -103,6 +172,12 @@ class HeatTransferModule:
             t_cold_in: Cold fluid inlet temperature in K
             t_cold_out: Cold fluid outlet temperature in K
             flow_arrangement: Flow arrangement ('counterflow', 'parallel')
+            local: Evaluate the closed form in-process instead of calling
+                the API; useful in tight parameter sweeps
+            cache: Reuse the result of an identical earlier call instead of
+                sending a new request (opt-in; the least recently used results
+                are dropped past ``RESULT_CACHE_MAXSIZE``, all by
+                ``client.clear_cache()``)
             
         Returns:
             LMTD in K
@@ -116,34 +191,86 @@ class HeatTransferModule:
             ... )
             >>> print(f"LMTD: {lmtd:.2f} K")
         """
-        # Validate inputs
-        try:
-            input_data = LMTDInput(
-                t_hot_in=t_hot_in,
-                t_hot_out=t_hot_out,
-                t_cold_in=t_cold_in,
-                t_cold_out=t_cold_out,
-                flow_arrangement=flow_arrangement or "counterflow",
+        request_data = self._lmtd_data(
+            t_hot_in, t_hot_out, t_cold_in, t_cold_out, flow_arrangement
+        )
+        if local:
+            return _local_lmtd(
+                t_hot_in, t_hot_out, t_cold_in, t_cold_out, request_data["flowArrangement"]
             )
-        except Exception as e:
-            raise SDKValidationError(f"Invalid input parameters: {str(e)}")
         
         # Make API request
-        response_data = self.client._make_request(
+        if cache:
+            response_data = self.client._make_request_cached(
+                "/api/v1/heat-transfer/lmtd", request_data
+            )
+        else:
+            response_data = self.client._make_request(
+                method="POST",
+                endpoint="/api/v1/heat-transfer/lmtd",
+                data=request_data,
+            )
+        
+        # Only the one field is needed, so skip building an LMTDResult
+        return float(response_data["lmtd"])
+    
+    async def almtd(
+        self,
+        t_hot_in: float,
+        t_hot_out: float,
+        t_cold_in: float,
+        t_cold_out: float,
+        flow_arrangement: str = "counterflow",
+        local: bool = False,
+    ) -> float:
+        """
+        Async version of :meth:`lmtd`.
+        
+        Example:
+            >>> lmtd = await client.heat_transfer.almtd(
+            ...     t_hot_in=353, t_hot_out=333, t_cold_in=293, t_cold_out=313
+            ... )
+        """
+        request_data = self._lmtd_data(
+            t_hot_in, t_hot_out, t_cold_in, t_cold_out, flow_arrangement
+        )
+        if local:
+            return _local_lmtd(
+                t_hot_in, t_hot_out, t_cold_in, t_cold_out, request_data["flowArrangement"]
+            )
+        
+        response_data = await self.client._amake_request(
             method="POST",
             endpoint="/api/v1/heat-transfer/lmtd",
-            data=input_data.dict(by_alias=True),
+            data=request_data,
         )
         
-        # Parse and return result
-        result = LMTDResult(**response_data)
-        return result.lmtd
+        return float(response_data["lmtd"])
+    
+    @staticmethod
+    def _lmtd_data(
+        t_hot_in: float,
+        t_hot_out: float,
+        t_cold_in: float,
+        t_cold_out: float,
+        flow_arrangement: str,
+    ) -> Dict[str, Any]:
+        """Build the LMTD request body."""
+        return {
+            "tHotIn": t_hot_in,
+            "tHotOut": t_hot_out,
+            "tColdIn": t_cold_in,
+            "tColdOut": t_cold_out,
+            "flowArrangement": flow_arrangement,
+        }
     
     def effectiveness_ntu(
         self,
         ntu: float,
         capacity_ratio: float,
         flow_arrangement: str,
+        local: bool = False,
+        cache: bool = False,
     ) -> EffectivenessNTUResult:
         """
         Calculate heat exchanger effectiveness using NTU method.
@@ -152,6 +279,12 @@ class HeatTransferModule:
             ntu: Number of transfer units
             capacity_ratio: Capacity rate ratio (Cmin/Cmax, 0-1)
             flow_arrangement: Flow arrangement ('counterflow', 'parallel', 'crossflow_unmixed')
+            local: Evaluate the correlation in-process instead of calling
+                the API
+            cache: Reuse the result of an identical earlier call instead of
+                sending a new request (opt-in; the least recently used results
+                are dropped past ``RESULT_CACHE_MAXSIZE``, all by
+                ``client.clear_cache()``)
             
         Returns:
             EffectivenessNTUResult with effectiveness and maximum heat transfer factor
@@ -164,25 +297,112 @@ class HeatTransferModule:
             ... )
             >>> print(f"Effectiveness: {result.effectiveness:.1%}")
         """
-        # Validate inputs
-        try:
-            input_data = EffectivenessNTUInput(
-                ntu=ntu,
-                capacity_ratio=capacity_ratio,
-                flow_arrangement=flow_arrangement,
+        require_positive(ntu=ntu)
+        if not (isinstance(capacity_ratio, Real) and 0 <= capacity_ratio <= 1):
+            raise SDKValidationError("Capacity ratio must be between 0 and 1")
+        if local:
+            effectiveness = _local_effectiveness(ntu, capacity_ratio, flow_arrangement)
+            return EffectivenessNTUResult(
+                effectiveness=min(effectiveness, 1.0),
+                max_heat_transfer=effectiveness,
             )
-        except Exception as e:
-            raise SDKValidationError(f"Invalid input parameters: {str(e)}")
+        request_data = {
+            "ntu": ntu,
+            "capacityRatio": capacity_ratio,
+            "flowArrangement": flow_arrangement,
+        }
         
         # Make API request
-        response_data = self.client._make_request(
-            method="POST",
-            endpoint="/api/v1/heat-transfer/effectiveness-ntu",
-            data=input_data.dict(by_alias=True),
-        )
+        if cache:
+            response_data = self.client._make_request_cached(
+                "/api/v1/heat-transfer/effectiveness-ntu", request_data
+            )
+        else:
+            response_data = self.client._make_request(
+                method="POST",
+                endpoint="/api/v1/heat-transfer/effectiveness-ntu",
+                data=request_data,
+            )
         
         # Parse and return result
-        return EffectivenessNTUResult(**response_data)
+        return EffectivenessNTUResult.model_validate(response_data)
+    
+    def lmtd_batch(
+        self,
+        t_hot_in: "ArrayLike",
+        t_hot_out: "ArrayLike",
+        t_cold_in: "ArrayLike",
+        t_cold_out: "ArrayLike",
+        flow_arrangement: str = "counterflow",
+    ) -> "np.ndarray":
+        """
+        Vectorized local :meth:`lmtd`.
+        
+        Evaluated in-process point by point in one compiled, multi-threaded
+        kernel (when Numba is installed); no request is sent.
+        
+        Returns:
+            LMTD in K, shaped like the broadcast inputs
+            
+        Example:
+            >>> lmtd = client.heat_transfer.lmtd_batch(
+            ...     353, 333, 293, np.linspace(300, 320, 1000)
+            ... )
+        """
+        import numpy as np
+        from .. import _kernels
+        
+        columns = np.broadcast_arrays(*(
+            np.asarray(value, dtype=np.float64)
+            for value in (t_hot_in, t_hot_out, t_cold_in, t_cold_out)
+        ))
+        out = np.empty(columns[0].shape)
+        _kernels.lmtd_batch(
+            *(_kernels.as_array(column.ravel()) for column in columns),
+            _ARRANGEMENT_CODES.get(flow_arrangement, 0),
+            out.reshape(-1),
+        )
+        return out
+    
+    def effectiveness_ntu_batch(
+        self,
+        ntu: "ArrayLike",
+        capacity_ratio: "ArrayLike",
+        flow_arrangement: str,
+    ) -> "np.ndarray":
+        """
+        Vectorized local :meth:`effectiveness_ntu`.
+        
+        Evaluated in-process point by point in one compiled, multi-threaded
+        kernel (when Numba is installed); no request is sent.
+        
+        Returns:
+            Effectiveness (0-1), shaped like the broadcast inputs
+            
+        Example:
+            >>> ntu, cr = np.meshgrid(np.linspace(0.1, 5, 50), np.linspace(0, 1, 11))
+            >>> eff = client.heat_transfer.effectiveness_ntu_batch(ntu, cr, "counterflow")
+        """
+        import numpy as np
+        from .. import _kernels
+        
+        ntu, capacity_ratio = np.broadcast_arrays(
+            np.asarray(ntu, dtype=np.float64),
+            np.asarray(capacity_ratio, dtype=np.float64),
+        )
+        if not (ntu > 0).all():
+            require_positive(ntu=ntu.min())
+        if not ((capacity_ratio >= 0) & (capacity_ratio <= 1)).all():
+            raise SDKValidationError("Capacity ratio must be between 0 and 1")
+        
+        out = np.empty(ntu.shape)
+        _kernels.effectiveness_batch(
+            _kernels.as_array(ntu.ravel()),
+            _kernels.as_array(capacity_ratio.ravel()),
+            _ARRANGEMENT_CODES.get(flow_arrangement.lower(), 0),
+            out.reshape(-1),
+        )
+        return out
     
     def heat_exchanger_sizing(
         self,
@@ -232,22 +452,13 @@ class HeatTransferModule:
             flow_arrangement=flow_arrangement
         )
         
-        # Get LMTD
-        lmtd_value = self.lmtd(
-            t_hot_in=hot_fluid_inlet,
-            t_hot_out=hot_fluid_outlet,
-            t_cold_in=cold_fluid_inlet,
-            t_cold_out=cold_fluid_outlet,
-            flow_arrangement=flow_arrangement
-        )
-        
         # Calculate additional metrics
         hot_capacity_rate = heat_duty / (hot_fluid_inlet - hot_fluid_outlet)
         cold_capacity_rate = heat_duty / (cold_fluid_outlet - cold_fluid_inlet)
         
         return {
             "area": hx_result.area,
-            "lmtd": lmtd_value,
+            "lmtd": hx_result.lmtd,
             "effectiveness": hx_result.effectiveness,
             "ntu": hx_result.ntu,
             "capacity_ratio": hx_result.capacity_ratio,
@@ -257,3 +468,88 @@ class HeatTransferModule:
             "overall_u": overall_u,
             "flow_arrangement": flow_arrangement
         }
+    
+    def heat_exchanger_sizing_batch(
+        self,
+        heat_duty: "ArrayLike",
+        hot_fluid_inlet: "ArrayLike",
+        hot_fluid_outlet: "ArrayLike",
+        cold_fluid_inlet: "ArrayLike",
+        cold_fluid_outlet: "ArrayLike",
+        overall_u: "ArrayLike",
+        flow_arrangement: str = "counterflow"
+    ) -> Dict[str, Any]:
+        """
+        Vectorized local :meth:`heat_exchanger_sizing`.
+        
+        Evaluates the same LMTD, area, NTU and effectiveness relations as the
+        API in-process, with arguments broadcast like NumPy operands; no
+        request is sent.
+        
+        Returns:
+            Dict with the same keys as :meth:`heat_exchanger_sizing`, each
+            (except ``flow_arrangement``) an array of the broadcast shape
+            
+        Example:
+            >>> sizing = client.heat_transfer.heat_exchanger_sizing_batch(
+            ...     heat_duty=np.linspace(5e4, 2e5, 100),
+            ...     hot_fluid_inlet=353,
+            ...     hot_fluid_outlet=333,
+            ...     cold_fluid_inlet=293,
+            ...     cold_fluid_outlet=313,
+            ...     overall_u=500
+            ... )
+            >>> sizing["area"].max()
+        """
+        import numpy as np
+        from .. import _kernels
+        
+        names = ("heat_duty", "hot_fluid_inlet", "hot_fluid_outlet",
+                 "cold_fluid_inlet", "cold_fluid_outlet", "overall_u")
+        columns = np.broadcast_arrays(*(
+            np.asarray(value, dtype=np.float64)
+            for value in (heat_duty, hot_fluid_inlet, hot_fluid_outlet,
+                          cold_fluid_inlet, cold_fluid_outlet, overall_u)
+        ))
+        for name, column in zip(names, columns):
+            if not (column > 0).all():
+                require_positive(**{name: column.min()})
+        heat_duty, hot_in, hot_out, cold_in, cold_out, overall_u = columns
+        shape = heat_duty.shape
+        
+        # Like the API, LMTD matches the arrangement as given while the
+        # effectiveness correlation ignores its case
+        lmtd = np.empty(shape)
+        _kernels.lmtd_batch(
+            *(_kernels.as_array(column.ravel()) for column in (hot_in, hot_out, cold_in, cold_out)),
+            _ARRANGEMENT_CODES.get(flow_arrangement, 0),
+            lmtd.reshape(-1),
+        )
+        area = heat_duty / (overall_u * lmtd)
+        
+        # Hot and cold capacity rates in one division
+        capacity_rates = heat_duty / np.stack((hot_in - hot_out, cold_out - cold_in))
+        c_min = capacity_rates.min(axis=0)
+        capacity_ratio = c_min / capacity_rates.max(axis=0)
+        ntu = overall_u * area / c_min
+        
+        effectiveness = np.empty(shape)
+        _kernels.effectiveness_batch(
+            _kernels.as_array(ntu.ravel()),
+            _kernels.as_array(capacity_ratio.ravel()),
+            _ARRANGEMENT_CODES.get(flow_arrangement.lower(), 0),
+            effectiveness.reshape(-1),
+        )
+        
+        return {
+            "area": area,
+            "lmtd": lmtd,
+            "effectiveness": effectiveness,
+            "ntu": ntu,
+            "capacity_ratio": capacity_ratio,
+            "hot_capacity_rate": capacity_rates[0],
+            "cold_capacity_rate": capacity_rates[1],
+            "heat_duty": heat_duty,
+            "overall_u": overall_u,
+            "flow_arrangement": flow_arrangement
+        }
@@ -4,22 +4,67 @@ EngiVault Hydraulics Module
 Hydraulic calculations including pressure drop and flow rate analysis.
 """
 
-from typing import TYPE_CHECKING, Optional
+import math
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List
 
-from ..models import (
-    PressureDropInput,
-    PressureDropResult,
-    FlowRateInput,
-    FlowRateResult,
-)
-from ..exceptions import SDKValidationError
+from ..models import PressureDropResult, FlowRateResult
+from .._validation import require_positive
+from ..client import BATCH_CONCURRENCY
 
 if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import ArrayLike
     from ..client import EngiVaultClient
 
+# Request columns of the batch pressure drop endpoint and the result
+# columns it returns, as (API key, Python name) pairs
+_PRESSURE_DROP_COLUMNS = (
+    ("flowRate", "flow_rate"),
+    ("pipeDiameter", "pipe_diameter"),
+    ("pipeLength", "pipe_length"),
+    ("fluidDensity", "fluid_density"),
+    ("fluidViscosity", "fluid_viscosity"),
+    ("pipeRoughness", "pipe_roughness"),
+)
+_PRESSURE_DROP_RESULT_COLUMNS = (
+    ("pressureDrop", "pressure_drop"),
+    ("reynoldsNumber", "reynolds_number"),
+    ("frictionFactor", "friction_factor"),
+    ("velocity", "velocity"),
+)
+
+
+def _local_pressure_drop(
+    flow_rate: float,
+    pipe_diameter: float,
+    pipe_length: float,
+    fluid_density: float,
+    fluid_viscosity: float,
+) -> Dict[str, float]:
+    """Pressure drop with the same correlations as the API, keyed like its response."""
+    velocity = flow_rate / (math.pi * (pipe_diameter / 2) ** 2)
+    reynolds_number = fluid_density * velocity * pipe_diameter / fluid_viscosity
+    if reynolds_number < 2300:
+        friction_factor = 64 / reynolds_number
+    else:
+        # Blasius, as used by the API for turbulent flow
+        friction_factor = 0.316 / reynolds_number ** 0.25
+    return {
+        "pressureDrop": friction_factor * pipe_length * fluid_density * velocity ** 2
+        / (2 * pipe_diameter),
+        "reynoldsNumber": reynolds_number,
+        "frictionFactor": friction_factor,
+        "velocity": velocity,
+    }
+
 
 class HydraulicsModule:
-    """Hydraulics calculations module."""
+    """
+    Hydraulics calculations module.
+    
+    Request bodies are built directly from the checked arguments rather
+    than through the pydantic input models.
+    """
     
     def __init__(self, client: "EngiVaultClient"):
         self.client = client
@@ -31,7 +76,9 @@ class HydraulicsModule:
         pipe_length: float,
         fluid_density: float,
         fluid_viscosity: float,
-        pipe_roughness: Optional[float] = None,
+        pipe_roughness: float = 0.00015,
+        local: bool = False,
+        cache: bool = False,
     ) -> PressureDropResult:
         """
         Calculate pressure drop using the Darcy-Weisbach equation.
@@ -43,6 +90,12 @@ class HydraulicsModule:
             fluid_density: Fluid density in kg/m³
             fluid_viscosity: Fluid viscosity in Pa·s
             pipe_roughness: Pipe roughness in meters (optional, default: 0.00015)
+            local: Evaluate the API's correlations in-process instead of
+                calling the API; useful in tight parameter sweeps
+            cache: Reuse the result of an identical earlier call instead of
+                sending a new request (opt-in; the least recently used results
+                are dropped past ``RESULT_CACHE_MAXSIZE``, all by
+                ``client.clear_cache()``)
             
         Returns:
             PressureDropResult with pressure drop, Reynolds number, friction factor, and velocity
@@ -57,28 +110,184 @@ class HydraulicsModule:
             ... )
             >>> print(f"Pressure drop: {result.pressure_drop:.2f} Pa")
         """
-        # Validate inputs
-        try:
-            input_data = PressureDropInput(
-                flow_rate=flow_rate,
-                pipe_diameter=pipe_diameter,
-                pipe_length=pipe_length,
-                fluid_density=fluid_density,
-                fluid_viscosity=fluid_viscosity,
-                pipe_roughness=pipe_roughness or 0.00015,
-            )
-        except Exception as e:
-            raise SDKValidationError(f"Invalid input parameters: {str(e)}")
+        request_data = self._pressure_drop_data(
+            flow_rate, pipe_diameter, pipe_length, fluid_density, fluid_viscosity, pipe_roughness
+        )
+        if local:
+            return PressureDropResult.model_validate(_local_pressure_drop(
+                flow_rate, pipe_diameter, pipe_length, fluid_density, fluid_viscosity
+            ))
         
         # Make API request
-        response_data = self.client._make_request(
+        if cache:
+            response_data = self.client._make_request_cached(
+                "/api/v1/hydraulics/pressure-drop", request_data
+            )
+        else:
+            response_data = self.client._make_request(
+                method="POST",
+                endpoint="/api/v1/hydraulics/pressure-drop",
+                data=request_data,
+            )
+        
+        # Parse and return result
+        return PressureDropResult.model_validate(response_data)
+    
+    async def apressure_drop(
+        self,
+        flow_rate: float,
+        pipe_diameter: float,
+        pipe_length: float,
+        fluid_density: float,
+        fluid_viscosity: float,
+        pipe_roughness: float = 0.00015,
+    ) -> PressureDropResult:
+        """
+        Async version of :meth:`pressure_drop`.
+        
+        Example:
+            >>> results = await asyncio.gather(*(
+            ...     client.hydraulics.apressure_drop(q, 0.1, 100, 1000, 0.001)
+            ...     for q in (0.01, 0.02, 0.05)
+            ... ))
+        """
+        request_data = self._pressure_drop_data(
+            flow_rate, pipe_diameter, pipe_length, fluid_density, fluid_viscosity, pipe_roughness
+        )
+        
+        response_data = await self.client._amake_request(
             method="POST",
             endpoint="/api/v1/hydraulics/pressure-drop",
-            data=input_data.dict(by_alias=True),
+            data=request_data,
         )
         
-        # Parse and return result
-        return PressureDropResult(**response_data)
+        return PressureDropResult.model_validate(response_data)
+    
+    async def apressure_drop_many(
+        self,
+        params: Iterable[Dict[str, Any]],
+        concurrency: int = BATCH_CONCURRENCY,
+    ) -> List[PressureDropResult]:
+        """
+        Calculate pressure drop for many independent points concurrently.
+        
+        Each item holds the keyword arguments of :meth:`pressure_drop`. All
+        points are validated before any request is sent, then posted over
+        one pooled async connection, so a sweep costs roughly one round trip
+        rather than one per point. Prefer :meth:`pressure_drop_batch` when
+        NumPy is available; it sends a single request.
+        
+        Args:
+            params: Keyword arguments for each point
+            concurrency: Maximum number of requests in flight
+            
+        Returns:
+            PressureDropResult for each point, in input order
+            
+        Example:
+            >>> results = await client.hydraulics.apressure_drop_many(
+            ...     {"flow_rate": q, "pipe_diameter": 0.1, "pipe_length": 100,
+            ...      "fluid_density": 1000, "fluid_viscosity": 0.001}
+            ...     for q in (0.01, 0.02, 0.05)
+            ... )
+        """
+        rows = [self._pressure_drop_data(**point) for point in params]
+        responses = await self.client.abatch(
+            "/api/v1/hydraulics/pressure-drop", rows, concurrency
+        )
+        return [PressureDropResult.model_validate(data) for data in responses]
+    
+    def pressure_drop_many(
+        self,
+        params: Iterable[Dict[str, Any]],
+        concurrency: int = BATCH_CONCURRENCY,
+    ) -> List[PressureDropResult]:
+        """
+        Blocking version of :meth:`apressure_drop_many`.
+        
+        Runs its own event loop, so it cannot be called from async code.
+        """
+        return self.client._run_blocking(self.apressure_drop_many(params, concurrency))
+    
+    def pressure_drop_batch(
+        self,
+        flow_rate: "ArrayLike",
+        pipe_diameter: "ArrayLike",
+        pipe_length: "ArrayLike",
+        fluid_density: "ArrayLike",
+        fluid_viscosity: "ArrayLike",
+        pipe_roughness: "ArrayLike" = 0.00015,
+        local: bool = False,
+    ) -> Dict[str, "np.ndarray"]:
+        """
+        Calculate pressure drop for many points in a single request.
+        
+        Arguments are broadcast against each other like NumPy operands, so
+        scalars, 1-D sweeps and 2-D grids can be mixed. All points are
+        validated locally and sent as one columnar POST, costing one round
+        trip instead of one per point. The API accepts up to 10000 points
+        per request. With ``local=True`` the API's correlations are applied
+        in-process with array operations instead, with no request and no
+        size limit. Requires NumPy.
+        
+        Returns:
+            Dict mapping ``pressure_drop``, ``reynolds_number``,
+            ``friction_factor`` and ``velocity`` to arrays of the broadcast
+            input shape
+            
+        Example:
+            >>> result = client.hydraulics.pressure_drop_batch(
+            ...     flow_rate=np.linspace(0.01, 0.1, 50),
+            ...     pipe_diameter=0.1,
+            ...     pipe_length=100,
+            ...     fluid_density=1000,
+            ...     fluid_viscosity=0.001
+            ... )
+            >>> result["pressure_drop"].max()
+        """
+        import numpy as np
+        
+        columns = np.broadcast_arrays(*(
+            np.asarray(value, dtype=np.float64)
+            for value in (
+                flow_rate, pipe_diameter, pipe_length, fluid_density, fluid_viscosity,
+                pipe_roughness,
+            )
+        ))
+        for (_, name), column in zip(_PRESSURE_DROP_COLUMNS, columns):
+            if not (column > 0).all():
+                require_positive(**{name: column.min()})
+        
+        if local:
+            flow_rate, pipe_diameter, pipe_length, fluid_density, fluid_viscosity = columns[:5]
+            velocity = flow_rate / (np.pi * (pipe_diameter / 2) ** 2)
+            reynolds_number = fluid_density * velocity * pipe_diameter / fluid_viscosity
+            friction_factor = np.where(
+                reynolds_number < 2300, 64 / reynolds_number, 0.316 / reynolds_number ** 0.25
+            )
+            return {
+                "pressure_drop": friction_factor * pipe_length * fluid_density * velocity ** 2
+                / (2 * pipe_diameter),
+                "reynolds_number": reynolds_number,
+                "friction_factor": friction_factor,
+                "velocity": velocity,
+            }
+        
+        request_data = {
+            key: column.ravel().tolist()
+            for (key, _), column in zip(_PRESSURE_DROP_COLUMNS, columns)
+        }
+        response_data = self.client._make_request(
+            method="POST",
+            endpoint="/api/v1/hydraulics/pressure-drop/batch",
+            data=request_data,
+        )
+        
+        shape = columns[0].shape
+        return {
+            name: np.asarray(response_data[key], dtype=np.float64).reshape(shape)
+            for key, name in _PRESSURE_DROP_RESULT_COLUMNS
+        }
     
     def flow_rate(
         self,
@@ -87,7 +296,8 @@ class HydraulicsModule:
         pipe_length: float,
         fluid_density: float,
         fluid_viscosity: float,
-        pipe_roughness: Optional[float] = None,
+        pipe_roughness: float = 0.00015,
+        cache: bool = False,
     ) -> FlowRateResult:
         """
         Calculate flow rate from pressure drop using iterative method.
@@ -99,6 +309,10 @@ class HydraulicsModule:
             fluid_density: Fluid density in kg/m³
             fluid_viscosity: Fluid viscosity in Pa·s
             pipe_roughness: Pipe roughness in meters (optional, default: 0.00015)
+            cache: Reuse the result of an identical earlier call instead of
+                sending a new request (opt-in; the least recently used results
+                are dropped past ``RESULT_CACHE_MAXSIZE``, all by
+                ``client.clear_cache()``)
             
         Returns:
             FlowRateResult with flow rate, velocity, and Reynolds number
@@ -113,25 +327,102 @@ class HydraulicsModule:
             ... )
             >>> print(f"Flow rate: {result.flow_rate:.4f} m³/s")
         """
-        # Validate inputs
-        try:
-            input_data = FlowRateInput(
-                pressure_drop=pressure_drop,
-                pipe_diameter=pipe_diameter,
-                pipe_length=pipe_length,
-                fluid_density=fluid_density,
-                fluid_viscosity=fluid_viscosity,
-                pipe_roughness=pipe_roughness or 0.00015,
-            )
-        except Exception as e:
-            raise SDKValidationError(f"Invalid input parameters: {str(e)}")
+        request_data = self._flow_rate_data(
+            pressure_drop, pipe_diameter, pipe_length, fluid_density, fluid_viscosity, pipe_roughness
+        )
         
         # Make API request
-        response_data = self.client._make_request(
+        if cache:
+            response_data = self.client._make_request_cached(
+                "/api/v1/hydraulics/flow-rate", request_data
+            )
+        else:
+            response_data = self.client._make_request(
+                method="POST",
+                endpoint="/api/v1/hydraulics/flow-rate",
+                data=request_data,
+            )
+        
+        # Parse and return result
+        return FlowRateResult.model_validate(response_data)
+    
+    async def aflow_rate(
+        self,
+        pressure_drop: float,
+        pipe_diameter: float,
+        pipe_length: float,
+        fluid_density: float,
+        fluid_viscosity: float,
+        pipe_roughness: float = 0.00015,
+    ) -> FlowRateResult:
+        """
+        Async version of :meth:`flow_rate`.
+        
+        Example:
+            >>> result = await client.hydraulics.aflow_rate(10000, 0.1, 100, 1000, 0.001)
+        """
+        request_data = self._flow_rate_data(
+            pressure_drop, pipe_diameter, pipe_length, fluid_density, fluid_viscosity, pipe_roughness
+        )
+        
+        response_data = await self.client._amake_request(
             method="POST",
             endpoint="/api/v1/hydraulics/flow-rate",
-            data=input_data.dict(by_alias=True),
+            data=request_data,
         )
         
-        # Parse and return result
-        return FlowRateResult(**response_data)
+        return FlowRateResult.model_validate(response_data)
+    
+    @staticmethod
+    def _pressure_drop_data(
+        flow_rate: float,
+        pipe_diameter: float,
+        pipe_length: float,
+        fluid_density: float,
+        fluid_viscosity: float,
+        pipe_roughness: float = 0.00015,
+    ) -> Dict[str, Any]:
+        """Validate pressure drop inputs and build the request body."""
+        require_positive(
+            flow_rate=flow_rate,
+            pipe_diameter=pipe_diameter,
+            pipe_length=pipe_length,
+            fluid_density=fluid_density,
+            fluid_viscosity=fluid_viscosity,
+            pipe_roughness=pipe_roughness,
+        )
+        return {
+            "flowRate": flow_rate,
+            "pipeDiameter": pipe_diameter,
+            "pipeLength": pipe_length,
+            "fluidDensity": fluid_density,
+            "fluidViscosity": fluid_viscosity,
+            "pipeRoughness": pipe_roughness,
+        }
+    
+    @staticmethod
+    def _flow_rate_data(
+        pressure_drop: float,
+        pipe_diameter: float,
+        pipe_length: float,
+        fluid_density: float,
+        fluid_viscosity: float,
+        pipe_roughness: float = 0.00015,
+    ) -> Dict[str, Any]:
+        """Validate flow rate inputs and build the request body."""
+        require_positive(
+            pressure_drop=pressure_drop,
+            pipe_diameter=pipe_diameter,
+            pipe_length=pipe_length,
+            fluid_density=fluid_density,
+            fluid_viscosity=fluid_viscosity,
+            pipe_roughness=pipe_roughness,
+        )
+        return {
+            "pressureDrop": pressure_drop,
+            "pipeDiameter": pipe_diameter,
+            "pipeLength": pipe_length,
+            "fluidDensity": fluid_density,
+            "fluidViscosity": fluid_viscosity,
+            "pipeRoughness": pipe_roughness,
+        }
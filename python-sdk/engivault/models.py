@@ -8,6 +8,34 @@ from typing import Optional
 from pydantic import BaseModel, Field, validator
 
 
+__all__ = [
+    "PressureDropInput",
+    "PressureDropResult",
+    "FlowRateInput",
+    "FlowRateResult",
+    "PumpPerformanceInput",
+    "PumpPerformanceResult",
+    "NPSHInput",
+    "NPSHResult",
+    "APIResponse",
+    "UsageStats",
+    "HeatExchangerInput",
+    "HeatExchangerResult",
+    "LMTDInput",
+    "LMTDResult",
+    "EffectivenessNTUInput",
+    "EffectivenessNTUResult",
+    "OpenChannelFlowInput",
+    "OpenChannelFlowResult",
+    "CompressibleFlowInput",
+    "CompressibleFlowResult",
+    "BoundaryLayerInput",
+    "BoundaryLayerResult",
+    "ExternalFlowInput",
+    "ExternalFlowResult",
+]
+
+
 def to_camel_case(snake_str: str) -> str:
     """Convert snake_case to camelCase."""
     components = snake_str.split('_')
@@ -93,6 +121,13 @@ class NPSHResult(CamelCaseModel):
 
 class APIResponse(BaseModel):
     """Standard API response wrapper."""
+    
+    # Envelopes are read-only once parsed; unknown envelope keys are dropped
+    model_config = {
+        "extra": "ignore",
+        "frozen": True,
+    }
+    
     success: bool = Field(..., description="Whether the request was successful")
     data: Optional[dict] = Field(None, description="Response data")
     error: Optional[str] = Field(None, description="Error message if failed")
@@ -4,22 +4,24 @@ EngiVault Pumps Module
 Pump performance and NPSH calculations.
 """
 
+from numbers import Real
 from typing import TYPE_CHECKING
 
-from ..models import (
-    PumpPerformanceInput,
-    PumpPerformanceResult,
-    NPSHInput,
-    NPSHResult,
-)
+from ..models import PumpPerformanceResult, NPSHResult
 from ..exceptions import SDKValidationError
+from .._validation import require_positive
 
 if TYPE_CHECKING:
     from ..client import EngiVaultClient
 
 
 class PumpsModule:
-    """Pump calculations module."""
+    """
+    Pump calculations module.
+    
+    Request bodies are built directly from the checked arguments rather
+    than through the pydantic input models.
+    """
     
     def __init__(self, client: "EngiVaultClient"):
         self.client = client
@@ -30,6 +32,7 @@ class PumpsModule:
         head: float,
         efficiency: float,
         power: float,
+        cache: bool = False,
     ) -> PumpPerformanceResult:
         """
         Calculate pump performance parameters.
@@ -39,6 +42,10 @@ class PumpsModule:
             head: Pump head in meters
             efficiency: Pump efficiency (0-1)
             power: Pump power in watts
+            cache: Reuse the result of an identical earlier call instead of
+                sending a new request (opt-in; the least recently used results
+                are dropped past ``RESULT_CACHE_MAXSIZE``, all by
+                ``client.clear_cache()``)
             
         Returns:
             PumpPerformanceResult with hydraulic power, brake power, specific speed, and efficiency
@@ -52,26 +59,30 @@ class PumpsModule:
             ... )
             >>> print(f"Hydraulic power: {result.hydraulic_power:.3f} kW")
         """
-        # Validate inputs
-        try:
-            input_data = PumpPerformanceInput(
-                flow_rate=flow_rate,
-                head=head,
-                efficiency=efficiency,
-                power=power,
-            )
-        except Exception as e:
-            raise SDKValidationError(f"Invalid input parameters: {str(e)}")
+        require_positive(flow_rate=flow_rate, head=head, efficiency=efficiency, power=power)
+        if efficiency > 1:
+            raise SDKValidationError("Efficiency must be between 0 and 1")
+        request_data = {
+            "flowRate": flow_rate,
+            "head": head,
+            "efficiency": efficiency,
+            "power": power,
+        }
         
         # Make API request
-        response_data = self.client._make_request(
-            method="POST",
-            endpoint="/api/v1/pumps/performance",
-            data=input_data.dict(by_alias=True),
-        )
+        if cache:
+            response_data = self.client._make_request_cached(
+                "/api/v1/pumps/performance", request_data
+            )
+        else:
+            response_data = self.client._make_request(
+                method="POST",
+                endpoint="/api/v1/pumps/performance",
+                data=request_data,
+            )
         
         # Parse and return result
-        return PumpPerformanceResult(**response_data)
+        return PumpPerformanceResult.model_validate(response_data)
     
     def npsh(
         self,
@@ -80,6 +91,7 @@ class PumpsModule:
         fluid_density: float,
         suction_velocity: float,
         suction_losses: float,
+        cache: bool = False,
     ) -> NPSHResult:
         """
         Calculate Net Positive Suction Head (NPSH).
@@ -90,6 +102,10 @@ class PumpsModule:
             fluid_density: Fluid density in kg/m³
             suction_velocity: Suction velocity in m/s
             suction_losses: Suction losses in meters
+            cache: Reuse the result of an identical earlier call instead of
+                sending a new request (opt-in; the least recently used results
+                are dropped past ``RESULT_CACHE_MAXSIZE``, all by
+                ``client.clear_cache()``)
             
         Returns:
             NPSHResult with available NPSH, required NPSH, margin, and cavitation risk
@@ -105,24 +121,32 @@ class PumpsModule:
             >>> if result.is_cavitation_risk:
             ...     print("Warning: Cavitation risk detected!")
         """
-        # Validate inputs
-        try:
-            input_data = NPSHInput(
-                suction_pressure=suction_pressure,
-                vapor_pressure=vapor_pressure,
-                fluid_density=fluid_density,
-                suction_velocity=suction_velocity,
-                suction_losses=suction_losses,
-            )
-        except Exception as e:
-            raise SDKValidationError(f"Invalid input parameters: {str(e)}")
+        if not (isinstance(suction_pressure, Real) and isinstance(vapor_pressure, Real)):
+            raise SDKValidationError("Suction and vapor pressure must be numbers")
+        require_positive(
+            fluid_density=fluid_density,
+            suction_velocity=suction_velocity,
+            suction_losses=suction_losses,
+        )
+        request_data = {
+            "suctionPressure": suction_pressure,
+            "vaporPressure": vapor_pressure,
+            "fluidDensity": fluid_density,
+            "suctionVelocity": suction_velocity,
+            "suctionLosses": suction_losses,
+        }
         
         # Make API request
-        response_data = self.client._make_request(
-            method="POST",
-            endpoint="/api/v1/pumps/npsh",
-            data=input_data.dict(by_alias=True),
-        )
+        if cache:
+            response_data = self.client._make_request_cached(
+                "/api/v1/pumps/npsh", request_data
+            )
+        else:
+            response_data = self.client._make_request(
+                method="POST",
+                endpoint="/api/v1/pumps/npsh",
+                data=request_data,
+            )
         
         # Parse and return result
-        return NPSHResult(**response_data)
+        return NPSHResult.model_validate(response_data)
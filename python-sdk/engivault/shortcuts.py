@@ -10,20 +10,67 @@ Example:
     >>> result = ev.pressure_drop(diameter=0.1, length=100, ...)
 """
 
-from typing import Optional, Dict, Any
-from .client import EngiVaultClient
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import (
+    Optional, Callable, Dict, Any, Iterable, Iterator, List, Sequence, Tuple, TypeVar, Union,
+)
+from .client import BATCH_CONCURRENCY, EngiVaultClient
+from .exceptions import SDKValidationError
+from .hydraulics import HydraulicsModule
+from .models import (
+    FlowRateResult,
+    HeatExchangerResult,
+    OpenChannelFlowResult,
+    PressureDropResult,
+)
 
-# Global client instance
+# Global client instance, replaced under _global_lock so concurrent init()
+# calls from several threads leave exactly one client installed
 _global_client: Optional[EngiVaultClient] = None
+_global_lock = threading.Lock()
 
+# (api_key, config) the global client was built with, so repeating init()
+# with the same settings keeps it and its warm connection pool
+_global_config: Optional[Tuple[Optional[str], Dict[str, Any]]] = None
 
-def init(api_key: Optional[str] = None, **config) -> EngiVaultClient:
+# Whether shortcuts memoize results by default; set by init(cache=...)
+_cache_results = False
+
+# Whether shortcuts with an in-process path use it by default; set by
+# init(local=...)
+_local_results = False
+
+_T = TypeVar("_T")
+
+
+def init(
+    api_key: Optional[str] = None,
+    cache: bool = False,
+    warmup: bool = False,
+    local: bool = False,
+    **config
+) -> EngiVaultClient:
     """
     Initialize the global EngiVault client.
     
     Args:
         api_key: API key for authentication. If not provided, reads from ENGIVAULT_API_KEY env var.
-        **config: Additional configuration options (base_url, timeout, etc.)
+        cache: Memoize calculation shortcuts, so repeating a call with the
+            same arguments reuses the earlier result instead of sending a new
+            request. A single call can override this with ``cache=False``.
+        warmup: Open a pooled connection in the background with a health
+            check, so the first calculation skips the TCP/TLS handshake
+        local: Evaluate :func:`pressure_drop`, :func:`pressure_drop_batch`
+            and :func:`lmtd` in-process with the API's formulas instead of
+            sending requests. A single call can override this with
+            ``local=False``.
+        **config: Additional configuration options (base_url, timeout,
+            persistent_cache, etc.)
+    
+    Calling ``init`` again with the same key and configuration returns the
+    existing client instead of building a new one; any difference replaces it.
     
     Returns:
         The initialized global client instance.
@@ -34,9 +81,19 @@ def init(api_key: Optional[str] = None, **config) -> EngiVaultClient:
         >>> # Or with config
         >>> client = ev.init("key", timeout=60)
     """
-    global _global_client
-    _global_client = EngiVaultClient(api_key=api_key, **config)
-    return _global_client
+    global _global_client, _global_config, _cache_results, _local_results
+    if api_key is None:
+        api_key = os.environ.get("ENGIVAULT_API_KEY")
+    with _global_lock:
+        if _global_client is None or _global_config != (api_key, config):
+            _global_client = EngiVaultClient(api_key=api_key, **config)
+            _global_config = (api_key, config)
+        client = _global_client
+        _cache_results = cache
+        _local_results = local
+    if warmup:
+        client.warm_up()
+    return client
 
 
 def get_client() -> EngiVaultClient:
@@ -62,6 +119,19 @@ def get_client() -> EngiVaultClient:
     return _global_client
 
 
+def clear_cache() -> None:
+    """
+    Discard all results memoized by the global client.
+    
+    Example:
+        >>> ev.init("your-api-key", cache=True)
+        >>> ev.pressure_drop(0.01, 0.1, 100, 1000, 0.001)  # request sent
+        >>> ev.pressure_drop(0.01, 0.1, 100, 1000, 0.001)  # served from cache
+        >>> ev.clear_cache()
+    """
+    get_client().clear_cache()
+
+
 # ============================================================================
 # Hydraulics Functions
 # ============================================================================
@@ -74,7 +144,7 @@ def pressure_drop(
     fluid_viscosity: float,
     pipe_roughness: float = 4.6e-5,
     **kwargs
-) -> Dict[str, Any]:
+) -> PressureDropResult:
     """
     Calculate pressure drop in a pipe.
     
@@ -88,7 +158,7 @@ def pressure_drop(
         **kwargs: Additional parameters
     
     Returns:
-        Dict containing pressure_drop, velocity, reynolds_number, friction_factor
+        PressureDropResult with pressure_drop, velocity, reynolds_number, friction_factor
     
     Example:
         >>> import engivault as ev
@@ -100,9 +170,11 @@ def pressure_drop(
         ...     fluid_density=1000,
         ...     fluid_viscosity=0.001
         ... )
-        >>> print(f"Pressure drop: {result['pressure_drop']} Pa")
+        >>> print(f"Pressure drop: {result.pressure_drop} Pa")
     """
     client = get_client()
+    kwargs.setdefault("cache", _cache_results)
+    kwargs.setdefault("local", _local_results)
     return client.hydraulics.pressure_drop(
         flow_rate=flow_rate,
         pipe_diameter=pipe_diameter,
@@ -114,6 +186,176 @@ def pressure_drop(
     )
 
 
+def batch_pressure_drop(
+    flow_rates: Union[float, Sequence[float]],
+    pipe_diameters: Union[float, Sequence[float]],
+    pipe_lengths: Union[float, Sequence[float]],
+    fluid_densities: Union[float, Sequence[float]],
+    fluid_viscosities: Union[float, Sequence[float]],
+    pipe_roughness: Union[float, Sequence[float]] = 4.6e-5,
+) -> List[PressureDropResult]:
+    """
+    Calculate pressure drop for many operating points at once.
+    
+    Each argument may be a scalar or a sequence (list or NumPy array);
+    scalars are repeated for every point. Points are sent concurrently.
+    
+    Returns:
+        List of PressureDropResult, one per point
+    
+    Example:
+        >>> results = ev.batch_pressure_drop(
+        ...     flow_rates=[0.01, 0.02, 0.03],
+        ...     pipe_diameters=0.1,
+        ...     pipe_lengths=100,
+        ...     fluid_densities=1000,
+        ...     fluid_viscosities=0.001
+        ... )
+    """
+    columns = _broadcast(
+        flow_rate=flow_rates,
+        pipe_diameter=pipe_diameters,
+        pipe_length=pipe_lengths,
+        fluid_density=fluid_densities,
+        fluid_viscosity=fluid_viscosities,
+        pipe_roughness=pipe_roughness,
+    )
+    rows = [
+        HydraulicsModule._pressure_drop_data(**dict(zip(columns, values)))
+        for values in zip(*columns.values())
+    ]
+    
+    client = get_client()
+    return [
+        PressureDropResult.model_validate(data)
+        for data in client.batch("/api/v1/hydraulics/pressure-drop", rows)
+    ]
+
+
+def pressure_drop_batch(cases: Sequence[Dict[str, float]]) -> List[PressureDropResult]:
+    """
+    Calculate pressure drop for many cases in a single request.
+    
+    Each case holds the keyword arguments of :func:`pressure_drop`
+    (``pipe_roughness`` may be omitted). Unlike :func:`batch_pressure_drop`,
+    which sends one request per point concurrently, all cases travel in one
+    columnar request, so N cases cost one round trip. Requires NumPy.
+    
+    Returns:
+        List of PressureDropResult, in case order
+    
+    Example:
+        >>> results = ev.pressure_drop_batch([
+        ...     {"flow_rate": 0.01, "pipe_diameter": d, "pipe_length": 100,
+        ...      "fluid_density": 1000, "fluid_viscosity": 0.001}
+        ...     for d in (0.05, 0.1, 0.15)
+        ... ])
+    """
+    if not cases:
+        return []
+    columns = {
+        name: [case[name] for case in cases]
+        for name in ("flow_rate", "pipe_diameter", "pipe_length", "fluid_density", "fluid_viscosity")
+    }
+    columns["pipe_roughness"] = [case.get("pipe_roughness", 4.6e-5) for case in cases]
+    
+    result = get_client().hydraulics.pressure_drop_batch(local=_local_results, **columns)
+    return [
+        PressureDropResult(
+            pressure_drop=pressure_drop,
+            reynolds_number=reynolds_number,
+            friction_factor=friction_factor,
+            velocity=velocity,
+        )
+        for pressure_drop, reynolds_number, friction_factor, velocity in zip(
+            result["pressure_drop"].tolist(),
+            result["reynolds_number"].tolist(),
+            result["friction_factor"].tolist(),
+            result["velocity"].tolist(),
+        )
+    ]
+
+
+def pressure_drop_many(
+    params: Iterable[Dict[str, Any]],
+    concurrency: int = BATCH_CONCURRENCY,
+) -> List[PressureDropResult]:
+    """
+    Calculate pressure drop for many points with concurrent requests.
+    
+    Each item holds the keyword arguments of :func:`pressure_drop`. Points
+    are validated up front, then at most ``concurrency`` requests are in
+    flight at once, so N points cost about N / concurrency round trips.
+    
+    Example:
+        >>> results = ev.pressure_drop_many(
+        ...     {"flow_rate": 0.01, "pipe_diameter": d, "pipe_length": 100,
+        ...      "fluid_density": 1000, "fluid_viscosity": 0.001}
+        ...     for d in (0.05, 0.1, 0.15)
+        ... )
+    """
+    return get_client().hydraulics.pressure_drop_many(params, concurrency)
+
+
+def pressure_drop_stream(
+    cases: Iterable[Dict[str, Any]],
+    max_workers: int = 10,
+    ordered: bool = False,
+) -> Iterator[Tuple[int, PressureDropResult]]:
+    """
+    Calculate pressure drop for many points, yielding results as they arrive.
+    
+    Each case holds the keyword arguments of :func:`pressure_drop`. Up to
+    ``max_workers`` requests run at once, and each ``(index, result)`` pair
+    is yielded as soon as it is available, so processing overlaps with the
+    requests still in flight. Results come in completion order; with
+    ``ordered=True`` they are held back until all earlier indices have been
+    yielded. The first failed request raises when its turn comes, and
+    requests not yet started are cancelled.
+    
+    Example:
+        >>> for i, result in ev.pressure_drop_stream(cases):
+        ...     print(i, result.pressure_drop)
+    """
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    futures = {
+        executor.submit(pressure_drop, **case): index
+        for index, case in enumerate(cases)
+    }
+    try:
+        pending: Dict[int, PressureDropResult] = {}
+        next_index = 0
+        for future in as_completed(futures):
+            index = futures[future]
+            if not ordered:
+                yield index, future.result()
+                continue
+            pending[index] = future.result()
+            while next_index in pending:
+                yield next_index, pending.pop(next_index)
+                next_index += 1
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown()
+
+
+def _broadcast(**columns: Any) -> Dict[str, List[Any]]:
+    """Expand scalar columns to the common length of the sequence columns."""
+    lists = {
+        name: value.tolist() if hasattr(value, "tolist") else value
+        for name, value in columns.items()
+    }
+    lengths = {len(v) for v in lists.values() if isinstance(v, (list, tuple))}
+    if len(lengths) > 1:
+        raise SDKValidationError("All sequence arguments must have the same length")
+    n = lengths.pop() if lengths else 1
+    return {
+        name: list(value) if isinstance(value, (list, tuple)) else [value] * n
+        for name, value in lists.items()
+    }
+
+
 def flow_rate(
     pressure_drop: float,
     pipe_diameter: float,
@@ -122,7 +364,7 @@ def flow_rate(
     fluid_viscosity: float,
     pipe_roughness: float = 4.6e-5,
     **kwargs
-) -> Dict[str, Any]:
+) -> FlowRateResult:
     """
     Calculate flow rate from pressure drop.
     
@@ -136,7 +378,7 @@ def flow_rate(
         **kwargs: Additional parameters
     
     Returns:
-        Dict containing flow_rate, velocity, reynolds_number, friction_factor
+        FlowRateResult with flow_rate, velocity, reynolds_number
     
     Example:
         >>> result = ev.flow_rate(
@@ -148,6 +390,7 @@ def flow_rate(
         ... )
     """
     client = get_client()
+    kwargs.setdefault("cache", _cache_results)
     return client.hydraulics.flow_rate(
         pressure_drop=pressure_drop,
         pipe_diameter=pipe_diameter,
@@ -254,7 +497,7 @@ def lmtd(
     t_cold_out: float,
     flow_arrangement: str = 'counterflow',
     **kwargs
-) -> Dict[str, Any]:
+) -> float:
     """
     Calculate Log Mean Temperature Difference.
     
@@ -267,7 +510,7 @@ def lmtd(
         **kwargs: Additional parameters
     
     Returns:
-        Dict containing lmtd, delta_t1, delta_t2
+        LMTD (same unit as the temperatures)
     
     Example:
         >>> result = ev.lmtd(
@@ -279,6 +522,8 @@ def lmtd(
         ... )
     """
     client = get_client()
+    kwargs.setdefault("cache", _cache_results)
+    kwargs.setdefault("local", _local_results)
     return client.heat_transfer.lmtd(
         t_hot_in=t_hot_in,
         t_hot_out=t_hot_out,
@@ -298,7 +543,7 @@ def heat_exchanger(
     t_cold_out: float,
     flow_arrangement: str = 'counterflow',
     **kwargs
-) -> Dict[str, Any]:
+) -> HeatExchangerResult:
     """
     Calculate required heat exchanger area.
     
@@ -313,7 +558,7 @@ def heat_exchanger(
         **kwargs: Additional parameters
     
     Returns:
-        Dict containing area, lmtd, effectiveness, ntu
+        HeatExchangerResult with area, lmtd, effectiveness, ntu, capacity_ratio
     
     Example:
         >>> result = ev.heat_exchanger(
@@ -326,6 +571,7 @@ def heat_exchanger(
         ... )
     """
     client = get_client()
+    kwargs.setdefault("cache", _cache_results)
     return client.heat_transfer.heat_exchanger_area(
         heat_duty=heat_duty,
         overall_u=overall_u,
@@ -349,7 +595,7 @@ def open_channel_flow(
     mannings_coeff: float,
     channel_shape: str = 'rectangular',
     **kwargs
-) -> Dict[str, Any]:
+) -> OpenChannelFlowResult:
     """
     Calculate open channel flow properties.
     
@@ -362,7 +608,7 @@ def open_channel_flow(
         **kwargs: Additional parameters
     
     Returns:
-        Dict containing normal_depth, velocity, froude_number, flow_regime
+        OpenChannelFlowResult with normal_depth, velocity, froude_number, flow_regime
     
     Example:
         >>> result = ev.open_channel_flow(
@@ -373,6 +619,7 @@ def open_channel_flow(
         ... )
     """
     client = get_client()
+    kwargs.setdefault("cache", _cache_results)
     return client.fluid_mechanics.open_channel_flow(
         flow_rate=flow_rate,
         channel_width=channel_width,
@@ -383,6 +630,40 @@ def open_channel_flow(
     )
 
 
+# ============================================================================
+# Concurrency
+# ============================================================================
+
+def pool(calls: Iterable[Callable[[], _T]], max_workers: int = 10) -> List[_T]:
+    """
+    Run independent blocking calls concurrently on a thread pool.
+    
+    Works with any shortcut or client method, including those without an
+    async variant; the client's connection pool is shared by all threads.
+    The first exception raised by a call is re-raised.
+    
+    Args:
+        calls: Zero-argument callables, e.g. ``functools.partial`` objects
+        max_workers: Maximum number of calls running at once
+    
+    Returns:
+        Results of each call, in input order
+    
+    Example:
+        >>> from functools import partial
+        >>> results = ev.pool(
+        ...     partial(ev.lmtd, 353, 333, 293, t) for t in (303, 308, 313)
+        ... )
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_call, calls))
+
+
+def _call(call: Callable[[], _T]) -> _T:
+    """Invoke ``call``; module-level so ``executor.map`` can use it."""
+    return call()
+
+
 # ============================================================================
 # Exported convenience functions
 # ============================================================================
@@ -391,9 +672,14 @@ __all__ = [
     # Initialization
     'init',
     'get_client',
+    'clear_cache',
     
     # Hydraulics
     'pressure_drop',
+    'batch_pressure_drop',
+    'pressure_drop_batch',
+    'pressure_drop_many',
+    'pressure_drop_stream',
     'flow_rate',
     
     # Pumps
@@ -406,5 +692,8 @@ __all__ = [
     
     # Fluid Mechanics
     'open_channel_flow',
+    
+    # Concurrency
+    'pool',
 ]
 
@@ -34,7 +34,7 @@ try:
         fluid_density=1000,
         fluid_viscosity=0.001
     )
-    print(f"✓ Pressure drop: {result['pressure_drop']:.2f} Pa")
+    print(f"✓ Pressure drop: {result.pressure_drop:.2f} Pa")
     
 except EngiVaultError as e:
     print(f"✗ Error: {e.message} (Status: {e.status_code})")
@@ -81,18 +81,22 @@ print(f"\nPressure drop for {flow_rate} m³/s flow in various pipe sizes:")
 print(f"{'Diameter (m)':<15} {'Velocity (m/s)':<15} {'ΔP (kPa)':<15}")
 print("-" * 45)
 
-for diameter in pipe_diameters:
-    try:
-        result = ev.pressure_drop(
-            flow_rate=flow_rate,
-            pipe_diameter=diameter,
-            pipe_length=100,
-            fluid_density=1000,
-            fluid_viscosity=0.001
-        )
-        print(f"{diameter:<15.3f} {result['velocity']:<15.3f} {result['pressure_drop']/1000:<15.2f}")
-    except Exception as e:
-        print(f"{diameter:<15.3f} {'Error':<15} {str(e):<15}")
+# All diameters go out in a single request
+try:
+    results = ev.pressure_drop_batch([
+        {
+            "flow_rate": flow_rate,
+            "pipe_diameter": diameter,
+            "pipe_length": 100,
+            "fluid_density": 1000,
+            "fluid_viscosity": 0.001,
+        }
+        for diameter in pipe_diameters
+    ])
+    for diameter, result in zip(pipe_diameters, results):
+        print(f"{diameter:<15.3f} {result.velocity:<15.3f} {result.pressure_drop/1000:<15.2f}")
+except Exception as e:
+    print(f"{'Error':<15} {str(e)}")
 
 # Heat transfer calculations
 print("\n" + "=" * 60)
@@ -101,16 +105,14 @@ print("=" * 60)
 
 try:
     # Calculate LMTD
-    lmtd_result = ev.lmtd(
+    lmtd = ev.lmtd(
         t_hot_in=373,      # K (100°C)
         t_hot_out=323,     # K (50°C)
         t_cold_in=293,     # K (20°C)
         t_cold_out=333,    # K (60°C)
         flow_arrangement='counterflow'
     )
-    print(f"✓ LMTD: {lmtd_result['lmtd']:.2f} K")
-    print(f"✓ ΔT1: {lmtd_result['delta_t1']:.2f} K")
-    print(f"✓ ΔT2: {lmtd_result['delta_t2']:.2f} K")
+    print(f"✓ LMTD: {lmtd:.2f} K")
     
     # Calculate heat exchanger area
     hx_result = ev.heat_exchanger(
@@ -121,9 +123,9 @@ try:
         t_cold_in=293,
         t_cold_out=333
     )
-    print(f"\n✓ Required area: {hx_result['area']:.2f} m²")
-    print(f"✓ Effectiveness: {hx_result['effectiveness']*100:.1f}%")
-    print(f"✓ NTU: {hx_result['ntu']:.2f}")
+    print(f"\n✓ Required area: {hx_result.area:.2f} m²")
+    print(f"✓ Effectiveness: {hx_result.effectiveness*100:.1f}%")
+    print(f"✓ NTU: {hx_result.ntu:.2f}")
     
 except EngiVaultError as e:
     print(f"✗ Calculation failed: {e.message}")
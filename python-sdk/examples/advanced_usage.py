@@ -43,25 +43,28 @@ def pipe_sizing_analysis():
     
     optimal_diameter = None
     
-    for diameter in diameters:
-        try:
-            result = client.hydraulics.pressure_drop(
-                flow_rate=required_flow,
-                pipe_diameter=diameter,
-                pipe_length=pipe_length,
-                fluid_density=fluid_density,
-                fluid_viscosity=fluid_viscosity,
-            )
-            
-            status = "✅ OK" if result.pressure_drop <= max_pressure_drop else "❌ High ΔP"
+    # One request covers every candidate diameter
+    try:
+        result = client.hydraulics.pressure_drop_batch(
+            flow_rate=required_flow,
+            pipe_diameter=diameters,
+            pipe_length=pipe_length,
+            fluid_density=fluid_density,
+            fluid_viscosity=fluid_viscosity,
+        )
+        
+        for diameter, pressure_drop, velocity, reynolds_number in zip(
+            diameters, result["pressure_drop"], result["velocity"], result["reynolds_number"]
+        ):
+            status = "✅ OK" if pressure_drop <= max_pressure_drop else "❌ High ΔP"
             
-            print(f"{diameter:6.2f} m | {result.pressure_drop:11,.0f} Pa | {result.velocity:8.2f} m/s | {result.reynolds_number:7,.0f} | {status}")
+            print(f"{diameter:6.2f} m | {pressure_drop:11,.0f} Pa | {velocity:8.2f} m/s | {reynolds_number:7,.0f} | {status}")
             
-            if result.pressure_drop <= max_pressure_drop and optimal_diameter is None:
+            if pressure_drop <= max_pressure_drop and optimal_diameter is None:
                 optimal_diameter = diameter
-                
-        except Exception as e:
-            print(f"{diameter:6.2f} m | Error: {e}")
+            
+    except Exception as e:
+        print(f"Error: {e}")
     
     print()
     if optimal_diameter:
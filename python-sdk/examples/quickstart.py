@@ -21,9 +21,9 @@ result = ev.pressure_drop(
 )
 
 # 3. Use the results
-print(f"Pressure drop: {result['pressure_drop']:.2f} Pa")
-print(f"Velocity: {result['velocity']:.2f} m/s")
-print(f"Reynolds number: {result['reynolds_number']:.0f}")
+print(f"Pressure drop: {result.pressure_drop:.2f} Pa")
+print(f"Velocity: {result.velocity:.2f} m/s")
+print(f"Reynolds number: {result.reynolds_number:.0f}")
 
 # That's it! Just 3 simple steps.
 
@@ -38,13 +38,13 @@ pump_result = ev.pump_power(
 print(f"\nPump shaft power: {pump_result['shaft_power']/1000:.2f} kW")
 
 # Heat exchanger LMTD
-lmtd_result = ev.lmtd(
+lmtd = ev.lmtd(
     t_hot_in=373,       # K (100°C)
     t_hot_out=323,      # K (50°C)
     t_cold_in=293,      # K (20°C)
     t_cold_out=333      # K (60°C)
 )
-print(f"\nLMTD: {lmtd_result['lmtd']:.2f} K")
+print(f"\nLMTD: {lmtd:.2f} K")
 
 # Open channel flow
 channel_result = ev.open_channel_flow(
@@ -53,6 +53,6 @@ channel_result = ev.open_channel_flow(
     channel_slope=0.001,   # dimensionless
     mannings_coeff=0.03    # Manning's n
 )
-print(f"\nNormal depth: {channel_result['normal_depth']:.3f} m")
-print(f"Flow regime: {channel_result['flow_regime']}")
+print(f"\nNormal depth: {channel_result.normal_depth:.3f} m")
+print(f"Flow regime: {channel_result.flow_regime}")
 
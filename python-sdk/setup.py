@@ -34,8 +34,10 @@ setup(
     python_requires=">=3.8",
     install_requires=[
         "requests>=2.25.0",
+        "urllib3>=1.26.0",
         "pydantic>=2.0.0",
         "typing-extensions>=4.0.0",
+        "httpx>=0.24.0",
     ],
     extras_require={
         "dev": [
@@ -9,6 +9,14 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '.'))
 
 from engivault import EngiVault
 
+
+def _unwrap(result):
+    """Re-raise a calculation that failed inside ``client.send_batch``."""
+    if isinstance(result, Exception):
+        raise result
+    return result
+
+
 def main():
     """Test fluid mechanics calculations."""
     
@@ -21,16 +29,67 @@ def main():
     client = EngiVault(jwt_token=jwt_token)
     print("✅ Client created successfully")
     
-    # Test 1: Open Channel Flow
-    print("\n🌊 Testing Open Channel Flow (Manning's Equation)...")
-    try:
-        result = client.fluid_mechanics.open_channel_flow(
+    gas_properties = {
+        'gamma': 1.4,           # Air
+        'gasConstant': 287,     # J/kg·K for air
+        'molecularWeight': 28.97 # kg/kmol
+    }
+    boundary_layer_fluid = {
+        'density': 1.225,           # kg/m³ (air at 15°C)
+        'viscosity': 1.81e-5,       # Pa·s (air)
+        'kinematicViscosity': 1.48e-5 # m²/s (air)
+    }
+    external_flow_fluid = {
+        'density': 1.225,       # kg/m³ (air)
+        'viscosity': 1.81e-5    # Pa·s (air)
+    }
+    
+    # The six calculations are independent, so send them in one batch
+    # request: one round trip instead of six. A failed call is returned in
+    # its slot and reported by its own test below.
+    fm = client.fluid_mechanics
+    channel, compressible, layer, external, shock, choked = client.send_batch(
+        fm.aopen_channel_flow(
             flow_rate=5.0,          # m³/s
             channel_width=3.0,      # m
             channel_slope=0.001,    # 0.1% slope
             mannings_coeff=0.03,    # Concrete channel
             channel_shape="rectangular"
-        )
+        ),
+        fm.acompressible_flow(
+            temperature=288,        # 15°C
+            pressure=101325,        # 1 atm
+            gas_properties=gas_properties,
+            velocity=100            # m/s
+        ),
+        fm.aboundary_layer(
+            velocity=10,            # m/s
+            distance=0.5,           # 0.5 m from leading edge
+            fluid_properties=boundary_layer_fluid
+        ),
+        fm.aexternal_flow(
+            velocity=20,            # m/s
+            characteristic_length=0.1, # 0.1 m diameter sphere
+            fluid_properties=external_flow_fluid,
+            geometry="sphere"
+        ),
+        fm.anormal_shock(
+            mach_number_1=2.0,      # Supersonic upstream
+            gamma=1.4               # Air
+        ),
+        fm.achoked_flow(
+            stagnation_temperature=300, # K (27°C)
+            stagnation_pressure=200000, # Pa (2 bar)
+            gamma=1.4,
+            gas_constant=287
+        ),
+        return_exceptions=True,
+    )
+    
+    # Test 1: Open Channel Flow
+    print("\n🌊 Testing Open Channel Flow (Manning's Equation)...")
+    try:
+        result = _unwrap(channel)
         
         print(f"✅ Open Channel Analysis:")
         print(f"   Flow Rate: 5.0 m³/s in 3.0 m wide channel")
@@ -47,18 +106,7 @@ def main():
     # Test 2: Compressible Flow
     print("\n✈️ Testing Compressible Flow (Air at 100 m/s)...")
     try:
-        gas_properties = {
-            'gamma': 1.4,           # Air
-            'gasConstant': 287,     # J/kg·K for air
-            'molecularWeight': 28.97 # kg/kmol
-        }
-        
-        result = client.fluid_mechanics.compressible_flow(
-            temperature=288,        # 15°C
-            pressure=101325,        # 1 atm
-            gas_properties=gas_properties,
-            velocity=100            # m/s
-        )
+        result = _unwrap(compressible)
         
         print(f"✅ Compressible Flow Analysis:")
         print(f"   Velocity: 100 m/s at 15°C, 1 atm")
@@ -75,17 +123,7 @@ def main():
     # Test 3: Boundary Layer Analysis
     print("\n🌀 Testing Boundary Layer Analysis (Air over Flat Plate)...")
     try:
-        fluid_properties = {
-            'density': 1.225,           # kg/m³ (air at 15°C)
-            'viscosity': 1.81e-5,       # Pa·s (air)
-            'kinematicViscosity': 1.48e-5 # m²/s (air)
-        }
-        
-        result = client.fluid_mechanics.boundary_layer(
-            velocity=10,            # m/s
-            distance=0.5,           # 0.5 m from leading edge
-            fluid_properties=fluid_properties
-        )
+        result = _unwrap(layer)
         
         print(f"✅ Boundary Layer Analysis:")
         print(f"   Air flow at 10 m/s over flat plate")
@@ -103,17 +141,7 @@ def main():
     # Test 4: External Flow (Sphere)
     print("\n⚽ Testing External Flow (Sphere in Air)...")
     try:
-        fluid_properties = {
-            'density': 1.225,       # kg/m³ (air)
-            'viscosity': 1.81e-5    # Pa·s (air)
-        }
-        
-        result = client.fluid_mechanics.external_flow(
-            velocity=20,            # m/s
-            characteristic_length=0.1, # 0.1 m diameter sphere
-            fluid_properties=fluid_properties,
-            geometry="sphere"
-        )
+        result = _unwrap(external)
         
         print(f"✅ External Flow Analysis:")
         print(f"   0.1 m diameter sphere in 20 m/s air flow")
@@ -128,10 +156,7 @@ def main():
     # Test 5: Normal Shock Wave
     print("\n💥 Testing Normal Shock Wave (Supersonic Flow)...")
     try:
-        result = client.fluid_mechanics.normal_shock(
-            mach_number_1=2.0,      # Supersonic upstream
-            gamma=1.4               # Air
-        )
+        result = _unwrap(shock)
         
         print(f"✅ Normal Shock Analysis:")
         print(f"   Upstream Mach Number: 2.0")
@@ -147,12 +172,7 @@ def main():
     # Test 6: Choked Flow
     print("\n🚀 Testing Choked Flow (Critical Conditions)...")
     try:
-        result = client.fluid_mechanics.choked_flow(
-            stagnation_temperature=300, # K (27°C)
-            stagnation_pressure=200000, # Pa (2 bar)
-            gamma=1.4,
-            gas_constant=287
-        )
+        result = _unwrap(choked)
         
         print(f"✅ Choked Flow Analysis:")
         print(f"   Stagnation Conditions: 27°C, 2 bar")
@@ -0,0 +1,55 @@
+"""
+Tests for EngiVault Analytics Module
+"""
+
+import json
+from unittest.mock import Mock, patch
+
+from engivault import EngiVault
+
+
+def _response(status_code, payload=None, etag=None):
+    response = Mock()
+    response.status_code = status_code
+    response.content = json.dumps(payload).encode() if payload is not None else b""
+    response.headers = {"ETag": etag} if etag else {}
+    return response
+
+
+class TestAnalyticsCaching:
+    """Test caching of GET analytics endpoints."""
+    
+    def setup_method(self):
+        """Set up test client."""
+        self.client = EngiVault(jwt_token="test-token")
+        self.payload = {
+            "success": True,
+            "data": {"tier": "pro", "remainingRequestsThisMonth": 900},
+            "timestamp": "2025-09-16T17:19:34.027Z"
+        }
+    
+    @patch('engivault.client.requests.Session.request')
+    def test_repeat_call_served_from_cache(self, mock_request):
+        """Test that a repeated GET within the TTL does not hit the network."""
+        mock_request.return_value = _response(200, self.payload, etag='"v1"')
+        
+        first = self.client.analytics.subscription_limits()
+        second = self.client.analytics.subscription_limits()
+        
+        assert first == second == self.payload["data"]
+        mock_request.assert_called_once()
+    
+    @patch('engivault.client.time.monotonic')
+    @patch('engivault.client.requests.Session.request')
+    def test_expired_entry_revalidated_with_etag(self, mock_request, mock_time):
+        """Test that an expired entry sends If-None-Match and reuses data on 304."""
+        mock_time.return_value = 0.0
+        mock_request.return_value = _response(200, self.payload, etag='"v1"')
+        self.client.analytics.subscription_limits()
+        
+        mock_time.return_value = 1000.0
+        mock_request.return_value = _response(304)
+        result = self.client.analytics.subscription_limits()
+        
+        assert result == self.payload["data"]
+        assert mock_request.call_args[1]['headers'] == {"If-None-Match": '"v1"'}
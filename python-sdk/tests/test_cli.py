@@ -0,0 +1,34 @@
+"""
+Tests for the EngiVault command line interface
+"""
+
+import json
+
+from click.testing import CliRunner
+from unittest.mock import AsyncMock, patch
+
+from engivault.cli import main
+from engivault.exceptions import APIError
+from engivault.fluid_mechanics import FluidMechanicsModule
+
+
+class TestBatchCommand:
+    """Test the batch command's streamed output."""
+    
+    def test_failed_batch_still_closes_results(self, tmp_path):
+        """Test a failing calculation leaves valid JSON on stdout and the error on stderr."""
+        input_file = tmp_path / "batch.json"
+        input_file.write_text(json.dumps({"calculations": [
+            {"type": "open_channel_flow", "parameters": {"flow_rate": q}} for q in (1.0, 2.0)
+        ]}))
+        calculate = AsyncMock(side_effect=[{"normal_depth": 1.0}, APIError("Bad input")])
+        
+        with patch.object(FluidMechanicsModule, "aopen_channel_flow", calculate):
+            result = CliRunner().invoke(main, [
+                "--api-key", "test-key", "batch",
+                "--input-file", str(input_file), "--concurrency", "1",
+            ])
+        
+        assert result.exit_code == 1
+        assert json.loads(result.stdout)["results"][0]["result"] == {"normal_depth": 1.0}
+        assert "Bad input" in result.stderr
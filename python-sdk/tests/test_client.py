@@ -0,0 +1,350 @@
+"""
+Tests for EngiVault client response handling
+"""
+
+import json
+
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from engivault import EngiVault
+from engivault.client import _parse_response, _validate_response
+from engivault.exceptions import APIError, SDKValidationError
+
+
+def _response(payload):
+    """Build a mock 200 response carrying ``payload`` as JSON."""
+    response = Mock()
+    response.status_code = 200
+    response.content = json.dumps(payload).encode()
+    return response
+
+
+# Calls with an opt-in result cache: (call taking the client, a varied
+# argument and keywords, response data)
+_CACHED_CALLS = [
+    pytest.param(
+        lambda client, x, **kw: client.hydraulics.pressure_drop(x, 0.1, 100, 1000, 0.001, **kw),
+        {"pressureDrop": 1.0, "reynoldsNumber": 1.0, "frictionFactor": 0.02, "velocity": 1.0},
+        id="pressure_drop",
+    ),
+    pytest.param(
+        lambda client, x, **kw: client.hydraulics.flow_rate(x, 0.1, 100, 1000, 0.001, **kw),
+        {"flowRate": 0.03, "velocity": 4.5, "reynoldsNumber": 4.5e5},
+        id="flow_rate",
+    ),
+    pytest.param(
+        lambda client, x, **kw: client.heat_transfer.lmtd(350 + x, 333, 293, 313, **kw),
+        {"lmtd": 30.0},
+        id="lmtd",
+    ),
+    pytest.param(
+        lambda client, x, **kw: client.heat_transfer.effectiveness_ntu(x, 0.5, "counterflow", **kw),
+        {"effectiveness": 0.6, "maxHeatTransfer": 0.6},
+        id="effectiveness_ntu",
+    ),
+    pytest.param(
+        lambda client, x, **kw: client.pumps.npsh(101325, 2337, 1000, x, 1.5, **kw),
+        {"npshAvailable": 9.8, "npshRequired": 3.0, "margin": 6.8, "isCavitationRisk": False},
+        id="npsh",
+    ),
+    pytest.param(
+        lambda client, x, **kw: client.equipment_sizing.piping_sizing.size_piping(x, 1000, 0.001, **kw),
+        {"diameter": 0.2},
+        id="size_piping",
+    ),
+]
+
+# Calls with invalid inputs, each taking the client
+_INVALID_CALLS = [
+    pytest.param(lambda client: client.fluid_mechanics.open_channel_flow(5.0, 3.0, -0.001, 0.03),
+                 id="open_channel_flow"),
+    pytest.param(lambda client: client.fluid_mechanics.compressible_flow(288, 101325, {"gamma": 1.4}),
+                 id="compressible_flow"),
+    pytest.param(lambda client: client.fluid_mechanics.compressible_flow(288, None, {"gamma": 1.4}, velocity=100),
+                 id="compressible_flow_pressure"),
+    pytest.param(lambda client: client.fluid_mechanics.boundary_layer(10, 0.5, fluid_properties=None),
+                 id="boundary_layer"),
+    pytest.param(lambda client: client.fluid_mechanics.external_flow(0, 0.1, {"density": 1.225}, "sphere"),
+                 id="external_flow"),
+    pytest.param(lambda client: client.pumps.performance(0.05, 50, 1.2, 5000), id="performance_efficiency"),
+    pytest.param(lambda client: client.pumps.performance(0.05, -50, 0.8, 5000), id="performance_head"),
+    pytest.param(lambda client: client.pumps.npsh(None, 2337, 1000, 2.0, 1.5), id="npsh_missing"),
+    pytest.param(lambda client: client.pumps.npsh(101325, 2337, 1000, 0, 1.5), id="npsh_velocity"),
+]
+
+
+class TestResponseParsing:
+    """Test fast and validated envelope parsing."""
+    
+    def test_fast_path_reads_data(self):
+        """Test that the fast path returns data without a full envelope."""
+        assert _parse_response(_response({"success": True, "data": {"x": 1}})) == {"x": 1}
+    
+    def test_fast_path_api_error(self):
+        """Test that unsuccessful envelopes raise APIError."""
+        with pytest.raises(APIError, match="boom"):
+            _parse_response(_response({"success": False, "error": "boom"}))
+    
+    def test_validated_path_requires_envelope(self):
+        """Test that full validation rejects an envelope missing fields."""
+        with pytest.raises(APIError, match="Invalid response format"):
+            _validate_response(_response({"success": True, "data": {"x": 1}}))
+
+
+class TestGather:
+    """Test concurrent async calls from blocking code."""
+
+    def test_gather_fluid_mechanics(self):
+        """Test gather returns each result in order and validation still runs first."""
+        client = EngiVault(jwt_token="test-token")
+        fluid_mechanics = client.fluid_mechanics
+        shock = {"machNumber2": 0.58}
+        choked = {"criticalVelocity": 317.0}
+
+        with patch.object(client, "_amake_request", new=AsyncMock(side_effect=[shock, choked])) as request:
+            assert client.gather(
+                fluid_mechanics.anormal_shock(2.0),
+                fluid_mechanics.achoked_flow(300, 200000),
+            ) == [shock, choked]
+            with pytest.raises(SDKValidationError):
+                client.gather(fluid_mechanics.anormal_shock(0.5))
+
+        assert request.await_count == 2
+
+    def test_gather_return_exceptions(self):
+        """Test a failed call can be returned in place without losing the others."""
+        client = EngiVault(jwt_token="test-token")
+        shock = {"machNumber2": 0.58}
+
+        with patch.object(client, "_amake_request", new=AsyncMock(return_value=shock)):
+            ok, failed = client.gather(
+                client.fluid_mechanics.anormal_shock(2.0),
+                client.fluid_mechanics.anormal_shock(0.5),
+                return_exceptions=True,
+            )
+
+        assert ok == shock
+        assert isinstance(failed, SDKValidationError)
+
+
+class TestSendBatch:
+    """Test several calculations sent through the batch endpoint."""
+
+    def test_send_batch_one_request(self):
+        """Test calls share one request and are parsed like individual calls."""
+        client = EngiVault(jwt_token="test-token")
+        fluid_mechanics = client.fluid_mechanics
+        shock = {"machNumber2": 0.58}
+        batch_response = {"responses": [
+            {"statusCode": 200, "body": {"success": True, "data": shock}},
+            {"statusCode": 400, "body": {"success": False, "error": "Bad input"}},
+        ]}
+
+        with patch.object(client, "_make_request", return_value=batch_response) as request:
+            ok, failed, invalid = client.send_batch(
+                fluid_mechanics.anormal_shock(2.0),
+                fluid_mechanics.achoked_flow(300, 200000),
+                fluid_mechanics.anormal_shock(0.5),
+                return_exceptions=True,
+            )
+
+        request.assert_called_once()
+        method, endpoint = request.call_args[0]
+        assert (method, endpoint) == ("POST", "/api/v1/batch")
+        paths = [item["path"] for item in request.call_args[1]["data"]["requests"]]
+        assert paths == ["/api/v1/fluid-mechanics/normal-shock", "/api/v1/fluid-mechanics/choked-flow"]
+        assert ok == shock
+        assert isinstance(failed, APIError) and "Bad input" in str(failed)
+        assert isinstance(invalid, SDKValidationError)
+
+    def test_send_batch_missing_responses(self):
+        """Test calls fail with APIError when the server answers fewer of them than were sent."""
+        client = EngiVault(jwt_token="test-token")
+        batch_response = {"responses": [
+            {"statusCode": 200, "body": {"success": True, "data": {"machNumber2": 0.58}}},
+        ]}
+
+        with patch.object(client, "_make_request", return_value=batch_response):
+            results = client.send_batch(
+                client.fluid_mechanics.anormal_shock(2.0),
+                client.fluid_mechanics.achoked_flow(300, 200000),
+                return_exceptions=True,
+            )
+            with pytest.raises(APIError, match="1 responses for 2 requests"):
+                client.send_batch(
+                    client.fluid_mechanics.anormal_shock(2.0),
+                    client.fluid_mechanics.achoked_flow(300, 200000),
+                )
+
+        assert all(isinstance(result, APIError) for result in results)
+
+
+class TestPersistentCache:
+    """Test memoized results persisted across clients."""
+    
+    def test_results_survive_new_client(self, tmp_path):
+        """Test a second client reuses a persisted result until the cache is cleared."""
+        path = str(tmp_path / "cache.sqlite3")
+        body = {"tHotIn": 353, "tHotOut": 333}
+        
+        first = EngiVault(jwt_token="test-token", persistent_cache=path)
+        with patch.object(first, "_make_request", return_value={"lmtd": 30.0}) as request:
+            first._make_request_cached("/api/v1/heat-transfer/lmtd", body)
+        request.assert_called_once()
+        
+        second = EngiVault(jwt_token="test-token", persistent_cache=path)
+        with patch.object(second, "_make_request", return_value={"lmtd": 31.0}) as request:
+            assert second._make_request_cached("/api/v1/heat-transfer/lmtd", body) == {"lmtd": 30.0}
+            request.assert_not_called()
+            
+            second.clear_cache()
+            assert second._make_request_cached("/api/v1/heat-transfer/lmtd", body) == {"lmtd": 31.0}
+            request.assert_called_once()
+
+
+class TestRequestCompression:
+    """Test large request bodies are sent gzip-compressed."""
+    
+    def test_large_bodies_are_gzipped(self):
+        """Test only bodies past the threshold carry Content-Encoding: gzip."""
+        import gzip
+        
+        client = EngiVault(jwt_token="test-token")
+        small = {"flowRate": 0.01}
+        large = {"flowRate": [0.01] * 1000}
+        
+        with patch.object(client.session, "send", return_value=_response({"success": True, "data": {}})) as send:
+            client._make_request("POST", "/api/v1/hydraulics/pressure-drop", data=small)
+            client._make_request("POST", "/api/v1/hydraulics/pressure-drop/batch", data=large)
+        
+        plain, compressed = (call[0][0] for call in send.call_args_list)
+        assert "Content-Encoding" not in plain.headers
+        assert json.loads(plain.body) == small
+        assert compressed.headers["Content-Encoding"] == "gzip"
+        assert json.loads(gzip.decompress(compressed.body)) == large
+
+
+class TestWarmup:
+    """Test background connection warmup."""
+    
+    def test_warmup_runs_health_check_in_background(self):
+        """Test warmup=True health-checks off the calling thread and ignores failures."""
+        import threading
+        
+        checked = threading.Event()
+        
+        def health_check(client):
+            assert threading.current_thread() is not threading.main_thread()
+            checked.set()
+            raise APIError("offline")
+        
+        with patch.object(EngiVault, "health_check", health_check):
+            EngiVault(jwt_token="test-token", warmup=True)
+            assert checked.wait(5)
+
+
+class TestJSONEncoding:
+    """Test request body encoding."""
+    
+    def test_numpy_values_encode_as_plain_json(self):
+        """Test NumPy scalars and arrays encode like the Python values they hold."""
+        np = pytest.importorskip("numpy")
+        from engivault._json import dumps, dumps_canonical
+        
+        body = {"b": np.float64(0.1), "a": np.int64(3), "c": np.arange(4)[::2]}
+        assert json.loads(dumps(body)) == {"b": 0.1, "a": 3, "c": [0, 2]}
+        assert dumps_canonical(body) == dumps_canonical({"a": 3, "b": 0.1, "c": [0, 2]})
+        with pytest.raises(TypeError):
+            dumps({"x": object()})
+
+
+class TestPreparedRequests:
+    """Test per-endpoint POST templates follow the public session."""
+    
+    def test_session_changes_apply_to_later_calls(self, monkeypatch):
+        """Test verify, headers and cookies changed after a call are used by the next one."""
+        for name in ("REQUESTS_CA_BUNDLE", "CURL_CA_BUNDLE"):
+            monkeypatch.delenv(name, raising=False)
+        client = EngiVault(jwt_token="test-token")
+        endpoint = "/api/v1/hydraulics/pressure-drop"
+        
+        with patch.object(client.session, "send", return_value=_response({"success": True, "data": {}})) as send:
+            client._make_request("POST", endpoint, data={})
+            client.session.verify = False
+            client.session.headers["X-Trace"] = "1"
+            client.session.cookies.set("session", "abc")
+            client._make_request("POST", endpoint, data={})
+        
+        first, second = send.call_args_list
+        assert first[1]["verify"] is True and "Cookie" not in first[0][0].headers
+        assert second[1]["verify"] is False
+        assert second[0][0].headers["X-Trace"] == "1"
+        assert second[0][0].headers["Cookie"] == "session=abc"
+
+
+class TestBlockingInsideEventLoop:
+    """Test blocking batch helpers refuse to run inside an event loop."""
+    
+    def test_blocking_calls_point_to_async_variant(self, recwarn):
+        """Test batch and gather raise ConfigurationError and leave no unawaited coroutine."""
+        import asyncio
+        import gc
+        from engivault.exceptions import ConfigurationError
+        
+        client = EngiVault(jwt_token="test-token")
+        
+        async def call_blocking():
+            with pytest.raises(ConfigurationError, match="abatch"):
+                client.batch("/api/v1/hydraulics/pressure-drop", [{"flowRate": 0.01}])
+            with pytest.raises(ConfigurationError, match="asyncio.gather"):
+                client.gather(client.heat_transfer.almtd(353, 333, 293, 313))
+        
+        asyncio.run(call_blocking())
+        gc.collect()
+        assert not [w for w in recwarn if issubclass(w.category, RuntimeWarning)]
+
+
+class TestResultCache:
+    """Test opt-in memoization of calculation results."""
+    
+    @pytest.mark.parametrize("call, result", _CACHED_CALLS)
+    def test_cache_opt_in(self, call, result):
+        """Test that cache=True reuses results of identical calls only."""
+        client = EngiVault(jwt_token="test-token")
+        with patch.object(client, "_make_request", return_value=result) as request:
+            for _ in range(2):
+                call(client, 2.0, cache=True)
+            assert request.call_count == 1
+            
+            call(client, 2.0)
+            call(client, 3.0, cache=True)
+            assert request.call_count == 3
+
+    def test_cached_result_is_a_copy(self):
+        """Test that modifying a returned result does not change later cache hits."""
+        client = EngiVault(jwt_token="test-token")
+        endpoint = "/api/v1/equipment/piping/sizing"
+        with patch.object(client, "_make_request", return_value={"sizes": [{"id": 1}, {"id": 2}]}) as request:
+            first = client._make_request_cached(endpoint, {"flowRate": 0.1})
+            first["sizes"].pop()
+            second = client._make_request_cached(endpoint, {"flowRate": 0.1})
+            second["sizes"].clear()
+            third = client._make_request_cached(endpoint, {"flowRate": 0.1})
+
+        request.assert_called_once()
+        assert third == {"sizes": [{"id": 1}, {"id": 2}]}
+
+
+class TestInputValidation:
+    """Test calculation inputs are checked locally."""
+    
+    @pytest.mark.parametrize("call", _INVALID_CALLS)
+    def test_invalid_inputs(self, call):
+        """Test invalid inputs raise before any request is sent."""
+        client = EngiVault(jwt_token="test-token")
+        with patch.object(client, "_make_request") as request:
+            with pytest.raises(SDKValidationError):
+                call(client)
+        
+        request.assert_not_called()
@@ -0,0 +1,210 @@
+"""
+Tests for EngiVault equipment sizing helpers
+"""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from engivault import EngiVault
+from engivault.exceptions import SDKValidationError
+
+np = pytest.importorskip("numpy")
+
+
+def _piping_points(sizing):
+    """Piping batch results and the matching scalar results, per point."""
+    piping = sizing.piping_sizing
+    flows = np.array([0.001, 0.01, 0.1])
+    diameters = piping.calculate_pipe_diameter_batch(flows)
+    reynolds = piping.calculate_reynolds_number_batch(flows, diameters, 1000, 0.001)
+    scalar = [
+        (piping.calculate_pipe_diameter(q), piping.calculate_reynolds_number(q, d, 1000, 0.001))
+        for q, d in zip(flows, diameters)
+    ]
+    return list(zip(diameters, reynolds)), scalar
+
+
+def _vessel_points(sizing):
+    """Vessel batch results and the matching scalar results, per point."""
+    vessel = sizing.vessel_sizing
+    volumes = [1.0, 25.0, 400.0]
+    diameters, lengths = vessel.calculate_optimal_dimensions_batch(volumes)
+    thicknesses = vessel.calculate_wall_thickness_batch(diameters, 1e6, 137.9e6, 0.85)
+    weights = vessel.calculate_vessel_weight_batch(diameters, lengths, thicknesses, 7850)
+    scalar = [
+        (
+            *vessel.calculate_optimal_dimensions(v),
+            vessel.calculate_wall_thickness(d, 1e6, 137.9e6, 0.85),
+            vessel.calculate_vessel_weight(d, length, t, 7850),
+        )
+        for v, d, length, t in zip(volumes, diameters, lengths, thicknesses)
+    ]
+    return list(zip(diameters, lengths, thicknesses, weights)), scalar
+
+
+class TestBatchHelpers:
+    """Test vectorized sizing helpers against their scalar versions."""
+
+    @pytest.mark.parametrize("points", [_piping_points, _vessel_points], ids=["piping", "vessel"])
+    def test_batch_matches_scalar(self, points):
+        """Test each batch helper agrees with the scalar helper point by point."""
+        batch, scalar = points(EngiVault(jwt_token="test-token").equipment_sizing)
+
+        assert len(batch) == len(scalar)
+        for batch_point, scalar_point in zip(batch, scalar):
+            assert batch_point == pytest.approx(scalar_point)
+
+
+class TestPipingBatch:
+    """Test vectorized piping helpers against their scalar versions."""
+
+    def setup_method(self):
+        """Set up test client."""
+        self.piping = EngiVault(jwt_token="test-token").equipment_sizing.piping_sizing
+
+    def test_scalar_helpers_accept_arrays(self):
+        """Test the scalar helpers dispatch array inputs to the batch versions."""
+        reynolds = np.array([1000.0, 1e5])
+
+        assert self.piping.calculate_friction_factor(reynolds).tolist() == pytest.approx(
+            self.piping.calculate_friction_factor_batch(reynolds).tolist()
+        )
+        assert self.piping.calculate_pipe_diameter(np.array([0.1]))[0] == pytest.approx(
+            self.piping.calculate_pipe_diameter(0.1)
+        )
+
+    def test_friction_factor_colebrook(self):
+        """Test batch friction factors solve Colebrook-White in turbulent flow."""
+        reynolds = np.array([1000.0, 4000.0, 1e5, 1e7])
+        roughness = np.array([0.0, 1e-4, 1e-3, 0.05])
+        friction = self.piping.calculate_friction_factor_batch(reynolds, roughness)
+
+        assert [
+            self.piping.calculate_friction_factor(re, eps) for re, eps in zip(reynolds, roughness)
+        ] == pytest.approx(friction.tolist(), rel=1e-5)
+        turbulent = slice(1, None)
+        rhs = -2 * np.log10(
+            roughness[turbulent] / 3.7 + 2.51 / (reynolds[turbulent] * np.sqrt(friction[turbulent]))
+        )
+        assert (1 / np.sqrt(friction[turbulent])).tolist() == pytest.approx(rhs.tolist())
+        assert self.piping.calculate_friction_factor_batch(1e5).shape == ()
+
+    def test_specialized_friction_factor(self):
+        """Test a roughness-specialized function matches the general one."""
+        for roughness in (0.0, 1e-4, 0.02):
+            friction_factor = self.piping.make_friction_factor(roughness)
+            for reynolds in (1000.0, 5e3, 1e5, 1e7):
+                assert friction_factor(reynolds) == pytest.approx(
+                    self.piping.calculate_friction_factor(reynolds, roughness), rel=1e-5
+                )
+
+    def test_fused_pressure_drop(self):
+        """Test the fused kernel matches chaining the individual batch helpers."""
+        flows = np.linspace(0.001, 0.2, 7)
+        reynolds = self.piping.calculate_reynolds_number_batch(flows, 0.15, 1000, 0.001)
+        friction = self.piping.calculate_friction_factor_batch(reynolds, 1e-4)
+        velocity = flows / (np.pi / 4 * 0.15 ** 2)
+
+        fused = self.piping.calculate_pipe_pressure_drop_batch(flows, 0.15, 100, 1000, 0.001, 1e-4)
+        assert fused.tolist() == pytest.approx(
+            self.piping.calculate_pressure_drop_batch(friction, 100, 0.15, 1000, velocity).tolist()
+        )
+
+    def test_equivalent_length_soa(self):
+        """Test the array form agrees with the list-of-dicts form."""
+        fittings = [
+            {"type": "90_degree_elbow", "equivalentLength": 3.0, "quantity": 4},
+            {"type": "gate_valve", "equivalentLength": 0.8},
+        ]
+        lengths, counts = self.piping.fittings_to_arrays(fittings)
+
+        assert self.piping.calculate_equivalent_length_soa(100.0, lengths, counts) == pytest.approx(
+            self.piping.calculate_equivalent_length(100.0, fittings)
+        )
+
+    def test_nearest_standard_pipe_size(self):
+        """Test snapping matches a linear scan for scalars and arrays."""
+        sizes = self.piping.get_standard_pipe_sizes()
+        diameters = [0.001, 0.03, 0.0701, 0.146, 0.9]
+        expected = [min(sizes, key=lambda size: abs(size - d)) for d in diameters]
+
+        assert [self.piping.nearest_standard_pipe_size(d) for d in diameters] == expected
+        assert self.piping.nearest_standard_pipe_size(np.array(diameters)).tolist() == expected
+
+    def test_size_piping_batch(self):
+        """Test batch sizing validates every spec, then posts them concurrently."""
+        specs = [
+            {"flowRate": q, "fluidDensity": 1000, "fluidViscosity": 0.001}
+            for q in (0.05, 0.1)
+        ]
+        with patch.object(self.piping.client, "abatch", new=AsyncMock(return_value=[{}, {}])) as abatch:
+            assert self.piping.size_piping_batch(specs) == [{}, {}]
+            with pytest.raises(SDKValidationError):
+                self.piping.size_piping_batch(specs + [{"flowRate": -1.0}])
+
+        abatch.assert_awaited_once()
+        assert abatch.await_args[0][:2] == ("/api/v1/equipment/piping/sizing", specs)
+
+
+class TestHeatExchangerMath:
+    """Test local heat exchanger thermal helpers."""
+
+    def setup_method(self):
+        """Set up test client."""
+        self.hx = EngiVault(jwt_token="test-token").equipment_sizing.heat_exchanger_sizing
+
+    def test_lmtd(self):
+        """Test counterflow LMTD against the closed form."""
+        lmtd = self.hx.calculate_lmtd(373.15, 333.15, 293.15, 323.15)
+        assert lmtd == pytest.approx((50 - 40) / np.log(50 / 40))
+
+    def test_effectiveness(self):
+        """Test effectiveness for each flow arrangement."""
+        ntu, cr = 2.0, 0.5
+        e = np.exp(-ntu * (1 - cr))
+        assert self.hx.calculate_effectiveness(ntu, cr) == pytest.approx((1 - e) / (1 - cr * e))
+        assert self.hx.calculate_effectiveness(ntu, 1.0) == pytest.approx(ntu / (1 + ntu))
+        assert self.hx.calculate_effectiveness(ntu, cr, "parallel") == pytest.approx(
+            (1 - np.exp(-ntu * (1 + cr))) / (1 + cr)
+        )
+        assert 0 < self.hx.calculate_effectiveness(ntu, cr, "crossflow") < 1
+
+
+class TestVesselBatch:
+    """Test vectorized vessel helpers against their scalar versions."""
+
+    def setup_method(self):
+        """Set up test client."""
+        self.vessel = EngiVault(jwt_token="test-token").equipment_sizing.vessel_sizing
+
+    def test_size_vessels_bulk(self):
+        """Test bulk sizing validates every spec, then sends one request."""
+        specs = [
+            {"volume": v, "designPressure": 1e6, "designTemperature": 423, "vesselType": "separator"}
+            for v in (10, 50)
+        ]
+        with patch.object(self.vessel.client, "_make_request", return_value=[{}, {}]) as request:
+            assert self.vessel.size_vessels_bulk(specs) == [{}, {}]
+            with pytest.raises(SDKValidationError):
+                self.vessel.size_vessels_bulk(specs + [{"volume": 0}])
+
+        request.assert_called_once_with(
+            method="POST", endpoint="/api/v1/equipment/vessels/sizing/bulk", data={"vessels": specs}
+        )
+
+    def test_vessel_type_requests(self):
+        """Test each vessel-type call posts its own endpoint, type and dimensions."""
+        with patch.object(self.vessel.client, "_make_request", return_value={}) as request:
+            self.vessel.size_storage_tank(100, 101325, 300, diameter=4.0)
+            self.vessel.size_separator(10, 1e6, 350, material="stainless_steel", length=6.0)
+
+        (tank, separator) = (call[1] for call in request.call_args_list)
+        assert tank["endpoint"] == "/api/v1/equipment/vessels/storage-tank"
+        assert tank["data"] == {
+            "volume": 100, "designPressure": 101325, "designTemperature": 300, "material": "carbon_steel",
+            "vesselType": "storage_tank", "diameter": 4.0, "height": None, "operatingConditions": None,
+        }
+        assert separator["endpoint"] == "/api/v1/equipment/vessels/separator"
+        assert separator["data"]["vesselType"] == "separator"
+        assert (separator["data"]["material"], separator["data"]["length"]) == ("stainless_steel", 6.0)
+        assert "height" not in separator["data"]
@@ -0,0 +1,30 @@
+"""
+Tests for EngiVault fluid mechanics module
+"""
+
+from unittest.mock import patch
+
+from engivault import EngiVault
+
+
+class TestFluidMechanicsInputs:
+    """Test request bodies and input checks of fluid mechanics calls."""
+
+    def setup_method(self):
+        """Set up test client."""
+        self.client = EngiVault(jwt_token="test-token")
+
+    def test_open_channel_flow_body(self):
+        """Test the request body uses the API's camelCase keys and defaults."""
+        result = {
+            "normalDepth": 1.2, "criticalDepth": 0.9, "velocity": 1.4, "froudeNumber": 0.4,
+            "flowRegime": "subcritical", "hydraulicRadius": 0.6, "wettedPerimeter": 5.4, "topWidth": 3.0,
+        }
+        with patch.object(self.client, "_make_request", return_value=result) as request:
+            flow = self.client.fluid_mechanics.open_channel_flow(5.0, 3.0, 0.001, 0.03)
+
+        assert flow.normal_depth == 1.2
+        assert request.call_args[1]["data"] == {
+            "flowRate": 5.0, "channelWidth": 3.0, "channelSlope": 0.001, "manningSCoeff": 0.03,
+            "channelShape": "rectangular", "sideSlope": 0,
+        }
@@ -0,0 +1,122 @@
+"""
+Tests for EngiVault heat transfer module
+"""
+
+import math
+
+import pytest
+from unittest.mock import patch
+
+from engivault import EngiVault
+from engivault.exceptions import SDKValidationError
+
+
+class TestLocalHeatTransfer:
+    """Test the in-process LMTD and effectiveness paths."""
+
+    def setup_method(self):
+        """Set up test client."""
+        self.client = EngiVault(jwt_token="test-token")
+
+    def test_local_lmtd(self):
+        """Test local LMTD matches the closed form without sending a request."""
+        with patch.object(self.client, "_make_request") as request:
+            counterflow = self.client.heat_transfer.lmtd(373.15, 333.15, 293.15, 323.15, local=True)
+            parallel = self.client.heat_transfer.lmtd(373.15, 333.15, 293.15, 323.15, "parallel", local=True)
+            balanced = self.client.heat_transfer.lmtd(353, 333, 293, 313, local=True)
+
+        request.assert_not_called()
+        assert counterflow == pytest.approx(10 / math.log(50 / 40))
+        assert parallel == pytest.approx(70 / math.log(80 / 10))
+        assert balanced == 40
+
+    def test_local_effectiveness(self):
+        """Test local effectiveness for each arrangement, capped at one."""
+        ntu, cr = 2.0, 0.5
+        e = math.exp(-ntu * (1 - cr))
+        local = self.client.heat_transfer.effectiveness_ntu
+        with patch.object(self.client, "_make_request") as request:
+            assert local(ntu, cr, "counterflow", local=True).effectiveness == pytest.approx(
+                (1 - e) / (1 - cr * e)
+            )
+            assert local(ntu, 1.0, "counterflow", local=True).effectiveness == pytest.approx(ntu / (1 + ntu))
+            assert local(ntu, cr, "parallel", local=True).effectiveness == pytest.approx(
+                (1 - math.exp(-ntu * (1 + cr))) / (1 + cr)
+            )
+            assert 0 < local(ntu, cr, "crossflow_unmixed", local=True).effectiveness <= 1
+            with pytest.raises(SDKValidationError):
+                local(ntu, 1.5, "counterflow", local=True)
+
+        request.assert_not_called()
+
+    def test_batch_matches_local(self):
+        """Test the array kernels agree with the scalar local path point by point."""
+        np = pytest.importorskip("numpy")
+        ht = self.client.heat_transfer
+        t_cold_out = np.array([300.0, 313.0, 313.005, 330.0])
+        ntu, cr = np.meshgrid([0.5, 2.0], [0.0, 0.5, 1.0])
+
+        for arrangement in ("counterflow", "parallel"):
+            batch = ht.lmtd_batch(353, 333, 293, t_cold_out, arrangement)
+            assert batch.tolist() == pytest.approx(
+                [ht.lmtd(353, 333, 293, t, arrangement, local=True) for t in t_cold_out]
+            )
+        for arrangement in ("counterflow", "parallel", "crossflow_unmixed"):
+            batch = ht.effectiveness_ntu_batch(ntu, cr, arrangement)
+            assert batch.shape == (3, 2)
+            assert batch.ravel().tolist() == pytest.approx([
+                ht.effectiveness_ntu(n, c, arrangement, local=True).effectiveness
+                for n, c in zip(ntu.ravel(), cr.ravel())
+            ])
+
+    def test_sizing_single_request(self):
+        """Test heat exchanger sizing takes LMTD from the area response in one request."""
+        result = {"area": 3.2, "lmtd": 40.0, "effectiveness": 0.33, "ntu": 0.5, "capacityRatio": 1.0}
+        with patch.object(self.client, "_make_request", return_value=result) as request:
+            sizing = self.client.heat_transfer.heat_exchanger_sizing(50000, 353, 333, 293, 313, 500)
+
+        request.assert_called_once()
+        assert sizing["lmtd"] == 40.0
+
+    def test_sizing_batch_matches_area_endpoint_math(self):
+        """Test local batch sizing reproduces the API's area, NTU and effectiveness relations."""
+        np = pytest.importorskip("numpy")
+        duties = np.array([5e4, 1e5])
+        sizing = self.client.heat_transfer.heat_exchanger_sizing_batch(duties, 353, 333, 293, 303, 500)
+
+        lmtd = self.client.heat_transfer.lmtd(353, 333, 293, 303, local=True)
+        c_hot, c_cold = duties / 20, duties / 10
+        ntu = 500 * (duties / (500 * lmtd)) / c_hot
+        assert sizing["lmtd"].tolist() == pytest.approx([lmtd, lmtd])
+        assert sizing["area"].tolist() == pytest.approx((duties / (500 * lmtd)).tolist())
+        assert sizing["cold_capacity_rate"].tolist() == pytest.approx(c_cold.tolist())
+        assert sizing["capacity_ratio"].tolist() == pytest.approx([0.5, 0.5])
+        assert sizing["effectiveness"].tolist() == pytest.approx([
+            self.client.heat_transfer.effectiveness_ntu(n, 0.5, "counterflow", local=True).effectiveness
+            for n in ntu
+        ])
+
+    def test_sizing_batch_arrangement_case(self):
+        """Test a capitalized arrangement gives counterflow LMTD but parallel effectiveness, as the API does."""
+        pytest.importorskip("numpy")
+        ht = self.client.heat_transfer
+        sizing = ht.heat_exchanger_sizing_batch(1e5, 353, 333, 293, 303, 500, "Parallel")
+
+        assert sizing["lmtd"].item() == pytest.approx(ht.lmtd(353, 333, 293, 303, "counterflow", local=True))
+        assert sizing["effectiveness"].item() == pytest.approx(
+            ht.effectiveness_ntu(sizing["ntu"].item(), 0.5, "parallel", local=True).effectiveness
+        )
+
+    def test_crossflow_matches_sizing_helper(self):
+        """Test local and batch crossflow effectiveness agree with the equipment sizing helper."""
+        np = pytest.importorskip("numpy")
+        ht = self.client.heat_transfer
+        hx = self.client.equipment_sizing.heat_exchanger_sizing
+        ntu, cr = np.meshgrid([0.5, 2.0], [0.0, 0.5, 0.9])
+
+        expected = [hx.calculate_effectiveness(n, c, "crossflow") for n, c in zip(ntu.ravel(), cr.ravel())]
+        assert [
+            ht.effectiveness_ntu(n, c, "crossflow_unmixed", local=True).effectiveness
+            for n, c in zip(ntu.ravel(), cr.ravel())
+        ] == pytest.approx(expected)
+        assert ht.effectiveness_ntu_batch(ntu, cr, "crossflow_unmixed").ravel().tolist() == pytest.approx(expected)
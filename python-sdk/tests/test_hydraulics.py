@@ -2,6 +2,8 @@
 Tests for EngiVault Hydraulics Module
 """
 
+import json
+
 import pytest
 from unittest.mock import Mock, patch
 
@@ -16,13 +18,13 @@ class TestHydraulicsModule:
         """Set up test client."""
         self.client = EngiVault(jwt_token="test-token")
     
-    @patch('engivault.client.requests.Session.request')
+    @patch('engivault.client.requests.Session.send')
     def test_pressure_drop_success(self, mock_request):
         """Test successful pressure drop calculation."""
         # Mock API response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "success": True,
             "data": {
                 "pressureDrop": 762517.46,
@@ -31,7 +33,7 @@ class TestHydraulicsModule:
                 "velocity": 12.73
             },
             "timestamp": "2025-09-16T17:19:34.027Z"
-        }
+        }).encode()
         mock_request.return_value = mock_response
         
         # Test calculation
@@ -51,9 +53,26 @@ class TestHydraulicsModule:
         
         # Verify API was called correctly
         mock_request.assert_called_once()
-        call_args = mock_request.call_args
-        assert call_args[1]['method'] == 'POST'
-        assert '/api/v1/hydraulics/pressure-drop' in call_args[1]['url']
+        sent = mock_request.call_args[0][0]
+        assert sent.method == 'POST'
+        assert '/api/v1/hydraulics/pressure-drop' in sent.url
+        assert json.loads(sent.body)['flowRate'] == 0.1
+    
+    @patch('engivault.client.requests.Session.send')
+    def test_pressure_drop_numpy_inputs(self, mock_request):
+        """Test NumPy scalars, as produced by sweeps over np.linspace, are sent as plain numbers."""
+        np = pytest.importorskip("numpy")
+        mock_request.return_value = Mock(status_code=200, content=json.dumps({
+            "success": True,
+            "data": {"pressureDrop": 1.0, "reynoldsNumber": 1.0, "frictionFactor": 1.0, "velocity": 1.0},
+        }).encode())
+        
+        for flow_rate in np.linspace(0.1, 0.2, 2):
+            self.client.hydraulics.pressure_drop(flow_rate, np.float64(0.1), 100, 1000, 0.001, cache=True)
+        
+        bodies = [json.loads(call[0][0].body) for call in mock_request.call_args_list]
+        assert [body["flowRate"] for body in bodies] == [0.1, 0.2]
+        assert bodies[0]["pipeDiameter"] == 0.1
     
     def test_pressure_drop_validation_error(self):
         """Test pressure drop with invalid inputs."""
@@ -66,13 +85,13 @@ class TestHydraulicsModule:
                 fluid_viscosity=0.001
             )
     
-    @patch('engivault.client.requests.Session.request')
+    @patch('engivault.client.requests.Session.send')
     def test_flow_rate_success(self, mock_request):
         """Test successful flow rate calculation."""
         # Mock API response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "success": True,
             "data": {
                 "flowRate": 0.0356,
@@ -80,7 +99,7 @@ class TestHydraulicsModule:
                 "reynoldsNumber": 454000
             },
             "timestamp": "2025-09-16T17:19:34.027Z"
-        }
+        }).encode()
         mock_request.return_value = mock_response
         
         # Test calculation
@@ -96,3 +115,101 @@ class TestHydraulicsModule:
         assert result.flow_rate == 0.0356
         assert result.velocity == 4.54
         assert result.reynolds_number == 454000
+    
+    def test_flow_rate_body(self):
+        """Test the request body uses the API's camelCase keys and default roughness."""
+        result = {"flowRate": 0.0356, "velocity": 4.54, "reynoldsNumber": 454000}
+        with patch.object(self.client, "_make_request", return_value=result) as request:
+            self.client.hydraulics.flow_rate(10000, 0.1, 100, 1000, 0.001)
+        
+        assert request.call_args[1]["data"] == {
+            "pressureDrop": 10000, "pipeDiameter": 0.1, "pipeLength": 100,
+            "fluidDensity": 1000, "fluidViscosity": 0.001, "pipeRoughness": 0.00015,
+        }
+    
+    def test_pressure_drop_batch(self):
+        """Test batch inputs are broadcast into one columnar request and results reshaped."""
+        np = pytest.importorskip("numpy")
+        result = {"pressureDrop": [1.0, 2.0, 3.0, 4.0], "reynoldsNumber": [1e5] * 4,
+                  "frictionFactor": [0.02] * 4, "velocity": [1.0] * 4}
+        with patch.object(self.client, "_make_request", return_value=result) as request:
+            batch = self.client.hydraulics.pressure_drop_batch(
+                np.array([[0.01], [0.02]]), [0.1, 0.2], 100, 1000, 0.001
+            )
+            with pytest.raises(SDKValidationError):
+                self.client.hydraulics.pressure_drop_batch([0.01, -0.02], 0.1, 100, 1000, 0.001)
+        
+        request.assert_called_once()
+        sent = request.call_args[1]["data"]
+        assert sent["flowRate"] == [0.01, 0.01, 0.02, 0.02]
+        assert sent["pipeDiameter"] == [0.1, 0.2, 0.1, 0.2]
+        assert sent["pipeRoughness"] == [0.00015] * 4
+        assert batch["pressure_drop"].tolist() == [[1.0, 2.0], [3.0, 4.0]]
+    
+    def test_async_variants_share_body(self):
+        """Test the async hydraulics calls post the same body as the sync ones."""
+        import asyncio
+        from unittest.mock import AsyncMock
+        
+        result = {"pressureDrop": 1.0, "reynoldsNumber": 1e5, "frictionFactor": 0.02, "velocity": 1.0}
+        with patch.object(self.client, "_amake_request", new=AsyncMock(return_value=result)) as arequest, \
+                patch.object(self.client, "_make_request", return_value=result) as request:
+            asynchronous = asyncio.run(self.client.hydraulics.apressure_drop(0.1, 0.1, 100, 1000, 0.001))
+            synchronous = self.client.hydraulics.pressure_drop(0.1, 0.1, 100, 1000, 0.001)
+        
+        assert asynchronous == synchronous
+        assert arequest.await_args[1] == request.call_args[1]
+    
+    def test_zero_roughness_rejected(self):
+        """Test an explicit zero roughness is rejected rather than replaced by the default."""
+        with patch.object(self.client, "_make_request") as request:
+            with pytest.raises(SDKValidationError, match="Pipe roughness"):
+                self.client.hydraulics.pressure_drop(0.1, 0.1, 100, 1000, 0.001, pipe_roughness=0.0)
+        
+        request.assert_not_called()
+    
+    def test_pressure_drop_many(self):
+        """Test many points are validated up front, then posted concurrently."""
+        from unittest.mock import AsyncMock
+        
+        points = [
+            {"flow_rate": q, "pipe_diameter": 0.1, "pipe_length": 100,
+             "fluid_density": 1000, "fluid_viscosity": 0.001}
+            for q in (0.01, 0.02)
+        ]
+        result = {"pressureDrop": 1.0, "reynoldsNumber": 1e5, "frictionFactor": 0.02, "velocity": 1.0}
+        with patch.object(self.client, "abatch", new=AsyncMock(return_value=[result, result])) as abatch:
+            results = self.client.hydraulics.pressure_drop_many(points)
+            with pytest.raises(SDKValidationError):
+                self.client.hydraulics.pressure_drop_many(points + [dict(points[0], flow_rate=0)])
+        
+        abatch.assert_awaited_once()
+        endpoint, rows = abatch.await_args[0][:2]
+        assert endpoint == "/api/v1/hydraulics/pressure-drop"
+        assert [row["flowRate"] for row in rows] == [0.01, 0.02]
+        assert [r.pressure_drop for r in results] == [1.0, 1.0]
+    
+    def test_pressure_drop_local(self):
+        """Test local evaluation reproduces the API response without a request."""
+        with patch.object(self.client, "_make_request") as request:
+            turbulent = self.client.hydraulics.pressure_drop(0.1, 0.1, 100, 1000, 0.001, local=True)
+            laminar = self.client.hydraulics.pressure_drop(1e-5, 0.1, 100, 1000, 0.001, local=True)
+        
+        request.assert_not_called()
+        assert turbulent.pressure_drop == pytest.approx(762517.46, rel=1e-6)
+        assert turbulent.reynolds_number == pytest.approx(1273239.54)
+        assert turbulent.velocity == pytest.approx(12.73, abs=0.01)
+        assert laminar.friction_factor == pytest.approx(64 / laminar.reynolds_number)
+    
+    def test_pressure_drop_batch_local(self):
+        """Test the local batch path agrees with local scalar calls point by point."""
+        np = pytest.importorskip("numpy")
+        flows = np.array([1e-5, 0.01, 0.1])
+        with patch.object(self.client, "_make_request") as request:
+            batch = self.client.hydraulics.pressure_drop_batch(flows, 0.1, 100, 1000, 0.001, local=True)
+        
+        request.assert_not_called()
+        for i, q in enumerate(flows):
+            point = self.client.hydraulics.pressure_drop(float(q), 0.1, 100, 1000, 0.001, local=True)
+            assert batch["pressure_drop"][i] == pytest.approx(point.pressure_drop)
+            assert batch["friction_factor"][i] == pytest.approx(point.friction_factor)
@@ -0,0 +1,171 @@
+"""
+Tests for EngiVault pump calculations
+"""
+
+import pytest
+
+from engivault import EngiVault
+from engivault.exceptions import SDKValidationError
+
+np = pytest.importorskip("numpy")
+
+
+class TestPumpCurveFit:
+    """Test local pump curve fitting."""
+
+    def setup_method(self):
+        """Set up test client."""
+        self.pump_sizing = EngiVault(jwt_token="test-token").equipment_sizing.pump_sizing
+
+    def test_fit_matches_polyfit(self):
+        """Test fitted coefficients match numpy.polyfit."""
+        flows = [0.0, 0.05, 0.1, 0.15, 0.2]
+        heads = [60.0, 57.5, 50.2, 38.9, 22.0]
+
+        curve = self.pump_sizing.fit_pump_curve(flows, heads)
+        c, b, a = np.polyfit(flows, heads, 2)
+
+        assert curve["a"] == pytest.approx(a)
+        assert curve["b"] == pytest.approx(b)
+        assert curve["c"] == pytest.approx(c)
+        assert self.pump_sizing.evaluate_pump_curve(
+            (curve["a"], curve["b"], curve["c"]), flows
+        ) == pytest.approx(np.polyval([c, b, a], flows).tolist())
+
+    def test_fit_requires_three_points(self):
+        """Test that too few points are rejected."""
+        with pytest.raises(SDKValidationError):
+            self.pump_sizing.fit_pump_curve([0.0, 0.1], [60.0, 50.0])
+
+    @pytest.mark.parametrize("flows", [
+        [0.1, 0.1, 0.1],
+        [0.1, 0.1, 0.2, 0.2],
+        [0.1, 0.1 + 1e-12, 0.2],
+    ], ids=["one_flow", "two_flows", "near_duplicate"])
+    def test_fit_rejects_degenerate_flows(self, flows):
+        """Test that flows which do not determine a quadratic are rejected."""
+        with pytest.raises(SDKValidationError):
+            self.pump_sizing.fit_pump_curve(flows, [50.0, 48.0, 47.0, 46.0][:len(flows)])
+
+    def test_fit_narrow_flow_range(self):
+        """Test a fit over a narrow range of large flows keeps its precision."""
+        flows = np.linspace(1.0, 1.001, 6)
+        curve = self.pump_sizing.fit_pump_curve(flows, 50.0 - 3.0 * flows + 0.5 * flows ** 2)
+
+        assert (curve["a"], curve["b"], curve["c"]) == pytest.approx((50.0, -3.0, 0.5), rel=1e-5)
+
+
+class TestCurveSeries:
+    """Test array-backed curve containers."""
+
+    def test_points_round_trip(self):
+        """Test conversion from and back to point dicts."""
+        from engivault.curves import CurveSeries
+
+        points = [{"q": 0.0, "h": 60.0}, {"q": 0.1, "h": 50.0}, {"q": 0.2, "h": 22.0}]
+        curve = CurveSeries.from_points(points)
+
+        assert curve.q.dtype == np.float64
+        assert curve.to_payload() == points
+        assert CurveSeries.from_points([(p["q"], p["h"]) for p in points]).to_payload() == points
+
+    def test_mismatched_lengths(self):
+        """Test that q and h must have equal length."""
+        from engivault.curves import CurveSeries
+
+        with pytest.raises(SDKValidationError):
+            CurveSeries([0.0, 0.1], [60.0])
+
+
+class TestPumpHelpers:
+    """Test local pump sizing helpers."""
+
+    def setup_method(self):
+        """Set up test client."""
+        self.pump_sizing = EngiVault(jwt_token="test-token").equipment_sizing.pump_sizing
+
+    def test_specific_speed(self):
+        """Test specific speed depends on speed and head, for scalars and arrays."""
+        assert self.pump_sizing.calculate_specific_speed(0.1, 50, 1450) == pytest.approx(
+            1450 * 0.1 ** 0.5 / 50 ** 0.75
+        )
+        speeds = self.pump_sizing.calculate_specific_speed(np.array([0.05, 0.1]), 50, 2900)
+        assert speeds.tolist() == pytest.approx([2900 * q ** 0.5 / 50 ** 0.75 for q in (0.05, 0.1)])
+
+    def test_async_variants_share_validation(self):
+        """Test the async pump calls validate like the sync ones and post the same body."""
+        import asyncio
+        from unittest.mock import AsyncMock, patch
+
+        with patch.object(self.pump_sizing.client, "_amake_request", new=AsyncMock(return_value={})) as request:
+            asyncio.run(self.pump_sizing.asize_pump(0.1, 50, 1000, 0.001, 5.0, pump_type="centrifugal"))
+            with pytest.raises(SDKValidationError):
+                asyncio.run(self.pump_sizing.asize_pump(0.1, -50, 1000, 0.001, 5.0))
+
+        request.assert_awaited_once()
+        assert request.await_args[1]["data"]["pumpType"] == "centrifugal"
+
+    def test_efficiency_matches_piecewise_curve(self):
+        """Test efficiency follows the three-segment curve for scalars and arrays."""
+        def piecewise(ns):
+            if ns < 50:
+                return 0.6 + (ns / 50) * 0.2
+            if ns < 150:
+                return 0.8 + ((ns - 50) / 100) * 0.15
+            return 0.95 - ((ns - 150) / 100) * 0.1
+
+        speeds = [0.0, 25.0, 50.0, 100.0, 150.0, 220.0]
+        for ns in speeds:
+            assert self.pump_sizing.calculate_efficiency(ns, 0.1, 50) == pytest.approx(piecewise(ns))
+        assert self.pump_sizing.calculate_efficiency(np.array(speeds), 0.1, 50).tolist() == pytest.approx(
+            [piecewise(ns) for ns in speeds]
+        )
+
+    def test_hydraulic_and_brake_power(self):
+        """Test the fused power helper matches the separate ones over a grid."""
+        flows, heads = np.meshgrid([0.05, 0.1], [20.0, 50.0])
+        hydraulic, brake = self.pump_sizing.calculate_hydraulic_and_brake_power(flows, heads, 1000, 0.75)
+
+        assert hydraulic.shape == brake.shape == (2, 2)
+        assert hydraulic[1, 1] == pytest.approx(self.pump_sizing.calculate_hydraulic_power(0.1, 50.0, 1000))
+        assert brake.ravel().tolist() == pytest.approx((hydraulic / 0.75).ravel().tolist())
+
+    def test_cached_results_are_independent(self):
+        """Test cached selection and analysis results can be modified without affecting later calls."""
+        from unittest.mock import patch
+
+        calls = (
+            lambda: self.pump_sizing.select_pump({"flowRate": 0.1}, cache=True),
+            lambda: self.pump_sizing.analyze_performance_curves({"head": 50}, {"systemHead": 45}, cache=True),
+        )
+        with patch.object(self.pump_sizing.client, "_make_request") as request:
+            for call in calls:
+                request.return_value = {"pumps": [{"model": "A"}, {"model": "B"}]}
+                first = call()
+                first["pumps"].pop()
+                second = call()
+                assert second is not first
+                assert second == {"pumps": [{"model": "A"}, {"model": "B"}]}
+
+        assert request.call_count == 2
+
+
+class TestPumpsModule:
+    """Test request bodies and input checks of pump calculations."""
+
+    def setup_method(self):
+        """Set up test client."""
+        self.client = EngiVault(jwt_token="test-token")
+
+    def test_npsh_body(self):
+        """Test the NPSH request body uses the API's camelCase keys."""
+        from unittest.mock import patch
+
+        result = {"npshAvailable": 9.8, "npshRequired": 3.0, "margin": 6.8, "isCavitationRisk": False}
+        with patch.object(self.client, "_make_request", return_value=result) as request:
+            assert not self.client.pumps.npsh(101325, 2337, 1000, 2.0, 1.5).is_cavitation_risk
+
+        assert request.call_args[1]["data"] == {
+            "suctionPressure": 101325, "vaporPressure": 2337, "fluidDensity": 1000,
+            "suctionVelocity": 2.0, "suctionLosses": 1.5,
+        }
@@ -36,6 +36,13 @@ class TestSimplifiedAPI:
         retrieved = ev.get_client()
         assert retrieved is client
     
+    def test_init_reuses_matching_client(self):
+        """Test repeated init with the same settings keeps the existing client"""
+        client = ev.init('test-key', timeout=30)
+        assert ev.init('test-key', timeout=30) is client
+        assert ev.init('test-key', timeout=60) is not client
+        assert ev.init('other-key', timeout=60) is not ev.init('test-key', timeout=60)
+    
     def test_pressure_drop_shortcut(self, mocker):
         """Test pressure_drop shortcut function"""
         # Initialize client
@@ -177,4 +184,149 @@ class TestErrorHandling:
                 fluid_density=1000,
                 fluid_viscosity=0.001
             )
+    
+    def test_batch_pressure_drop_shortcut(self, mocker):
+        """Test batch_pressure_drop broadcasts scalars and sends one row per point"""
+        ev.init('test-key')
+        
+        mock_batch = mocker.patch.object(
+            ev.get_client(),
+            'batch',
+            return_value=[
+                {'pressureDrop': 1000.0 * i, 'reynoldsNumber': 1e5, 'frictionFactor': 0.02, 'velocity': 1.0}
+                for i in (1, 2)
+            ]
+        )
+        
+        results = ev.batch_pressure_drop(
+            flow_rates=[0.01, 0.02],
+            pipe_diameters=0.1,
+            pipe_lengths=100,
+            fluid_densities=1000,
+            fluid_viscosities=0.001
+        )
+        
+        endpoint, rows = mock_batch.call_args[0]
+        assert endpoint == '/api/v1/hydraulics/pressure-drop'
+        assert [row['flowRate'] for row in rows] == [0.01, 0.02]
+        assert all(row['pipeDiameter'] == 0.1 for row in rows)
+        assert [r.pressure_drop for r in results] == [1000.0, 2000.0]
+    
+    def test_pressure_drop_batch_shortcut(self, mocker):
+        """Test pressure_drop_batch sends all cases in one columnar request"""
+        pytest.importorskip('numpy')
+        ev.init('test-key')
+        
+        mock_request = mocker.patch.object(
+            ev.get_client(),
+            '_make_request',
+            return_value={
+                'pressureDrop': [1000.0, 2000.0],
+                'reynoldsNumber': [1e5, 2e5],
+                'frictionFactor': [0.02, 0.018],
+                'velocity': [1.0, 2.0],
+            }
+        )
+        
+        results = ev.pressure_drop_batch([
+            {'flow_rate': q, 'pipe_diameter': 0.1, 'pipe_length': 100,
+             'fluid_density': 1000, 'fluid_viscosity': 0.001}
+            for q in (0.01, 0.02)
+        ])
+        
+        mock_request.assert_called_once()
+        assert mock_request.call_args[1]['endpoint'] == '/api/v1/hydraulics/pressure-drop/batch'
+        assert mock_request.call_args[1]['data']['flowRate'] == [0.01, 0.02]
+        assert [r.pressure_drop for r in results] == [1000.0, 2000.0]
+        assert results[1].friction_factor == 0.018
+    
+    def test_init_cache_opt_in(self, mocker):
+        """Test init(cache=True) memoizes repeated shortcut calls until clear_cache"""
+        ev.init('test-key', cache=True)
+        ev.clear_cache()
+        
+        mock_request = mocker.patch.object(
+            ev.get_client(),
+            '_make_request',
+            return_value={'pressureDrop': 1000.0, 'reynoldsNumber': 1e5,
+                          'frictionFactor': 0.02, 'velocity': 1.0}
+        )
+        
+        for _ in range(2):
+            ev.pressure_drop(0.01, 0.1, 100, 1000, 0.001)
+        assert mock_request.call_count == 1
+        
+        ev.pressure_drop(0.01, 0.1, 100, 1000, 0.001, cache=False)
+        ev.clear_cache()
+        ev.pressure_drop(0.01, 0.1, 100, 1000, 0.001)
+        assert mock_request.call_count == 3
+        
+        ev.init('test-key')
+        assert ev.shortcuts._cache_results is False
+    
+    def test_init_local_opt_in(self, mocker):
+        """Test init(local=True) computes supported shortcuts without requests"""
+        ev.init('test-key', local=True)
+        mock_request = mocker.patch.object(ev.get_client(), '_make_request')
+        
+        result = ev.pressure_drop(0.01, 0.1, 100, 1000, 0.001)
+        assert result.reynolds_number == pytest.approx(127324, rel=1e-4)
+        assert ev.lmtd(373, 323, 293, 333) == pytest.approx(34.76, rel=1e-3)
+        mock_request.assert_not_called()
+        
+        ev.init('test-key')
+        assert ev.shortcuts._local_results is False
+    
+    def test_init_warmup(self, mocker):
+        """Test init(warmup=True) runs a health check off the calling thread"""
+        import threading
+        
+        checked = threading.Event()
+        
+        def health_check(client):
+            assert threading.current_thread() is not threading.main_thread()
+            checked.set()
+            raise EngiVaultError("offline")
+        
+        mocker.patch.object(ev.EngiVaultClient, 'health_check', health_check)
+        ev.init('test-key', warmup=True)
+        assert checked.wait(5)
+    
+    def test_pressure_drop_stream(self, mocker):
+        """Test streamed results carry their input index, in order when requested"""
+        import time
+        
+        ev.init('test-key')
+        
+        def slow_pressure_drop(flow_rate, **kwargs):
+            time.sleep(0.05 if flow_rate == 0.01 else 0)
+            return flow_rate
+        
+        mocker.patch.object(ev.get_client().hydraulics, 'pressure_drop', side_effect=slow_pressure_drop)
+        cases = [
+            {'flow_rate': q, 'pipe_diameter': 0.1, 'pipe_length': 100,
+             'fluid_density': 1000, 'fluid_viscosity': 0.001}
+            for q in (0.01, 0.02, 0.03)
+        ]
+        
+        streamed = list(ev.pressure_drop_stream(cases))
+        assert streamed[-1] == (0, 0.01)
+        assert sorted(streamed) == [(0, 0.01), (1, 0.02), (2, 0.03)]
+        assert list(ev.pressure_drop_stream(cases, ordered=True)) == [(0, 0.01), (1, 0.02), (2, 0.03)]
+    
+    def test_pool_preserves_order(self):
+        """Test pool returns results in input order and re-raises failures"""
+        import time
+        from functools import partial
+        
+        def delayed(value, delay):
+            time.sleep(delay)
+            return value
+        
+        assert ev.pool(partial(delayed, i, 0.01 * (3 - i)) for i in range(3)) == [0, 1, 2]
+        with pytest.raises(EngiVaultError, match="API Error"):
+            ev.pool([partial(delayed, 0, 0), partial(_raise, EngiVaultError("API Error"))])
+
 
+def _raise(error):
+    raise error
@@ -1,4 +1,5 @@
 import Fastify, { FastifyInstance } from 'fastify';
+import { createGunzip } from 'zlib';
 import { config } from './config/environment';
 import { connectDatabase, disconnectDatabase } from './utils/database';
 import { registerRoutes } from './routes';
@@ -15,6 +16,20 @@ export async function createFastifyInstance(): Promise<FastifyInstance> {
   // Register error handler
   fastify.setErrorHandler(errorHandler);
 
+  // Inflate gzip-compressed request bodies (the SDK compresses large batch
+  // payloads). The body limit applies to the inflated size.
+  fastify.addHook('preParsing', async (request, _reply, payload) => {
+    if (request.headers['content-encoding'] !== 'gzip') {
+      return payload;
+    }
+    const inflated = createGunzip() as ReturnType<typeof createGunzip> & { receivedEncodedLength: number };
+    inflated.receivedEncodedLength = 0;
+    payload.on('data', (chunk: Buffer) => {
+      inflated.receivedEncodedLength += chunk.length;
+    });
+    return payload.pipe(inflated);
+  });
+
   // Register CORS
   await fastify.register(import('@fastify/cors'), {
     origin: true,
@@ -184,10 +184,15 @@ export function calculateEffectivenessNTU(input: EffectivenessNTUInput): Effecti
       break;
       
     case 'crossflow_unmixed':
-      // Approximation for crossflow with both fluids unmixed
-      const ntu1 = Math.pow(ntu, 0.22);
-      const exp_cross = Math.exp(-capacityRatio * ntu1);
-      effectiveness = 1 - Math.exp((exp_cross - 1) / capacityRatio);
+      // Approximation for crossflow with both fluids unmixed:
+      // 1 - exp((NTU^0.22 / Cr) * (exp(-Cr * NTU^0.78) - 1)), whose limit
+      // as Cr goes to zero is 1 - exp(-NTU)
+      if (capacityRatio === 0) {
+        effectiveness = 1 - Math.exp(-ntu);
+      } else {
+        const exp_cross = Math.exp(-capacityRatio * Math.pow(ntu, 0.78));
+        effectiveness = 1 - Math.exp((Math.pow(ntu, 0.22) / capacityRatio) * (exp_cross - 1));
+      }
       break;
       
     default:
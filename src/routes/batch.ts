@@ -0,0 +1,99 @@
+import { FastifyInstance, FastifyRequest, FastifyReply } from 'fastify';
+import { createSuccessResponse, AppError, handleAsync } from '../utils/errorHandler';
+import logger from '../utils/logger';
+
+const BATCH_ENDPOINT = '/api/v1/batch';
+const MAX_BATCH_REQUESTS = 50;
+
+interface BatchRequestItem {
+  path: string;
+  body?: unknown;
+}
+
+export default async function batchRoutes(fastify: FastifyInstance): Promise<void> {
+  // Several calculations in one round trip. Each item is dispatched to its
+  // own route in-process, so it goes through that route's auth, schema and
+  // logic exactly as if it had been sent on its own.
+  fastify.post(BATCH_ENDPOINT, {
+    preHandler: [fastify.authenticate],
+    schema: {
+      tags: ['Batch'],
+      summary: 'Run several calculations in one request',
+      description: 'POST each item body to its path and return every response, in order',
+      body: {
+        type: 'object',
+        required: ['requests'],
+        properties: {
+          requests: {
+            type: 'array',
+            minItems: 1,
+            maxItems: MAX_BATCH_REQUESTS,
+            items: {
+              type: 'object',
+              required: ['path'],
+              properties: {
+                path: { type: 'string' },
+                body: { type: 'object' },
+              },
+            },
+          },
+        },
+      },
+      response: {
+        200: {
+          type: 'object',
+          properties: {
+            success: { type: 'boolean' },
+            data: {
+              type: 'object',
+              properties: {
+                responses: {
+                  type: 'array',
+                  items: {
+                    type: 'object',
+                    properties: {
+                      statusCode: { type: 'number' },
+                      body: { type: 'object', additionalProperties: true },
+                    },
+                  },
+                },
+              },
+            },
+            timestamp: { type: 'string' },
+          },
+        },
+      },
+    },
+  }, handleAsync(async (request: FastifyRequest, reply: FastifyReply) => {
+    const { requests } = request.body as { requests: BatchRequestItem[] };
+    const userId = (request.user as any).userId;
+
+    if (requests.some(item => !item.path.startsWith('/api/v1/') || item.path.startsWith(BATCH_ENDPOINT))) {
+      throw new AppError('Batch paths must be /api/v1/ calculation endpoints', 400);
+    }
+
+    // Items are injected from the caller's address, so each one is charged
+    // to the caller's rate limit rather than to a shared localhost bucket.
+    const responses = await Promise.all(requests.map(async item => {
+      const response = await fastify.inject({
+        method: 'POST',
+        url: item.path,
+        headers: { authorization: request.headers.authorization ?? '' },
+        remoteAddress: request.ip,
+        payload: (item.body ?? {}) as Record<string, unknown>,
+      });
+      let body: unknown;
+      try {
+        body = response.json();
+      } catch {
+        body = { success: false, error: response.body };
+      }
+      return { statusCode: response.statusCode, body };
+    }));
+
+    logger.info({ userId, calculationType: 'batch', count: requests.length }, 'Batch request completed');
+
+    const response = createSuccessResponse({ responses });
+    return reply.send(response);
+  }));
+}
@@ -55,6 +55,76 @@ export default async function calculationRoutes(fastify: FastifyInstance): Promi
     return reply.send(response);
   }));
 
+  // Pressure Drop Calculation (columnar batch)
+  fastify.post('/api/v1/hydraulics/pressure-drop/batch', {
+    preHandler: [fastify.authenticate],
+    schema: {
+      tags: ['Hydraulics'],
+      summary: 'Calculate pressure drop in batch',
+      description: 'Calculate pressure drop for many points; each field is an array with one entry per point',
+      body: {
+        type: 'object',
+        required: ['flowRate', 'pipeDiameter', 'pipeLength', 'fluidDensity', 'fluidViscosity'],
+        properties: {
+          flowRate: { type: 'array', minItems: 1, maxItems: 10000, items: { type: 'number', minimum: 0 } },
+          pipeDiameter: { type: 'array', minItems: 1, maxItems: 10000, items: { type: 'number', minimum: 0 } },
+          pipeLength: { type: 'array', minItems: 1, maxItems: 10000, items: { type: 'number', minimum: 0 } },
+          fluidDensity: { type: 'array', minItems: 1, maxItems: 10000, items: { type: 'number', minimum: 0 } },
+          fluidViscosity: { type: 'array', minItems: 1, maxItems: 10000, items: { type: 'number', minimum: 0 } },
+          pipeRoughness: { type: 'array', minItems: 1, maxItems: 10000, items: { type: 'number', minimum: 0 } },
+        },
+      },
+      response: {
+        200: {
+          type: 'object',
+          properties: {
+            success: { type: 'boolean' },
+            data: {
+              type: 'object',
+              properties: {
+                pressureDrop: { type: 'array', items: { type: 'number' } },
+                reynoldsNumber: { type: 'array', items: { type: 'number' } },
+                frictionFactor: { type: 'array', items: { type: 'number' } },
+                velocity: { type: 'array', items: { type: 'number' } },
+              },
+            },
+            timestamp: { type: 'string' },
+          },
+        },
+      },
+    },
+  }, handleAsync(async (request: FastifyRequest, reply: FastifyReply) => {
+    const body = request.body as Record<string, number[] | undefined>;
+    const userId = (request.user as any).userId;
+    
+    const count = body.flowRate!.length;
+    const columns = ['pipeDiameter', 'pipeLength', 'fluidDensity', 'fluidViscosity', 'pipeRoughness'];
+    if (columns.some(name => body[name] !== undefined && body[name]!.length !== count)) {
+      throw new AppError('All input arrays must have the same length', 400);
+    }
+    
+    const data = { pressureDrop: [] as number[], reynoldsNumber: [] as number[], frictionFactor: [] as number[], velocity: [] as number[] };
+    for (let i = 0; i < count; i++) {
+      const result = calculatePressureDrop(PressureDropSchema.parse({
+        flowRate: body.flowRate![i],
+        pipeDiameter: body.pipeDiameter![i],
+        pipeLength: body.pipeLength![i],
+        fluidDensity: body.fluidDensity![i],
+        fluidViscosity: body.fluidViscosity![i],
+        pipeRoughness: body.pipeRoughness?.[i],
+      }));
+      data.pressureDrop.push(result.pressureDrop);
+      data.reynoldsNumber.push(result.reynoldsNumber);
+      data.frictionFactor.push(result.frictionFactor);
+      data.velocity.push(result.velocity);
+    }
+    
+    logger.info({ userId, calculationType: 'pressure-drop', count }, 'Batch pressure drop calculation completed');
+    
+    const response = createSuccessResponse(data);
+    return reply.send(response);
+  }));
+
   // Pump Performance Calculation
   fastify.post('/api/v1/pumps/performance', {
     preHandler: [fastify.authenticate],
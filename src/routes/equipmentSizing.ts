@@ -908,6 +908,81 @@ export default async function equipmentSizingRoutes(fastify: FastifyInstance): P
     return reply.send(createSuccessResponse(result));
   }));
 
+  // Bulk Vessel Sizing Calculation
+  fastify.post('/api/v1/equipment/vessels/sizing/bulk', {
+    preHandler: [fastify.authenticate],
+    schema: {
+      tags: ['Equipment Sizing'],
+      summary: 'Calculate vessel sizing in bulk',
+      description: 'Size many vessels in one request; each item takes the /api/v1/equipment/vessels/sizing body',
+      body: {
+        type: 'object',
+        required: ['vessels'],
+        properties: {
+          vessels: {
+            type: 'array',
+            minItems: 1,
+            maxItems: 1000,
+            items: {
+              type: 'object',
+              required: ['volume', 'designPressure', 'designTemperature', 'vesselType']
+            },
+            description: 'Vessel sizing requests'
+          }
+        }
+      },
+      response: {
+        200: {
+          type: 'object',
+          properties: {
+            success: { type: 'boolean' },
+            data: {
+              type: 'array',
+              items: {
+                type: 'object',
+                properties: {
+                  diameter: { type: 'number', description: 'Vessel diameter in m' },
+                  length: { type: 'number', description: 'Vessel length in m' },
+                  wallThickness: { type: 'number', description: 'Wall thickness in m' },
+                  weight: { type: 'number', description: 'Vessel weight in kg' },
+                  volume: { type: 'number', description: 'Vessel volume in m³' },
+                  designPressure: { type: 'number', description: 'Design pressure in Pa' },
+                  designTemperature: { type: 'number', description: 'Design temperature in K' },
+                  material: { type: 'string', description: 'Vessel material' },
+                  references: { type: 'array', items: { type: 'string' }, description: 'Calculation references' },
+                  standards: { type: 'array', items: { type: 'string' }, description: 'Applicable standards' },
+                  calculationMethod: { type: 'string', description: 'Calculation method used' }
+                }
+              },
+              description: 'Vessel sizing results, in request order'
+            },
+            timestamp: { type: 'string' }
+          }
+        }
+      }
+    }
+  }, handleAsync(async (request: FastifyRequest, reply: FastifyReply) => {
+    const { vessels } = request.body as { vessels: unknown[] };
+    const inputs = vessels.map(vessel => VesselSizingSchema.parse(vessel));
+    const userId = (request.user as any).userId;
+    
+    logger.info({
+      userId,
+      equipmentType: 'vessel',
+      count: inputs.length
+    }, 'Bulk vessel sizing calculation requested');
+    
+    const results = inputs.map(input => calculateVesselSizing(input));
+    
+    logger.info({
+      userId,
+      equipmentType: 'vessel',
+      count: results.length
+    }, 'Bulk vessel sizing calculation completed');
+    
+    return reply.send(createSuccessResponse(results));
+  }));
+
   // ============================================================================
   // PIPING SIZING ENDPOINTS
   // ============================================================================
@@ -5,6 +5,7 @@ import analyticsRoutes from './analytics';
 import heatTransferRoutes from './heatTransfer';
 import fluidMechanicsRoutes from './fluidMechanics';
 import equipmentSizingRoutes from './equipmentSizing';
+import batchRoutes from './batch';
 
 export async function registerRoutes(fastify: FastifyInstance): Promise<void> {
   // Health check endpoint
@@ -88,4 +89,5 @@ export async function registerRoutes(fastify: FastifyInstance): Promise<void> {
   await fastify.register(heatTransferRoutes);
   await fastify.register(fluidMechanicsRoutes);
   await fastify.register(equipmentSizingRoutes);
+  await fastify.register(batchRoutes);
 }
\ No newline at end of file
@@ -0,0 +1,75 @@
+import Fastify, { FastifyInstance } from 'fastify';
+import { afterEach, beforeEach, describe, expect, it } from 'vitest';
+import batchRoutes from '../src/routes/batch';
+import { errorHandler } from '../src/utils/errorHandler';
+
+const RATE_LIMIT_MAX = 4;
+
+async function buildServer(): Promise<FastifyInstance> {
+  const fastify = Fastify();
+  fastify.setErrorHandler(errorHandler);
+  await fastify.register(import('@fastify/jwt'), { secret: 'test-secret' });
+  await fastify.register(import('@fastify/rate-limit'), { max: RATE_LIMIT_MAX, timeWindow: 60000 });
+  fastify.decorate('authenticate', async function (request: any, reply: any) {
+    try {
+      await request.jwtVerify();
+    } catch (err) {
+      reply.code(401).send({ success: false, error: 'Unauthorized' });
+    }
+  });
+  fastify.post('/api/v1/echo', { preHandler: [fastify.authenticate] }, async request => ({
+    success: true,
+    data: request.body,
+  }));
+  await fastify.register(batchRoutes);
+  return fastify;
+}
+
+describe('POST /api/v1/batch', () => {
+  let fastify: FastifyInstance;
+  let authorization: string;
+
+  const batch = (paths: string[], remoteAddress = '10.0.0.1') =>
+    fastify.inject({
+      method: 'POST',
+      url: '/api/v1/batch',
+      remoteAddress,
+      headers: { authorization },
+      payload: { requests: paths.map((path, i) => ({ path, body: { i } })) },
+    });
+
+  beforeEach(async () => {
+    fastify = await buildServer();
+    authorization = `Bearer ${fastify.jwt.sign({ userId: 'user-1' })}`;
+  });
+
+  afterEach(async () => {
+    await fastify.close();
+  });
+
+  it('returns each item response in request order', async () => {
+    const response = await batch(['/api/v1/echo', '/api/v1/echo']);
+
+    expect(response.statusCode).toBe(200);
+    expect(response.json().data.responses).toEqual([
+      { statusCode: 200, body: { success: true, data: { i: 0 } } },
+      { statusCode: 200, body: { success: true, data: { i: 1 } } },
+    ]);
+  });
+
+  it('rejects nested batches and non-API paths', async () => {
+    expect((await batch(['/api/v1/batch'])).statusCode).toBe(400);
+    expect((await batch(['/health'])).statusCode).toBe(400);
+  });
+
+  it('charges every item to the caller rate limit', async () => {
+    // One batch call plus three items uses up the caller's window...
+    const first = await batch(['/api/v1/echo', '/api/v1/echo', '/api/v1/echo']);
+    expect(first.json().data.responses.map((r: any) => r.statusCode)).toEqual([200, 200, 200]);
+    expect((await batch(['/api/v1/echo'])).statusCode).toBe(429);
+
+    // ...without touching anyone else's
+    const other = await batch(['/api/v1/echo', '/api/v1/echo'], '10.0.0.2');
+    expect(other.json().data.responses.map((r: any) => r.statusCode)).toEqual([200, 200]);
+  });
+});